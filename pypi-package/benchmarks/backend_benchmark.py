@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+渲染后端基准测试
+================
+
+对比 Chromium(pyppeteer)、WeasyPrint 和 HTML 输出的转换耗时
+
+用法:
+    python benchmarks/backend_benchmark.py                    # 使用生成的示例会议纪要
+    python benchmarks/backend_benchmark.py minutes.md -n 5    # 指定文档与重复次数
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.converter import ConverterFactory
+from md2pdf_enterprise.core.converter_base import ConversionTask
+
+
+BACKENDS = ['pdf', 'weasyprint', 'html']
+
+
+def build_sample_document(sections: int) -> str:
+    """生成包含表格和列表的示例会议纪要"""
+    parts = ["# 项目例会会议纪要\n"]
+    for index in range(1, sections + 1):
+        parts.append(f"## {index}. 议题 {index}\n")
+        parts.append("| 模块 | 负责人 | 进展 |\n|---|---|---|\n")
+        parts.extend(f"| 模块{row} | 张三 | 进展顺利 |\n" for row in range(8))
+        parts.append("\n### 行动项目\n\n")
+        parts.extend(f"- 任务 {index}.{item}：完成接口联调\n" for item in range(5))
+        parts.append("\n")
+    return "".join(parts)
+
+
+async def run_backend(backend: str, source: Path, theme: str, runs: int, out_dir: Path):
+    """对单个后端重复转换，返回每次耗时（秒）"""
+    converter = ConverterFactory.create_converter(backend)
+    durations = []
+    # 常驻浏览器，排除Chromium启动开销，只比较排版本身
+    async with converter:
+        for run in range(runs):
+            task = ConversionTask(
+                source=source,
+                target=out_dir / f"{backend}-{run}{converter.output_suffix}",
+                theme=theme
+            )
+            start = time.perf_counter()
+            result = await converter.convert_single(task)
+            if not result.success:
+                raise RuntimeError(result.error_message)
+            durations.append(time.perf_counter() - start)
+    return durations
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory(prefix='md2pdf-bench-') as tmp_dir:
+        out_dir = Path(tmp_dir)
+        if args.input:
+            source = Path(args.input)
+        else:
+            source = out_dir / "sample.md"
+            source.write_text(build_sample_document(args.sections), encoding='utf-8')
+
+        print(f"文档: {source.name}  主题: {args.theme}  重复: {args.runs} 次\n")
+        print(f"{'后端':<12}{'平均(s)':>10}{'最快(s)':>10}{'最慢(s)':>10}")
+        for backend in args.backends:
+            try:
+                durations = await run_backend(backend, source, args.theme, args.runs, out_dir)
+            except Exception as e:
+                print(f"{backend:<12}  跳过: {e}")
+                continue
+            print(
+                f"{backend:<12}{statistics.mean(durations):>10.3f}"
+                f"{min(durations):>10.3f}{max(durations):>10.3f}"
+            )
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='渲染后端基准测试')
+    parser.add_argument('input', nargs='?', help='Markdown 文件（默认生成示例文档）')
+    parser.add_argument('-n', '--runs', type=int, default=3, help='每个后端的重复次数')
+    parser.add_argument('-s', '--sections', type=int, default=20, help='示例文档的章节数')
+    parser.add_argument('-t', '--theme', default='enterprise', help='主题')
+    parser.add_argument('-b', '--backends', nargs='+', choices=BACKENDS, default=BACKENDS)
+    sys.exit(asyncio.run(main_async(parser.parse_args())))
+
+
+if __name__ == '__main__':
+    main()
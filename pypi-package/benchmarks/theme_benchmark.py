@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+打印主题基准测试
+================
+
+对比原始主题、打印变体和压平效果的打印变体的CSS体积、PDF渲染耗时和文件大小
+
+用法:
+    python benchmarks/theme_benchmark.py                    # 使用生成的示例会议纪要
+    python benchmarks/theme_benchmark.py minutes.md -n 5    # 指定文档与重复次数
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.converter import PDFConverter
+from md2pdf_enterprise.core.converter_base import ConversionTask
+
+from backend_benchmark import build_sample_document
+
+
+# 变体名 -> (print_theme, flatten_theme_effects)
+VARIANTS = {
+    'screen': (False, False),
+    'print': (True, False),
+    'print-flat': (True, True),
+}
+
+
+async def run_variant(variant: str, source: Path, theme: str, runs: int, out_dir: Path):
+    """对单个主题变体重复转换，返回 (每次耗时, PDF大小)"""
+    print_theme, flatten = VARIANTS[variant]
+    converter = PDFConverter()
+    converter.config_manager.override(print_theme=print_theme, flatten_theme_effects=flatten)
+    durations = []
+    target = None
+    # 常驻浏览器，排除Chromium启动开销
+    async with converter:
+        for run in range(runs):
+            target = out_dir / f"{variant}-{run}.pdf"
+            task = ConversionTask(source=source, target=target, theme=theme)
+            start = time.perf_counter()
+            result = await converter.convert_single(task)
+            if not result.success:
+                raise RuntimeError(result.error_message)
+            durations.append(time.perf_counter() - start)
+    return durations, target.stat().st_size
+
+
+def css_size(variant: str, theme: str) -> int:
+    """变体CSS的字节数"""
+    print_theme, flatten = VARIANTS[variant]
+    converter = PDFConverter()
+    converter.config_manager.override(print_theme=print_theme, flatten_theme_effects=flatten)
+    return len(converter._theme_css(theme).encode('utf-8'))
+
+
+async def main_async(args: argparse.Namespace) -> int:
+    with tempfile.TemporaryDirectory(prefix='md2pdf-theme-bench-') as tmp_dir:
+        out_dir = Path(tmp_dir)
+        if args.input:
+            source = Path(args.input)
+        else:
+            source = out_dir / "sample.md"
+            source.write_text(build_sample_document(args.sections), encoding='utf-8')
+
+        print(f"文档: {source.name}  主题: {args.theme}  重复: {args.runs} 次\n")
+        print(f"{'变体':<12}{'CSS(B)':>10}{'平均(s)':>10}{'最快(s)':>10}{'PDF(KB)':>10}")
+        for variant in args.variants:
+            css_bytes = css_size(variant, args.theme)
+            try:
+                durations, pdf_size = await run_variant(variant, source, args.theme, args.runs, out_dir)
+            except Exception as e:
+                print(f"{variant:<12}{css_bytes:>10}  跳过渲染: {e}")
+                continue
+            print(
+                f"{variant:<12}{css_bytes:>10}{statistics.mean(durations):>10.3f}"
+                f"{min(durations):>10.3f}{pdf_size / 1024:>10.1f}"
+            )
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='打印主题基准测试')
+    parser.add_argument('input', nargs='?', help='Markdown 文件（默认生成示例文档）')
+    parser.add_argument('-n', '--runs', type=int, default=3, help='每个变体的重复次数')
+    parser.add_argument('-s', '--sections', type=int, default=20, help='示例文档的章节数')
+    parser.add_argument('-t', '--theme', default='enterprise', help='主题')
+    parser.add_argument('-v', '--variants', nargs='+', choices=list(VARIANTS), default=list(VARIANTS))
+    sys.exit(asyncio.run(main_async(parser.parse_args())))
+
+
+if __name__ == '__main__':
+    main()
@@ -8,20 +8,21 @@
 
 import asyncio
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import AsyncIterator, List, Optional, Dict, Any, Tuple
 
-from .core import ConfigManager, ThemeManager
-from .converter import ConverterFactory
-from .utils import FileScanner, DependencyChecker, CLIFormatter
+from .core import ConfigManager, get_theme_manager
+from .converter import ConverterFactory, FrontMatter, read_front_matter
+from .utils import FileScanner, FileWatcher, DependencyChecker, CLIFormatter
 from .core.converter_base import ConversionTask, ConversionResult
 
 
 class MarkdownToPDFApp:
     """Markdown转PDF应用程序主类"""
     
-    def __init__(self, config_file: Optional[str] = None):
+    def __init__(self, config_file: Optional[str] = None, converter_type: str = 'pdf'):
         self.config_manager = ConfigManager(config_file)
-        self.theme_manager = ThemeManager()
+        self.converter_type = converter_type
+        self.theme_manager = get_theme_manager(self.config_manager.get_config().theme_dirs)
         self.file_scanner = FileScanner()
         self.dependency_checker = DependencyChecker()
         self.cli_formatter = CLIFormatter()
@@ -36,7 +37,7 @@ class MarkdownToPDFApp:
         
         # 创建转换器
         self.converter = ConverterFactory.create_converter(
-            converter_type='pdf',
+            converter_type=self.converter_type,
             config_manager=self.config_manager
         )
         
@@ -75,18 +76,21 @@ class MarkdownToPDFApp:
         """扫描Markdown文件"""
         return self.file_scanner.scan_markdown_files(recursive=recursive)
     
+    def list_documents(self, recursive: bool = False) -> List[Tuple[Any, FrontMatter]]:
+        """扫描Markdown文件并读取各自的Front Matter（只读取文件头部）"""
+        return [(info, read_front_matter(info.path)) for info in self.scan_files(recursive)]
+    
     def get_available_themes(self) -> List[str]:
         """获取可用主题"""
         if not self.converter:
-            themes = self.theme_manager.get_available_themes()
-            return [theme.name for theme in themes]
+            return self.theme_manager.get_theme_names()
         return self.converter.get_supported_themes()
     
     def create_conversion_task(
         self, 
         source_file: str, 
         output_file: str = None,
-        theme: str = "github",
+        theme: Optional[str] = None,
         options: Dict[str, Any] = None
     ) -> ConversionTask:
         """创建转换任务"""
@@ -95,7 +99,8 @@ class MarkdownToPDFApp:
         if output_file:
             target_path = Path(output_file)
         else:
-            target_path = source_path.with_suffix('.pdf')
+            suffix = self.converter.output_suffix if self.converter else '.pdf'
+            target_path = source_path.with_suffix(suffix)
         
         return ConversionTask(
             source=source_path,
@@ -108,7 +113,7 @@ class MarkdownToPDFApp:
         self, 
         source_file: str,
         output_file: str = None, 
-        theme: str = "github",
+        theme: Optional[str] = None,
         options: Dict[str, Any] = None
     ) -> ConversionResult:
         """转换单个文件"""
@@ -121,7 +126,7 @@ class MarkdownToPDFApp:
     async def convert_batch(
         self, 
         source_files: List[str],
-        theme: str = "github",
+        theme: Optional[str] = None,
         options: Dict[str, Any] = None
     ) -> List[ConversionResult]:
         """批量转换文件"""
@@ -135,6 +140,39 @@ class MarkdownToPDFApp:
         
         return await self.converter.convert_batch(tasks)
     
+    async def watch(
+        self,
+        directory: str = ".",
+        theme: Optional[str] = None,
+        recursive: bool = True,
+        debounce: float = 0.3,
+        options: Dict[str, Any] = None
+    ) -> AsyncIterator[ConversionResult]:
+        """监视目录，文件保存后只重建内容变化的文件
+
+        监视期间保持同一个转换器和常驻浏览器，避免每次保存都重新启动Chromium。
+        """
+        if not self.converter:
+            raise RuntimeError("应用程序未初始化，请先调用 initialize()")
+        
+        watcher = FileWatcher(
+            FileScanner(Path(directory)),
+            recursive=recursive,
+            debounce=debounce
+        )
+        
+        await self.converter.start()
+        try:
+            async for paths in watcher.changes():
+                tasks = [
+                    self.create_conversion_task(str(path), None, theme, options)
+                    for path in paths
+                ]
+                for result in await self.converter.convert_batch(tasks):
+                    yield result
+        finally:
+            await self.converter.close()
+    
     def get_config(self) -> Dict[str, Any]:
         """获取当前配置"""
         config = self.config_manager.get_config()
@@ -145,7 +183,8 @@ class MarkdownToPDFApp:
             'margins': config.margins,
             'auto_open': config.auto_open,
             'output_dir': config.output_dir,
-            'batch_mode': config.batch_mode
+            'batch_mode': config.batch_mode,
+            'render_profile': config.render_profile
         }
     
     def update_config(self, **kwargs) -> bool:
@@ -170,7 +209,7 @@ def get_app(config_file: Optional[str] = None) -> MarkdownToPDFApp:
 async def convert_file(
     source_file: str,
     output_file: str = None,
-    theme: str = "github",
+    theme: Optional[str] = None,
     options: Dict[str, Any] = None,
     auto_init: bool = True
 ) -> ConversionResult:
@@ -187,7 +226,7 @@ async def convert_file(
 
 async def convert_files(
     source_files: List[str],
-    theme: str = "github", 
+    theme: Optional[str] = None, 
     options: Dict[str, Any] = None,
     auto_init: bool = True
 ) -> List[ConversionResult]:
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Optional
 
 from .app import MarkdownToPDFApp
+from .core.config_manager import RENDER_PROFILES
 from .utils import CLIFormatter
 
 
@@ -27,8 +28,16 @@ def create_parser() -> argparse.ArgumentParser:
   md2pdf document.md                      # 基础转换
   md2pdf document.md -t enterprise        # 使用企业主题
   md2pdf document.md -o output/doc.pdf    # 指定输出路径
+  md2pdf document.md --incremental        # 只重新渲染修改过的章节
+  md2pdf document.md -p draft             # 快速预览
+  md2pdf document.md --thumbnails first   # 同时输出首页缩略图
+  md2pdf document.md --to html            # 输出自包含HTML（无需浏览器）
+  md2pdf document.md --engine weasyprint  # 使用纯Python引擎生成PDF
+  md2pdf summary.md --doc-type work-summary  # 指定文档类型（默认自动识别）
   md2pdf --all -t github                  # 批量转换当前目录
+  md2pdf --list                           # 列出当前目录文档及其元数据
   md2pdf --list-themes                    # 查看所有主题
+  md2pdf watch docs/                      # 监视目录，保存后自动重建
         """
     )
 
@@ -45,8 +54,13 @@ def create_parser() -> argparse.ArgumentParser:
 
     parser.add_argument(
         '-t', '--theme',
-        default='github',
-        help='PDF 主题 (默认: github)'
+        help='PDF 主题 (默认: 文档Front Matter中的theme，其次为配置的主题 github)'
+    )
+
+    parser.add_argument(
+        '-p', '--profile',
+        choices=list(RENDER_PROFILES),
+        help='渲染档位: draft(快速预览) / standard(默认) / print(印刷)'
     )
 
     parser.add_argument(
@@ -55,6 +69,44 @@ def create_parser() -> argparse.ArgumentParser:
         help='转换当前目录所有 .md 文件'
     )
 
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='增量渲染：只重新渲染修改过的章节'
+    )
+
+    parser.add_argument(
+        '--to',
+        choices=['pdf', 'html'],
+        default='pdf',
+        help='输出格式: pdf(默认) / html(自包含HTML，无需浏览器)'
+    )
+
+    parser.add_argument(
+        '--engine',
+        choices=['chromium', 'weasyprint'],
+        default='chromium',
+        help='PDF渲染引擎: chromium(默认) / weasyprint(纯Python，无需浏览器)'
+    )
+
+    parser.add_argument(
+        '--thumbnails',
+        choices=['first', 'all'],
+        help='在PDF旁输出PNG缩略图: first(仅首页) / all(全部页面)'
+    )
+
+    parser.add_argument(
+        '--doc-type',
+        choices=['work-summary', 'meeting-minutes', 'generic'],
+        help='指定文档类型，跳过自动识别'
+    )
+
+    parser.add_argument(
+        '--list',
+        action='store_true',
+        help='列出当前目录的 .md 文件及其 Front Matter（只读取文件头部）'
+    )
+
     parser.add_argument(
         '--list-themes',
         action='store_true',
@@ -70,10 +122,134 @@ def create_parser() -> argparse.ArgumentParser:
     return parser
 
 
+def create_watch_parser() -> argparse.ArgumentParser:
+    """创建 watch 子命令参数解析器"""
+    parser = argparse.ArgumentParser(
+        prog='md2pdf watch',
+        description='监视目录，保存 Markdown 后自动重新生成 PDF',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+示例:
+  md2pdf watch                            # 监视当前目录
+  md2pdf watch docs/ -t enterprise        # 监视 docs 目录
+  md2pdf watch docs/ --incremental        # 只重新渲染修改过的章节
+  md2pdf watch docs/ -p draft             # 以快速预览档位重建
+        """
+    )
+
+    parser.add_argument(
+        'directory',
+        nargs='?',
+        default='.',
+        help='监视的目录 (默认: 当前目录)'
+    )
+
+    parser.add_argument(
+        '-t', '--theme',
+        help='PDF 主题 (默认: 文档Front Matter中的theme，其次为配置的主题 github)'
+    )
+
+    parser.add_argument(
+        '-p', '--profile',
+        choices=list(RENDER_PROFILES),
+        help='渲染档位: draft(快速预览) / standard(默认) / print(印刷)'
+    )
+
+    parser.add_argument(
+        '--debounce',
+        type=float,
+        default=0.3,
+        help='防抖间隔，单位秒 (默认: 0.3)'
+    )
+
+    parser.add_argument(
+        '--no-recursive',
+        action='store_true',
+        help='不监视子目录'
+    )
+
+    parser.add_argument(
+        '--to',
+        choices=['pdf', 'html'],
+        default='pdf',
+        help='输出格式: pdf(默认) / html(自包含HTML，无需浏览器)'
+    )
+
+    parser.add_argument(
+        '--engine',
+        choices=['chromium', 'weasyprint'],
+        default='chromium',
+        help='PDF渲染引擎: chromium(默认) / weasyprint(纯Python，无需浏览器)'
+    )
+
+    parser.add_argument(
+        '--thumbnails',
+        choices=['first', 'all'],
+        help='在PDF旁输出PNG缩略图: first(仅首页) / all(全部页面)'
+    )
+
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='增量渲染：只重新渲染修改过的章节'
+    )
+
+    return parser
+
+
+def resolve_converter_type(args: argparse.Namespace) -> str:
+    """根据 --to 和 --engine 选择转换器类型"""
+    if getattr(args, 'to', 'pdf') == 'html':
+        return 'html'
+    if getattr(args, 'engine', 'chromium') == 'weasyprint':
+        return 'weasyprint'
+    return 'pdf'
+
+
+async def watch_async(args: argparse.Namespace) -> int:
+    """watch 子命令"""
+    app = MarkdownToPDFApp(converter_type=resolve_converter_type(args))
+
+    directory = Path(args.directory)
+    if not directory.is_dir():
+        print(f"✗ 目录不存在: {args.directory}")
+        return 1
+
+    if args.incremental:
+        app.config_manager.override(incremental=True)
+
+    if args.profile:
+        app.config_manager.override(render_profile=args.profile)
+
+    if args.thumbnails:
+        app.config_manager.override(thumbnails=args.thumbnails)
+
+    if not app.initialize():
+        print("✗ 初始化失败，请先运行 md2pdf 检查依赖")
+        return 1
+
+    print(f"👀 监视 {directory.resolve()} (Ctrl+C 退出)")
+
+    async for result in app.watch(
+        str(directory),
+        theme=args.theme,
+        recursive=not args.no_recursive,
+        debounce=args.debounce
+    ):
+        if result.success:
+            size_kb = result.file_size // 1024 if result.file_size else 0
+            duration = f"{result.duration:.2f}s" if result.duration is not None else ""
+            print(f"✓ {result.output_path.name} ({size_kb}KB) {duration}")
+        else:
+            print(f"✗ {result.task.source.name}: {result.error_message}")
+
+    return 0
+
+
 async def main_async(args: argparse.Namespace) -> int:
     """异步主函数"""
     formatter = CLIFormatter()
-    app = MarkdownToPDFApp()
+    app = MarkdownToPDFApp(converter_type=resolve_converter_type(args))
 
     # 列出主题
     if args.list_themes:
@@ -83,6 +259,31 @@ async def main_async(args: argparse.Namespace) -> int:
             print(f"  • {theme}")
         return 0
 
+    # 列出文档（只读取Front Matter，不加载正文）
+    if args.list:
+        documents = app.list_documents()
+        if not documents:
+            print("✗ 未找到 .md 文件")
+            return 1
+        for info, front_matter in documents:
+            metadata = front_matter.metadata
+            details = [
+                f"{key}={metadata[key]}" for key in ('title', 'doc_type', 'theme') if metadata.get(key)
+            ]
+            print(f"  • {info.name} ({info.size_human}) {' '.join(details)}".rstrip())
+        return 0
+
+    if getattr(args, 'incremental', False):
+        app.config_manager.override(incremental=True)
+
+    if getattr(args, 'profile', None):
+        app.config_manager.override(render_profile=args.profile)
+
+    if getattr(args, 'thumbnails', None):
+        app.config_manager.override(thumbnails=args.thumbnails)
+
+    options = {'doc_type': args.doc_type} if getattr(args, 'doc_type', None) else None
+
     # 初始化应用
     if not app.initialize():
         env_check = app.check_environment()
@@ -106,7 +307,8 @@ async def main_async(args: argparse.Namespace) -> int:
 
         results = await app.convert_batch(
             [str(f.path) for f in files],
-            theme=args.theme
+            theme=args.theme,
+            options=options
         )
 
         successful = sum(1 for r in results if r.success)
@@ -132,7 +334,8 @@ async def main_async(args: argparse.Namespace) -> int:
         result = await app.convert_single(
             args.input,
             args.output,
-            theme=args.theme
+            theme=args.theme,
+            options=options
         )
 
         if result.success:
@@ -151,13 +354,21 @@ async def main_async(args: argparse.Namespace) -> int:
 
 def main():
     """CLI 主入口"""
-    parser = create_parser()
-    args = parser.parse_args()
+    argv = sys.argv[1:]
+    watching = bool(argv) and argv[0] == 'watch'
+
+    if watching:
+        args = create_watch_parser().parse_args(argv[1:])
+    else:
+        args = create_parser().parse_args(argv)
 
     try:
-        exit_code = asyncio.run(main_async(args))
+        exit_code = asyncio.run(watch_async(args) if watching else main_async(args))
         sys.exit(exit_code)
     except KeyboardInterrupt:
+        if watching:
+            print("\n✓ 已停止监视")
+            sys.exit(0)
         print("\n✗ 已取消")
         sys.exit(130)
     except Exception as e:
@@ -1,9 +1,19 @@
 """转换器模块"""
 
 from .pdf_converter import PDFConverter
+from .html_converter import HTMLConverter
+from .weasyprint_converter import WeasyPrintConverter
 from .converter_factory import ConverterFactory
+from .document_types import DocumentProcessor, DocumentTypeDetector
+from .front_matter import FrontMatter, read_front_matter
 
 __all__ = [
     "PDFConverter",
+    "HTMLConverter",
+    "WeasyPrintConverter",
     "ConverterFactory",
+    "DocumentProcessor",
+    "DocumentTypeDetector",
+    "FrontMatter",
+    "read_front_matter",
 ]
@@ -10,6 +10,8 @@ from typing import Dict, Type, Optional
 from ..core.converter_base import ConverterBase
 from ..core.config_manager import ConfigManager
 from .pdf_converter import PDFConverter
+from .html_converter import HTMLConverter
+from .weasyprint_converter import WeasyPrintConverter
 
 
 class ConverterFactory:
@@ -17,6 +19,8 @@ class ConverterFactory:
     
     _converters: Dict[str, Type[ConverterBase]] = {
         'pdf': PDFConverter,
+        'html': HTMLConverter,
+        'weasyprint': WeasyPrintConverter,
         'default': PDFConverter
     }
     
@@ -34,7 +38,7 @@ class ConverterFactory:
         converter_class = cls._converters[converter_type]
         
         # 根据转换器类型传递不同参数
-        if converter_type in ['pdf', 'default']:
+        if converter_type in ['pdf', 'html', 'weasyprint', 'default']:
             return converter_class(config_manager=config_manager)
         else:
             return converter_class()
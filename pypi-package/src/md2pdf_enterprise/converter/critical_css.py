@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+关键CSS裁剪 - 按文档内容精简主题
+================================
+
+将主题选择器与HTML中实际出现的标签、class、id比对，只输出可能生效的规则。
+裁剪结果按“文档中出现且被主题引用的标签/class/id集合”缓存，
+结构相同的文档（如同一模板生成的会议纪要）直接复用。
+"""
+
+import re
+from functools import lru_cache
+from typing import FrozenSet, List, Optional, Tuple
+
+from ..core.theme_compiler import (
+    STYLE_WRAPPER,
+    Block,
+    Declaration,
+    Node,
+    parse_css,
+    serialize_css,
+    split_top_level,
+)
+
+
+# 文档模板（_create_html_document）自带的元素，正文中不会出现
+TEMPLATE_TAGS = frozenset({'html', 'head', 'body', 'meta', 'title', 'style'})
+
+# 伪类/伪元素（含参数，如 :not(.x)、:nth-child(2n)、:has(+ *)）——不作为匹配条件
+PSEUDO = re.compile(r'::?[\w-]+(?:\((?:[^()]|\([^()]*\))*\))?')
+ATTRIBUTE = re.compile(r'\[[^\]]*\]')
+COMBINATOR = re.compile(r'\s*[>+~]\s*|\s+')
+COMPOUND = re.compile(r'^(\*|[a-zA-Z][\w-]*)?((?:[.#]-?[_a-zA-Z][\w-]*)*)$')
+SIMPLE = re.compile(r'[.#]-?[_a-zA-Z][\w-]*')
+
+HTML_TAG = re.compile(r'<([a-zA-Z][a-zA-Z0-9-]*)')
+HTML_ATTRIBUTE = re.compile(
+    r'\s(class|id)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s>]+))', re.IGNORECASE
+)
+
+
+def selector_requirements(selector: str) -> Optional[FrozenSet[str]]:
+    """选择器生效所需的标签（小写）、.class 和 #id
+
+    伪类和属性条件一律视为可能满足；无法解析的选择器返回None（始终保留）。
+    """
+    stripped = ATTRIBUTE.sub('', PSEUDO.sub('', selector)).strip()
+    requirements = set()
+    for compound in COMBINATOR.split(stripped):
+        if not compound:
+            continue
+        match = COMPOUND.match(compound)
+        if match is None:
+            return None
+        tag, simples = match.groups()
+        if tag and tag != '*' and tag.lower() not in TEMPLATE_TAGS:
+            requirements.add(tag.lower())
+        requirements.update(SIMPLE.findall(simples))
+    return frozenset(requirements)
+
+
+def document_tokens(html_content: str) -> FrozenSet[str]:
+    """HTML中出现的标签（小写）、.class 和 #id"""
+    tokens = {tag.lower() for tag in HTML_TAG.findall(html_content)}
+    for name, *values in HTML_ATTRIBUTE.findall(html_content):
+        value = next((v for v in values if v), '')
+        if name.lower() == 'class':
+            tokens.update(f'.{cls}' for cls in value.split())
+        elif value:
+            tokens.add(f'#{value}')
+    return frozenset(tokens)
+
+
+class _Rule:
+    """预先计算好各选择器匹配条件的规则"""
+
+    __slots__ = ('block', 'selectors', 'children')
+
+    def __init__(self, block: Block, selectors, children):
+        self.block = block
+        # [(选择器, 匹配条件)]；at规则为None，按子规则决定
+        self.selectors: Optional[List[Tuple[str, Optional[FrozenSet[str]]]]] = selectors
+        self.children: Optional[List] = children
+
+
+def _index(nodes: List[Node]) -> Tuple[List, FrozenSet[str]]:
+    """为规则树预先计算匹配条件，返回 (索引, 主题引用的全部标签/class/id)"""
+    indexed, referenced = [], set()
+    for node in nodes:
+        if isinstance(node, Declaration):
+            indexed.append(node)
+        elif not node.prelude.startswith('@'):
+            selectors = [(s, selector_requirements(s)) for s in split_top_level(node.prelude)]
+            for _, requirements in selectors:
+                referenced.update(requirements or ())
+            indexed.append(_Rule(node, selectors, None))
+        elif any(isinstance(child, Block) and not child.prelude.startswith('@') for child in node.children):
+            # @media 等包含样式规则的at规则：逐条裁剪内部规则
+            children, child_referenced = _index(node.children)
+            referenced.update(child_referenced)
+            indexed.append(_Rule(node, None, children))
+        else:
+            # @page、@font-face 等不依赖文档元素，原样保留
+            indexed.append(node)
+    return indexed, frozenset(referenced)
+
+
+@lru_cache(maxsize=16)
+def _theme_index(css: str) -> Tuple[List, FrozenSet[str]]:
+    return _index(parse_css(css))
+
+
+def _prune(indexed: List, present: FrozenSet[str]) -> List[Node]:
+    result: List[Node] = []
+    for item in indexed:
+        if not isinstance(item, _Rule):
+            result.append(item)
+        elif item.selectors is None:
+            children = _prune(item.children, present)
+            if any(isinstance(child, Block) for child in children):
+                result.append(Block(item.block.prelude, children))
+        else:
+            selectors = [
+                selector for selector, requirements in item.selectors
+                if requirements is None or requirements <= present
+            ]
+            if selectors:
+                result.append(Block(','.join(selectors), item.block.children))
+    return result
+
+
+@lru_cache(maxsize=128)
+def _pruned_css(css: str, signature: FrozenSet[str]) -> str:
+    indexed, _ = _theme_index(css)
+    return serialize_css(_prune(indexed, signature))
+
+
+def prune_theme_css(theme_css: str, html_content: str) -> str:
+    """只保留可能作用于该文档的主题规则
+
+    Args:
+        theme_css: ``<style>`` 包装的主题CSS
+        html_content: 文档正文HTML
+
+    Returns:
+        裁剪后的主题CSS（保持 ``<style>`` 包装）；无法识别的主题原样返回
+    """
+    wrapped = STYLE_WRAPPER.match(theme_css)
+    if wrapped is None:
+        return theme_css
+    css = wrapped.group(1)
+    _, referenced = _theme_index(css)
+    # 只用主题引用到的标签/class/id作为缓存键，正文内容不同但结构相同的文档共享结果
+    signature = document_tokens(html_content) & referenced
+    return f"<style>\n{_pruned_css(css, signature)}\n</style>"
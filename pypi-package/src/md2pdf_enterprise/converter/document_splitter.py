@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+文档分段器 - 大文档拆分
+=======================
+
+按顶层 h1/h2 标题将 HTML 正文拆分为独立章节，供并行渲染后合并
+"""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Set
+from urllib.parse import quote
+
+from bs4 import BeautifulSoup, Tag
+
+
+# 跨章节锚点链接的占位前缀，合并PDF时再替换为文档内跳转
+SECTION_LINK_PREFIX = "https://md2pdf.invalid/anchor/"
+
+DEFAULT_SPLIT_TAGS = ('h1', 'h2')
+
+
+@dataclass
+class DocumentSection:
+    """文档章节数据结构"""
+    index: int
+    html: str
+    title: str = ""
+    level: Optional[str] = None
+    anchor_id: Optional[str] = None
+    ids: Set[str] = field(default_factory=set)
+
+
+def heading_text(heading: Tag) -> str:
+    """提取标题文本，忽略 toc 扩展生成的永久链接符号"""
+    parts = []
+    for text in heading.find_all(string=True):
+        parent = text.parent
+        if parent is not None and 'headerlink' in (parent.get('class') or []):
+            continue
+        parts.append(str(text))
+    return ''.join(parts).strip()
+
+
+def split_html_sections(
+    html_content: str,
+    split_tags: Sequence[str] = DEFAULT_SPLIT_TAGS
+) -> List[DocumentSection]:
+    """按顶层标题拆分HTML正文
+
+    只在顶层节点处拆分，保证表格、列表等块元素不会被截断。
+    指向其他章节的锚点链接会被改写为 ``SECTION_LINK_PREFIX`` 形式，
+    合并阶段再恢复为PDF内部跳转。
+
+    Args:
+        html_content: ``_convert_markdown_to_html`` 生成的HTML正文
+        split_tags: 触发拆分的标题标签
+
+    Returns:
+        章节列表（至少包含一个章节）
+    """
+    soup = BeautifulSoup(html_content, 'html.parser')
+
+    groups: List[List] = [[]]
+    for node in list(soup.contents):
+        starts_section = isinstance(node, Tag) and node.name in split_tags
+        has_content = any(
+            isinstance(item, Tag) or str(item).strip() for item in groups[-1]
+        )
+        if starts_section and has_content:
+            groups.append([])
+        groups[-1].append(node.extract())
+
+    fragments = []
+    for nodes in groups:
+        fragment = BeautifulSoup('', 'html.parser')
+        for node in nodes:
+            fragment.append(node)
+        fragments.append(fragment)
+
+    owners = {}
+    for index, fragment in enumerate(fragments):
+        for elem in fragment.find_all(id=True):
+            owners.setdefault(elem['id'], index)
+
+    inbound: List[Set[str]] = [set() for _ in fragments]
+    for index, fragment in enumerate(fragments):
+        for link in fragment.find_all('a', href=True):
+            href = link['href']
+            if not href.startswith('#'):
+                continue
+            target = href[1:]
+            owner = owners.get(target)
+            if owner is not None and owner != index:
+                link['href'] = SECTION_LINK_PREFIX + quote(target, safe='')
+                inbound[owner].add(target)
+
+    sections = []
+    for index, fragment in enumerate(fragments):
+        # Chromium 只为被链接的元素生成命名目标，这里补充隐藏链接
+        if inbound[index]:
+            holder = fragment.new_tag('div', hidden='hidden')
+            for target in sorted(inbound[index]):
+                holder.append(fragment.new_tag('a', href=f'#{target}'))
+            fragment.append(holder)
+
+        heading = None
+        first = next(
+            (node for node in fragment.contents if isinstance(node, Tag)), None
+        )
+        if first is not None and first.name in split_tags:
+            heading = first
+
+        sections.append(DocumentSection(
+            index=index,
+            html=str(fragment),
+            title=heading_text(heading) if heading else "",
+            level=heading.name if heading else None,
+            anchor_id=heading.get('id') if heading else None,
+            ids={target for target, owner in owners.items() if owner == index}
+        ))
+
+    return sections
+
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+文档类型识别 - 转换前预处理
+===========================
+
+所有文档类型的特征合并为一个交替正则，单遍扫描原文，
+得分足以确定结果时提前结束；识别出的类型交给对应的预处理插件
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Pattern, Tuple
+
+
+GENERIC = 'generic'
+
+# 文档类型 -> 必须特征 / 建议特征（正则，按行匹配）
+DOCUMENT_FEATURES: Dict[str, Dict[str, List[str]]] = {
+    'work-summary': {
+        'must_have': [
+            r'年度成果概览',
+            r'姓名：',
+        ],
+        'should_have': [
+            r'^## [一二三四五六七八]、',
+            r'工作总结',
+            r'版本发布',
+        ],
+    },
+    'meeting-minutes': {
+        'must_have': [
+            r'参会人员',
+            r'会议时间',
+        ],
+        'should_have': [
+            r'会议纪要',
+            r'决策事项',
+            r'行动计划',
+        ],
+    },
+}
+
+MUST_HAVE_WEIGHT = 3
+SHOULD_HAVE_WEIGHT = 1
+# 最高得分达到该值才采用识别结果，否则视为通用文档
+CONFIDENCE_THRESHOLD = 3
+
+
+@dataclass(frozen=True)
+class DocumentFeature:
+    """单个文档特征"""
+    doc_type: str
+    pattern: str
+    weight: int
+
+
+def _compile_features(features: Dict[str, Dict[str, List[str]]]) -> Tuple[DocumentFeature, ...]:
+    compiled = []
+    for doc_type, groups in features.items():
+        compiled += [DocumentFeature(doc_type, p, MUST_HAVE_WEIGHT) for p in groups.get('must_have', [])]
+        compiled += [DocumentFeature(doc_type, p, SHOULD_HAVE_WEIGHT) for p in groups.get('should_have', [])]
+    return tuple(compiled)
+
+
+class DocumentTypeDetector:
+    """文档类型识别器
+
+    所有特征合并为一个交替正则，从前往后单遍扫描原文：每命中一个特征就计分，
+    并把它从交替正则中去掉，从命中位置继续查找其余特征（同一位置开始的多个特征都会计分）。
+    识别结果确定后立即停止，不再扫描剩余部分。
+
+    扫描用的交替正则不带分组：CPython 的正则引擎只对不含捕获分组、
+    不以行首断言开头的分支做首字符快速跳过，因此行首特征 ``^`` 改写为匹配换行符
+    （在原文前补一个换行）；命中后再用带命名分组（``(?P<f0>...)|(?P<f1>...)``）
+    的同一交替正则在命中位置确定是哪个特征。
+    """
+
+    def __init__(
+        self,
+        features: Optional[Dict[str, Dict[str, List[str]]]] = None,
+        threshold: int = CONFIDENCE_THRESHOLD
+    ):
+        self.features = _compile_features(features or DOCUMENT_FEATURES)
+        self.doc_types = tuple(dict.fromkeys(feature.doc_type for feature in self.features))
+        self.threshold = threshold
+        self._patterns = tuple(
+            '\n' + feature.pattern[1:] if feature.pattern.startswith('^') else feature.pattern
+            for feature in self.features
+        )
+        # 剩余特征集合 -> (扫描正则, 识别正则)
+        self._scanners: Dict[FrozenSet[int], Tuple[Pattern, Pattern]] = {}
+        self._scanner(frozenset(range(len(self.features))))
+
+    def _scanner(self, remaining: FrozenSet[int]) -> Tuple[Pattern, Pattern]:
+        """剩余特征合并后的交替正则（每种组合只编译一次）"""
+        scanner = self._scanners.get(remaining)
+        if scanner is None:
+            indexes = sorted(remaining)
+            scanner = (
+                re.compile('|'.join(f'(?:{self._patterns[i]})' for i in indexes), re.MULTILINE),
+                re.compile('|'.join(f'(?P<f{i}>{self._patterns[i]})' for i in indexes), re.MULTILINE),
+            )
+            self._scanners[remaining] = scanner
+        return scanner
+
+    def scores(self, content: str, early_exit: bool = False) -> Dict[str, int]:
+        """计算各文档类型的特征得分
+
+        Args:
+            content: Markdown原文
+            early_exit: 识别结果已确定时停止扫描（此时得分不完整）
+        """
+        scores = {doc_type: 0 for doc_type in self.doc_types}
+        pending = {doc_type: 0 for doc_type in self.doc_types}
+        for feature in self.features:
+            pending[feature.doc_type] += feature.weight
+
+        # 行首特征改写为匹配换行符，原文开头补一个换行
+        content = '\n' + content
+        remaining = frozenset(range(len(self.features)))
+        position = 0
+        while remaining:
+            if early_exit and self._decided(scores, pending):
+                break
+            scan, identify = self._scanner(remaining)
+            match = scan.search(content, position)
+            if match is None:
+                break
+            position = match.start()
+            index = int(identify.match(content, position).lastgroup[1:])
+            feature = self.features[index]
+            scores[feature.doc_type] += feature.weight
+            pending[feature.doc_type] -= feature.weight
+            remaining -= {index}
+
+        return scores
+
+    def detect(self, content: str) -> str:
+        """识别文档类型
+
+        Returns:
+            文档类型名（如 'work-summary' / 'meeting-minutes'），置信度不足时为 'generic'
+        """
+        return self._decide(self.scores(content, early_exit=True))
+
+    def _decide(self, scores: Dict[str, int]) -> str:
+        """取得分最高的类型（同分时取先声明的类型）"""
+        best = max(self.doc_types, key=lambda doc_type: scores[doc_type])
+        return best if scores[best] >= self.threshold else GENERIC
+
+    def _decided(self, scores: Dict[str, int], pending: Dict[str, int]) -> bool:
+        """剩余特征无论是否出现都不会改变识别结果"""
+        best = self._decide(scores)
+        if best == GENERIC:
+            # 任何类型都已不可能达到阈值
+            return all(scores[t] + pending[t] < self.threshold for t in self.doc_types)
+
+        rank = self.doc_types.index(best)
+        for order, doc_type in enumerate(self.doc_types):
+            if doc_type == best:
+                continue
+            ceiling = scores[doc_type] + pending[doc_type]
+            if ceiling > scores[best] or (ceiling == scores[best] and order < rank):
+                return False
+        return True
+
+
+class DocumentProcessor:
+    """文档预处理插件
+
+    在Markdown解析之前改写原文。子类设置 ``doc_type`` 并实现 ``process``，
+    通过 ``PDFConverter.register_processor`` 注册。
+    """
+
+    doc_type: str = GENERIC
+
+    def process(self, content: str, metadata: Dict) -> str:
+        """处理Markdown原文
+
+        Args:
+            content: Markdown原文
+            metadata: 文档元数据（如YAML Front Matter）
+        """
+        return content
+
+
+class WorkSummaryProcessor(DocumentProcessor):
+    """工作总结文档处理：修复中文章节锚点、大章节前分页、简化表格数量列"""
+
+    doc_type = 'work-summary'
+
+    ANCHOR_PATTERN = re.compile(r'\(#([一二三四五六七八])([^\)、]+)\)')
+    CHAPTER_PATTERN = re.compile(r'^## [一二三四五六七八]、')
+    COUNT_PATTERN = re.compile(r'(\| \d+)[个项次]( \|)')
+    PAGE_BREAK = '<div style="page-break-before: always;"></div>'
+
+    def process(self, content: str, metadata: Dict) -> str:
+        content = self._fix_anchor_links(content)
+        content = self._ensure_page_breaks(content)
+        return self._optimize_tables(content)
+
+    def _fix_anchor_links(self, content: str) -> str:
+        """修复中文章节锚点链接：#一版本发布 → #一、版本发布"""
+        return self.ANCHOR_PATTERN.sub(r'(#\1、\2)', content)
+
+    def _ensure_page_breaks(self, content: str) -> str:
+        """在目录和大章节前添加分页标记（已有分页时跳过）"""
+        lines = content.split('\n')
+        result = []
+
+        for i, line in enumerate(lines):
+            if line.startswith('## 目录') or self.CHAPTER_PATTERN.match(line):
+                if i > 0 and not lines[i - 1].strip().startswith('<div style="page-break'):
+                    result.append(self.PAGE_BREAK)
+                    result.append('')
+            result.append(line)
+
+        return '\n'.join(result)
+
+    def _optimize_tables(self, content: str) -> str:
+        """简化表格数量列：4个→4, 3项→3, 5次→5"""
+        return self.COUNT_PATTERN.sub(r'\1\2', content)
+
+
+class MeetingMinutesProcessor(DocumentProcessor):
+    """会议纪要文档处理：保持原有格式（章节语义类在HTML阶段标注）"""
+
+    doc_type = 'meeting-minutes'
+
+
+def default_processors() -> Dict[str, DocumentProcessor]:
+    """内置的预处理插件"""
+    return {
+        processor.doc_type: processor
+        for processor in (WorkSummaryProcessor(), MeetingMinutesProcessor())
+    }
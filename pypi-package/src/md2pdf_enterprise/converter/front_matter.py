@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+YAML Front Matter - 只读取文档头部
+==================================
+
+逐行读取文件开头 ``---`` 包围的元数据块，记录正文在文件中的字节偏移。
+列出文档、选择主题和文档类型只需要头部，不会读取（和解码）正文；
+转换时从偏移处继续读取正文，不再对整篇内容做正则匹配和切片复制。
+"""
+
+import io
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterable, Tuple, Union
+
+
+DELIMITER = b'---'
+UTF8_BOM = b'\xef\xbb\xbf'
+# 头部超过该大小仍未闭合时视为普通Markdown（避免为一条分隔线读完整个文件）
+MAX_FRONT_MATTER_BYTES = 64 * 1024
+
+
+@dataclass
+class FrontMatter:
+    """文档头部元数据"""
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    # 正文在文件中的字节偏移（没有Front Matter时为0）
+    body_offset: int = 0
+
+    @property
+    def present(self) -> bool:
+        """文档是否带有Front Matter"""
+        return self.body_offset > 0
+
+
+def parse_front_matter_lines(lines: Iterable[str]) -> Dict[str, Any]:
+    """解析Front Matter中的 ``key: value`` 行
+
+    只支持单层键值（不依赖yaml库）：值两侧的引号会被去掉，
+    true/yes 和 false/no 转为布尔值，以 ``#`` 开头的行视为注释。
+    """
+    metadata = {}
+    for line in lines:
+        line = line.strip()
+        if ':' in line and not line.startswith('#'):
+            key, value = line.split(':', 1)
+            value = value.strip().strip('"\'')
+
+            if value.lower() in ('true', 'yes'):
+                value = True
+            elif value.lower() in ('false', 'no'):
+                value = False
+
+            metadata[key.strip()] = value
+    return metadata
+
+
+def _read_header(f) -> FrontMatter:
+    """从二进制文件开头读取Front Matter，文件位置停在正文开头"""
+    first = f.readline(MAX_FRONT_MATTER_BYTES)
+    if first.lstrip(UTF8_BOM).rstrip() != DELIMITER:
+        f.seek(0)
+        return FrontMatter()
+
+    lines = []
+    size = len(first)
+    while size < MAX_FRONT_MATTER_BYTES:
+        line = f.readline(MAX_FRONT_MATTER_BYTES - size)
+        if not line:
+            break
+        size += len(line)
+        if line.rstrip() == DELIMITER:
+            text = b''.join(lines).decode('utf-8')
+            return FrontMatter(parse_front_matter_lines(text.splitlines()), size)
+        lines.append(line)
+
+    # 没有闭合分隔线：整篇都是正文
+    f.seek(0)
+    return FrontMatter()
+
+
+def read_front_matter(path: Union[str, Path]) -> FrontMatter:
+    """只读取文档头部的Front Matter"""
+    with open(path, 'rb') as f:
+        return _read_header(f)
+
+
+def read_document(path: Union[str, Path]) -> Tuple[FrontMatter, str]:
+    """读取Front Matter和正文
+
+    同一个文件句柄读完头部后直接从正文偏移处解码，
+    返回的正文不包含Front Matter。
+
+    Returns:
+        (Front Matter, Markdown正文)
+    """
+    with open(path, 'rb') as f:
+        front_matter = _read_header(f)
+        # 与文本模式读取一致：UTF-8解码并统一换行符
+        with io.TextIOWrapper(f, encoding='utf-8') as text:
+            return front_matter, text.read()
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+HTML转换器 - 无浏览器输出
+=========================
+
+复用Markdown处理流程和主题CSS，直接输出自包含的HTML文件，
+不启动Chromium，适用于内网预览和文档比对
+"""
+
+import base64
+import mimetypes
+from pathlib import Path
+from typing import List
+from urllib.parse import unquote, urlparse
+
+from bs4 import BeautifulSoup
+
+from ..core.converter_base import ConversionTask, ConversionResult
+from .pdf_converter import PDFConverter
+
+
+class HTMLConverter(PDFConverter):
+    """HTML转换器实现
+
+    与 ``PDFConverter`` 共享Markdown解析、语义类标注和HTML文档模板，
+    只替换最后的输出步骤。
+    """
+
+    output_suffix = ".html"
+
+    async def start(self):
+        """无需浏览器，不做预热"""
+        pass
+
+    async def close(self):
+        """无需浏览器，无资源释放"""
+        pass
+
+    async def convert_batch(self, tasks: List[ConversionTask], max_concurrent: int = 3) -> List[ConversionResult]:
+        """批量转换文件
+
+        转换过程完全是CPU计算，不存在需要并发等待的IO，
+        按顺序执行即可，吞吐量只取决于解析速度。
+        """
+        return [await self.convert_single(task) for task in tasks]
+
+    async def _write_output(self, html_content: str, title: str, theme_css: str, task: ConversionTask):
+        """写出自包含的HTML文件"""
+        html_content = self._inline_local_images(html_content, task.source.parent)
+        document = self._create_html_document(html_content, title, theme_css)
+        task.target.write_text(document, encoding='utf-8')
+
+    def _theme_css(self, theme: str) -> str:
+        """HTML用于屏幕浏览，保留完整主题（悬停效果等）"""
+        return self.theme_manager.get_theme_css(theme)
+
+    def _thumbnail_mode(self) -> str:
+        """HTML输出不生成缩略图"""
+        return 'none'
+
+    @staticmethod
+    def _inline_local_images(html_content: str, base_dir: Path) -> str:
+        """将本地图片内嵌为data URI，输出文件可以脱离源目录单独分发"""
+        soup = BeautifulSoup(html_content, 'html.parser')
+
+        for img in soup.find_all('img', src=True):
+            parsed = urlparse(img['src'])
+            if parsed.scheme not in ('', 'file'):
+                continue  # 远程图片和data URI保持原样
+
+            image_path = Path(unquote(parsed.path))
+            if not image_path.is_absolute():
+                image_path = base_dir / image_path
+            if not image_path.is_file():
+                continue
+
+            mime_type = mimetypes.guess_type(image_path.name)[0] or 'application/octet-stream'
+            encoded = base64.b64encode(image_path.read_bytes()).decode('ascii')
+            img['src'] = f"data:{mime_type};base64,{encoded}"
+
+        return str(soup)
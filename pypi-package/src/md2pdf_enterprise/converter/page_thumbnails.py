@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+页面缩略图 - PDF预览图输出
+=========================
+
+在生成PDF的同一页面上截取分页预览图（首页或全部页面），
+缩略图保存在PDF旁边: ``<name>.page-001.png``
+"""
+
+import re
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+
+THUMBNAIL_MODES = ('none', 'first', 'all')
+
+# 常用纸张尺寸（毫米）
+PAGE_SIZES_MM: Dict[str, Tuple[float, float]] = {
+    'a3': (297, 420),
+    'a4': (210, 297),
+    'a5': (148, 210),
+    'letter': (215.9, 279.4),
+    'legal': (215.9, 355.6),
+    'tabloid': (279.4, 431.8),
+}
+
+# CSS长度单位到像素（96dpi）的换算
+_CSS_UNITS = {
+    'px': 1.0,
+    'in': 96.0,
+    'cm': 96.0 / 2.54,
+    'mm': 96.0 / 25.4,
+    'pt': 96.0 / 72.0,
+}
+
+_LENGTH_PATTERN = re.compile(r'^\s*([\d.]+)\s*([a-z]*)\s*$')
+
+
+def css_length_to_px(value) -> float:
+    """将CSS长度（如 ``20mm``、``1in``）换算为像素，无法识别时返回0"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = _LENGTH_PATTERN.match(str(value).lower())
+    if not match:
+        return 0.0
+    number, unit = match.groups()
+    return float(number) * _CSS_UNITS.get(unit or 'px', 0.0)
+
+
+def page_content_box(page_format: str, margins: Dict[str, str]) -> Tuple[int, int]:
+    """计算纸张去除页边距后的内容区尺寸（像素）"""
+    width_mm, height_mm = PAGE_SIZES_MM.get(str(page_format).lower(), PAGE_SIZES_MM['a4'])
+    margins = margins or {}
+    width = width_mm * _CSS_UNITS['mm'] - css_length_to_px(margins.get('left', 0)) \
+        - css_length_to_px(margins.get('right', 0))
+    height = height_mm * _CSS_UNITS['mm'] - css_length_to_px(margins.get('top', 0)) \
+        - css_length_to_px(margins.get('bottom', 0))
+    return max(1, int(width)), max(1, int(height))
+
+
+def thumbnail_path(output_path: Path, page_number: int) -> Path:
+    """获取第 ``page_number`` 页（从1开始）缩略图路径"""
+    output_path = Path(output_path)
+    return output_path.with_name(f"{output_path.stem}.page-{page_number:03d}.png")
+
+
+def find_thumbnails(output_path: Path) -> List[Path]:
+    """查找PDF旁已生成的缩略图（按页码排序）"""
+    output_path = Path(output_path)
+    return sorted(output_path.parent.glob(f"{output_path.stem}.page-[0-9][0-9][0-9].png"))
+
+
+def write_thumbnails(output_path: Path, images: Sequence[bytes]) -> List[Path]:
+    """将PNG数据写到PDF旁边，并清理上一次构建多出的页面
+
+    Returns:
+        写入的缩略图路径列表
+    """
+    written = []
+    for page_number, image in enumerate(images, 1):
+        path = thumbnail_path(output_path, page_number)
+        path.write_bytes(image)
+        written.append(path)
+
+    for stale in find_thumbnails(output_path)[len(written):]:
+        stale.unlink()
+
+    return written
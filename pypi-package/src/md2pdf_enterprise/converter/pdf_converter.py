@@ -7,19 +7,23 @@ PDF转换器 - 具体实现
 """
 
 import asyncio
+import math
 import os
 import re
 import shutil
 import sys
+import tempfile
 import markdown
+from contextlib import asynccontextmanager
+from dataclasses import asdict
 from pathlib import Path
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime
 from pyppeteer import launch
 from bs4 import BeautifulSoup
 
 from ..core.converter_base import ConverterBase, ConversionTask, ConversionResult, ConversionStatus
-from ..core.theme_manager import ThemeManager
+from ..core.theme_manager import get_theme_manager
 from ..core.config_manager import ConfigManager
 from ..core.exceptions import (
     BrowserNotFoundError,
@@ -31,6 +35,52 @@ from ..core.exceptions import (
     ConfigurationError,
     FileNotFoundError as MD2PDFFileNotFoundError
 )
+from .critical_css import prune_theme_css
+from .document_splitter import split_html_sections
+from .document_types import DocumentProcessor, DocumentTypeDetector, default_processors
+from .front_matter import read_document
+from .page_thumbnails import THUMBNAIL_MODES, find_thumbnails, page_content_box, write_thumbnails
+from .pdf_merger import merge_section_pdfs
+from .section_cache import SectionCache
+
+
+# 等待所有图片与Web字体加载完成（加载失败的图片同样视为完成），超时后直接返回
+WAIT_FOR_RESOURCES_JS = '''
+    (timeoutMs) => Promise.race([
+        Promise.all([
+            ...Array.from(document.images).map(img => {
+                if (img.complete) return Promise.resolve();
+                return new Promise(resolve => {
+                    img.onload = resolve;
+                    img.onerror = resolve;
+                });
+            }),
+            document.fonts ? document.fonts.ready : Promise.resolve()
+        ]).then(() => true),
+        new Promise(resolve => setTimeout(() => resolve(false), timeoutMs))
+    ])
+'''
+
+# 预处理阶段读取的任务选项（文档类型、文档元数据）
+PREPROCESS_OPTIONS = ('doc_type', 'metadata')
+
+# 将超过指定宽度的已加载图片重采样为JPEG，减小栅格化和PDF体积
+DOWNSAMPLE_IMAGES_JS = '''
+    (maxWidth) => Promise.all(Array.from(document.images).map(img => {
+        if (!img.complete || img.naturalWidth <= maxWidth) return Promise.resolve();
+        try {
+            const canvas = document.createElement('canvas');
+            canvas.width = maxWidth;
+            canvas.height = Math.round(img.naturalHeight * maxWidth / img.naturalWidth);
+            canvas.getContext('2d').drawImage(img, 0, 0, canvas.width, canvas.height);
+            img.src = canvas.toDataURL('image/jpeg', 0.7);
+            return img.decode().catch(() => null);
+        } catch (e) {
+            // 跨域图片无法重采样，保持原样
+            return Promise.resolve();
+        }
+    }))
+'''
 
 
 class PDFConverter(ConverterBase):
@@ -38,7 +88,27 @@ class PDFConverter(ConverterBase):
     
     def __init__(self, config_manager: Optional[ConfigManager] = None):
         self.config_manager = config_manager or ConfigManager()
-        self.theme_manager = ThemeManager()
+        self.theme_manager = get_theme_manager(self.config_manager.get_config().theme_dirs)
+        # 常驻浏览器（watch模式等长时间运行场景），为None时每次转换临时启动
+        self._browser = None
+        # 预处理阶段：文档类型识别 + 按类型注册的处理插件
+        self.document_detector = DocumentTypeDetector()
+        self.processors: Dict[str, DocumentProcessor] = default_processors()
+
+    def register_processor(self, processor: DocumentProcessor):
+        """注册文档预处理插件（同一文档类型只保留最后注册的插件）"""
+        self.processors[processor.doc_type] = processor
+
+    async def start(self):
+        """启动常驻浏览器，后续转换复用同一个浏览器进程"""
+        if self._browser is None or not self._browser_alive(self._browser):
+            self._browser = await self._launch_browser()
+
+    async def close(self):
+        """关闭常驻浏览器"""
+        browser, self._browser = self._browser, None
+        if browser is not None:
+            await browser.close()
         
     async def convert_single(self, task: ConversionTask) -> ConversionResult:
         """转换单个文件"""
@@ -50,21 +120,23 @@ class PDFConverter(ConverterBase):
             if not self.validate_task(task):
                 raise ValueError("任务验证失败")
             
-            # 读取Markdown内容
-            with open(task.source, 'r', encoding='utf-8') as f:
-                markdown_content = f.read()
+            # 读取Front Matter和Markdown正文
+            front_matter, markdown_content = read_document(task.source)
+            self._resolve_theme(task, front_matter.metadata)
+            
+            # 预处理（文档类型识别与插件）
+            markdown_content, doc_type = self._preprocess(markdown_content, task, front_matter.metadata)
             
             # 转换为HTML
             html_content = self._convert_markdown_to_html(markdown_content)
             
-            # 获取主题CSS
-            theme_css = self.theme_manager.get_theme_css(task.theme)
-            
-            # 创建完整HTML
-            full_html = self._create_html_document(html_content, task.source.stem, theme_css)
+            # 获取主题CSS，并裁剪掉与本文档无关的规则
+            theme_css = self._theme_css(task.theme)
+            if self.config_manager.get_config().prune_theme_css:
+                theme_css = prune_theme_css(theme_css, html_content)
             
-            # 转换为PDF
-            await self._convert_html_to_pdf(full_html, task.target, task.options)
+            # 输出目标文件
+            await self._write_output(html_content, task.source.stem, theme_css, task)
             
             task.status = ConversionStatus.COMPLETED
             task.end_time = datetime.now()
@@ -72,13 +144,16 @@ class PDFConverter(ConverterBase):
             # 计算文件大小
             file_size = task.target.stat().st_size if task.target.exists() else None
             duration = (task.end_time - task.start_time).total_seconds()
+            thumbnails = find_thumbnails(task.target) if self._thumbnail_mode() != 'none' else []
             
             return ConversionResult(
                 task=task,
                 success=True,
                 output_path=task.target,
                 duration=duration,
-                file_size=file_size
+                file_size=file_size,
+                thumbnails=thumbnails,
+                doc_type=doc_type
             )
             
         except Exception as e:
@@ -137,10 +212,66 @@ class PDFConverter(ConverterBase):
 
         return processed_results
     
+    async def _write_output(self, html_content: str, title: str, theme_css: str, task: ConversionTask):
+        """将HTML正文渲染为PDF"""
+        if self.config_manager.get_config().incremental:
+            # 增量模式：只重新渲染发生变化的章节
+            await self._convert_sections_incremental(
+                html_content, title, theme_css, task.target, task.options
+            )
+        elif self._should_split(html_content):
+            # 大文档按章节并行渲染后合并
+            await self._convert_sections_to_pdf(
+                html_content, title, theme_css, task.target, task.options
+            )
+        else:
+            # 创建完整HTML
+            full_html = self._create_html_document(html_content, title, theme_css)
+            
+            # 转换为PDF
+            await self._convert_html_to_pdf(full_html, task.target, task.options)
+    
+    def _theme_css(self, theme: str) -> str:
+        """输出使用的主题CSS（默认为缓存的打印变体）"""
+        config = self.config_manager.get_config()
+        if not config.print_theme:
+            return self.theme_manager.get_theme_css(theme)
+        return self.theme_manager.get_print_theme_css(theme, config.flatten_theme_effects)
+
+    def _resolve_theme(self, task: ConversionTask, metadata: Dict):
+        """未指定主题的任务依次使用Front Matter中的theme和配置的默认主题"""
+        if task.theme is None:
+            task.theme = metadata.get('theme') or self.config_manager.get_config().theme
+            if not self.theme_manager.has_theme(task.theme):
+                raise ThemeNotFoundError(task.theme)
+
+    def _preprocess(self, markdown_content: str, task: ConversionTask, front_matter: Optional[Dict] = None):
+        """识别文档类型并应用对应插件
+
+        文档类型依次取 ``task.options['doc_type']``、Front Matter中的doc_type，
+        都没有时自动识别；插件收到的元数据为Front Matter与
+        ``task.options['metadata']`` 合并的结果（任务选项优先）。
+
+        Returns:
+            (处理后的Markdown, 文档类型)，关闭预处理时类型为None
+        """
+        if not self.config_manager.get_config().document_processing:
+            return markdown_content, None
+
+        metadata = {**(front_matter or {}), **(task.options.get('metadata') or {})}
+        doc_type = (
+            task.options.get('doc_type')
+            or metadata.get('doc_type')
+            or self.document_detector.detect(markdown_content)
+        )
+        processor = self.processors.get(doc_type)
+        if processor is not None:
+            markdown_content = processor.process(markdown_content, metadata)
+        return markdown_content, doc_type
+
     def get_supported_themes(self) -> List[str]:
         """获取支持的主题列表"""
-        themes = self.theme_manager.get_available_themes()
-        return [theme.name for theme in themes]
+        return self.theme_manager.get_theme_names()
     
     def validate_task(self, task: ConversionTask) -> bool:
         """验证转换任务"""
@@ -151,8 +282,8 @@ class PDFConverter(ConverterBase):
         if not task.source.suffix.lower() == '.md':
             raise InvalidFileFormatError(str(task.source), ".md")
 
-        # 检查主题
-        if task.theme not in self.get_supported_themes():
+        # 检查主题（未指定时读取文档后再确定）
+        if task.theme is not None and not self.theme_manager.has_theme(task.theme):
             raise ThemeNotFoundError(task.theme)
 
         # 检查目标目录
@@ -404,22 +535,247 @@ class PDFConverter(ConverterBase):
 </html>"""
     
     async def _convert_html_to_pdf(self, html_content: str, output_path: Path, options: dict):
-        """将HTML转换为PDF"""
+        """将HTML转换为PDF，启用缩略图时在同一页面上截图"""
+        pdf_options = self._build_pdf_options(options)
+        thumbnails = self._thumbnail_mode()
+
+        async with self._browser_session() as browser:
+            images = await self._render_page(
+                browser, html_content, output_path, pdf_options, thumbnails=thumbnails
+            )
+
+        if thumbnails != 'none':
+            self._write_thumbnails(output_path, images)
+
+    def _thumbnail_mode(self) -> str:
+        """获取并校验缩略图模式"""
+        mode = self.config_manager.get_config().thumbnails or 'none'
+        if mode not in THUMBNAIL_MODES:
+            raise ConfigurationError(
+                f"未知的缩略图模式 {mode}，可选: {', '.join(THUMBNAIL_MODES)}"
+            )
+        return mode
+
+    def _write_thumbnails(self, output_path: Path, images: List[bytes]) -> List[Path]:
+        """在PDF旁写入缩略图，页数受渲染档位的页数限制约束"""
+        page_limit = self.config_manager.get_render_profile().page_limit
+        if page_limit:
+            images = images[:page_limit]
+        return write_thumbnails(output_path, images)
+
+    def _should_split(self, html_content: str) -> bool:
+        """判断是否需要分段渲染"""
+        config = self.config_manager.get_config()
+        if not config.split_large_documents:
+            return False
+        return len(html_content.encode('utf-8')) >= config.split_threshold_kb * 1024
+
+    async def _convert_sections_to_pdf(
+        self,
+        html_content: str,
+        title: str,
+        theme_css: str,
+        output_path: Path,
+        options: dict
+    ):
+        """按h1/h2章节拆分，在同一浏览器的多个页面中并行渲染后合并
+
+        每个章节从新页开始渲染，合并时按章节顺序拼接页面，
+        恢复跨章节锚点链接并生成章节书签。
+        """
+        sections = split_html_sections(html_content)
+        if len(sections) < 2:
+            full_html = self._create_html_document(html_content, title, theme_css)
+            await self._convert_html_to_pdf(full_html, output_path, options)
+            return
+
+        pdf_options = self._build_pdf_options(options)
+
+        with tempfile.TemporaryDirectory(prefix='md2pdf-') as tmp_dir:
+            fragments = [
+                Path(tmp_dir) / f"section-{section.index:04d}.pdf" for section in sections
+            ]
+            thumbnails = self._thumbnail_mode()
+            images = await self._render_sections(
+                sections, fragments, title, theme_css, pdf_options, thumbnails=thumbnails
+            )
+            merge_section_pdfs(
+                sections, fragments, output_path,
+                page_limit=self.config_manager.get_render_profile().page_limit
+            )
+
+        if thumbnails != 'none':
+            self._write_thumbnails(output_path, [image for pages in images for image in pages])
+
+    async def _convert_sections_incremental(
+        self,
+        html_content: str,
+        title: str,
+        theme_css: str,
+        output_path: Path,
+        options: dict
+    ):
+        """章节级增量渲染
+
+        每个章节按内容指纹缓存PDF片段。章节从新页开始渲染，
+        修改某一章节只会影响该章节自身的分页，后续章节的页码偏移、
+        跨章节链接和书签在合并时重新计算。
+        """
+        config = self.config_manager.get_config()
+        sections = split_html_sections(html_content)
+        pdf_options = self._build_pdf_options(options)
+        thumbnails = self._thumbnail_mode()
+        render_options = {
+            'pdf': pdf_options,
+            'profile': asdict(self.config_manager.get_render_profile()),
+            'thumbnails': [thumbnails, config.thumbnail_width],
+        }
+
+        cache = SectionCache(output_path.parent / config.cache_dir / output_path.stem)
+        section_hashes = [
+            SectionCache.fingerprint(section.html, title, theme_css, render_options)
+            for section in sections
+        ]
+        changed = cache.changed_sections(section_hashes)
+        # 片段已缓存但缺少所需缩略图的章节（例如章节顺序变化后成为首章）同样需要重新渲染
+        changed += [
+            section.index for section in sections
+            if section.index not in changed
+            and self._section_thumbnail_mode(section, thumbnails) != 'none'
+            and not cache.thumbnail_paths(section_hashes[section.index])
+        ]
+        changed.sort()
+
+        # 所有章节均未变化且输出文件仍在，无需重新合并
+        if not changed and output_path.exists() and cache.load_manifest() == section_hashes:
+            return
+
+        if changed:
+            cache.cache_dir.mkdir(parents=True, exist_ok=True)
+            # 先写入临时文件，渲染全部成功后再落盘，避免残缺片段被当作缓存
+            pending = [
+                cache.fragment_path(section_hashes[index]).with_suffix('.pdf.part')
+                for index in changed
+            ]
+            images = await self._render_sections(
+                [sections[index] for index in changed],
+                pending,
+                title,
+                theme_css,
+                pdf_options,
+                thumbnails=thumbnails
+            )
+            for index, part, pages in zip(changed, pending, images):
+                part.replace(cache.fragment_path(section_hashes[index]))
+                if pages:
+                    cache.save_thumbnails(section_hashes[index], pages)
+
+        merge_section_pdfs(
+            sections,
+            [cache.fragment_path(section_hash) for section_hash in section_hashes],
+            output_path,
+            page_limit=self.config_manager.get_render_profile().page_limit
+        )
+        cache.save_manifest(section_hashes)
+        cache.prune(section_hashes)
+
+        if thumbnails != 'none':
+            self._write_thumbnails(output_path, [
+                image for section_hash in section_hashes
+                for image in cache.load_thumbnails(section_hash)
+            ])
+
+    async def _render_sections(
+        self,
+        sections,
+        fragments: List[Path],
+        title: str,
+        theme_css: str,
+        pdf_options: dict,
+        thumbnails: str = 'none'
+    ) -> List[List[bytes]]:
+        """在同一浏览器的多个页面中并行渲染章节
+
+        Returns:
+            与章节一一对应的缩略图列表（未启用缩略图的章节为空列表）
+        """
         config = self.config_manager.get_config()
+        # 页数限制针对整篇文档，在合并片段时生效（merge_section_pdfs）
+        pdf_options = {key: value for key, value in pdf_options.items() if key != 'pageRanges'}
+        semaphore = asyncio.Semaphore(max(1, config.max_parallel_pages))
+
+        async with self._browser_session() as browser:
+
+            async def render_section(section, fragment: Path):
+                """带信号量控制的章节渲染"""
+                async with semaphore:
+                    section_html = self._create_html_document(section.html, title, theme_css)
+                    return await self._render_page(
+                        browser, section_html, fragment, pdf_options,
+                        thumbnails=self._section_thumbnail_mode(section, thumbnails)
+                    )
+
+            return await asyncio.gather(*[
+                render_section(section, fragment)
+                for section, fragment in zip(sections, fragments)
+            ])
+
+    @staticmethod
+    def _section_thumbnail_mode(section, thumbnails: str) -> str:
+        """章节的缩略图模式：first 模式只截取文档首个章节"""
+        if thumbnails == 'first' and section.index != 0:
+            return 'none'
+        return thumbnails
+
+    def _build_pdf_options(self, options: Optional[dict]) -> dict:
+        """构建page.pdf参数"""
+        config = self.config_manager.get_config()
+        profile = self.config_manager.get_render_profile()
         
         pdf_options = {
             'format': config.format,
             'margin': config.margins,
-            'printBackground': True,
+            'printBackground': profile.print_background,
             'displayHeaderFooter': False,
             'preferCSSPageSize': True,
             'scale': config.scale
         }
         
-        # 合并用户选项
-        if options:
-            pdf_options.update(options)
+        if profile.page_limit:
+            pdf_options['pageRanges'] = f"1-{profile.page_limit}"
         
+        # 合并用户选项（预处理阶段使用的选项不传给page.pdf）
+        if options:
+            pdf_options.update(
+                (key, value) for key, value in options.items() if key not in PREPROCESS_OPTIONS
+            )
+
+        return pdf_options
+
+    @asynccontextmanager
+    async def _browser_session(self):
+        """获取浏览器：有常驻浏览器时复用，否则临时启动并在使用后关闭"""
+        if self._browser is not None:
+            if not self._browser_alive(self._browser):
+                # 常驻浏览器意外退出，重新拉起
+                self._browser = await self._launch_browser()
+            yield self._browser
+            return
+
+        browser = await self._launch_browser()
+        try:
+            yield browser
+        finally:
+            await browser.close()
+
+    @staticmethod
+    def _browser_alive(browser) -> bool:
+        """检查浏览器进程是否仍在运行"""
+        process = getattr(browser, 'process', None)
+        return process is None or process.poll() is None
+
+    async def _launch_browser(self):
+        """启动无头浏览器"""
         # Prefer using a locally installed Chromium/Chrome/Edge when available to avoid
         # pyppeteer trying to download its own Chromium (blocked in restricted networks).
         launch_kwargs = {
@@ -442,43 +798,97 @@ class PDFConverter(ConverterBase):
         if exec_path:
             launch_kwargs['executablePath'] = exec_path
 
-        browser = await launch(**launch_kwargs)
-        
+        return await launch(**launch_kwargs)
+
+    async def _render_page(
+        self,
+        browser,
+        html_content: str,
+        output_path: Path,
+        pdf_options: dict,
+        thumbnails: str = 'none'
+    ) -> List[bytes]:
+        """在新页面中加载HTML并输出PDF，等待策略与像素密度由渲染档位决定
+
+        Returns:
+            启用缩略图时为各页PNG数据，否则为空列表
+        """
+        profile = self.config_manager.get_render_profile()
+
+        page = await browser.newPage()
         try:
-            page = await browser.newPage()
             await page.setViewport({
                 'width': 1200,
                 'height': 800,
-                'deviceScaleFactor': 2
+                'deviceScaleFactor': profile.device_scale_factor
             })
             
             await page.setContent(html_content)
-            # 等待所有图片加载完成
-            try:
-                await page.waitForSelector('img', {'timeout': 5000})
-                # 等待所有图片加载
-                await page.evaluate('''
-                    () => {
-                        return Promise.all(Array.from(document.images).map(img => {
-                            if (img.complete) return Promise.resolve();
-                            return new Promise(resolve => {
-                                img.onload = resolve;
-                                img.onerror = resolve;
-                            });
-                        }));
-                    }
-                ''')
-            except Exception:
-                pass  # 如果没有图片或加载失败，继续执行
-            await asyncio.sleep(3)  # 额外等待时间确保外部图片加载
+
+            if profile.wait_strategy == 'images':
+                # 等待所有图片和字体加载完成
+                try:
+                    await page.evaluate(WAIT_FOR_RESOURCES_JS, int(profile.wait_timeout * 1000))
+                except Exception:
+                    pass  # 加载失败，继续执行
+
+            if profile.max_image_width:
+                try:
+                    await page.evaluate(DOWNSAMPLE_IMAGES_JS, profile.max_image_width)
+                except Exception:
+                    pass  # 降采样失败不影响输出
+
+            if profile.settle_delay:
+                await asyncio.sleep(profile.settle_delay)  # 额外等待时间确保外部图片加载
             
             await page.pdf({
                 'path': str(output_path),
                 **pdf_options
             })
-            
+
+            if thumbnails == 'none':
+                return []
+            # 复用已加载完成的页面截图，无需再次加载文档
+            return await self._capture_thumbnails(page, thumbnails)
         finally:
-            await browser.close()
+            await page.close()
+
+    async def _capture_thumbnails(self, page, mode: str) -> List[bytes]:
+        """按纸张内容区尺寸分页截图
+
+        视口宽度设置为纸张内容区宽度并切换到打印媒体，
+        再通过小于1的像素密度直接在浏览器内缩放到缩略图宽度。
+        分页按内容区高度切分，与PDF分页近似一致。
+        """
+        config = self.config_manager.get_config()
+        width, height = page_content_box(config.format, config.margins)
+        scale = config.thumbnail_width / width
+
+        await page.emulateMedia('print')
+        await page.setViewport({'width': width, 'height': height, 'deviceScaleFactor': scale})
+
+        page_count = 1
+        if mode == 'all':
+            scroll_height = await page.evaluate('() => document.documentElement.scrollHeight')
+            page_count = max(1, math.ceil(scroll_height / height))
+            page_limit = self.config_manager.get_render_profile().page_limit
+            if page_limit:
+                page_count = min(page_count, page_limit)
+            if page_count > 1:
+                # 截图区域超出视口时会被裁掉，先把视口拉高到覆盖所有页面
+                await page.setViewport({
+                    'width': width,
+                    'height': height * page_count,
+                    'deviceScaleFactor': scale
+                })
+
+        images = []
+        for index in range(page_count):
+            images.append(await page.screenshot({
+                'type': 'png',
+                'clip': {'x': 0, 'y': index * height, 'width': width, 'height': height}
+            }))
+        return images
 
     def _detect_browser_executable(self) -> Optional[str]:
         """Best-effort detection of a local Chromium/Chrome/Edge executable.
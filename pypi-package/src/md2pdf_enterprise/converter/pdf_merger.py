@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+PDF合并器 - 分段渲染结果合并
+===========================
+
+按章节顺序合并PDF片段，恢复跨章节链接并生成书签
+"""
+
+from pathlib import Path
+from typing import Dict, List, Sequence
+from urllib.parse import unquote
+
+from ..core.exceptions import DependencyError, PDFGenerationError
+from .document_splitter import DocumentSection, SECTION_LINK_PREFIX
+
+
+def _load_pypdf():
+    """按需导入pypdf（可选依赖）"""
+    try:
+        import pypdf
+    except ImportError:
+        raise DependencyError("pypdf", "分段渲染需要 pypdf: pip install pypdf")
+    return pypdf
+
+
+def merge_section_pdfs(
+    sections: Sequence[DocumentSection],
+    fragments: Sequence[Path],
+    output_path: Path,
+    page_limit: int = 0
+) -> List[int]:
+    """合并章节PDF片段
+
+    Args:
+        sections: ``split_html_sections`` 返回的章节列表
+        fragments: 与章节一一对应的PDF片段路径
+        output_path: 合并后的PDF路径
+        page_limit: 合并文档最多包含的页数，0表示不限制
+
+    Returns:
+        每个章节在合并文档中的起始页索引（超出页数限制未合并的章节不计入）
+    """
+    if len(sections) != len(fragments):
+        raise PDFGenerationError(str(output_path), "章节数量与PDF片段数量不一致")
+
+    pypdf = _load_pypdf()
+    writer = pypdf.PdfWriter()
+
+    start_pages = []
+    for fragment in fragments:
+        remaining = page_limit - len(writer.pages) if page_limit else None
+        if remaining is not None and remaining <= 0:
+            break
+        start_pages.append(len(writer.pages))
+        reader = pypdf.PdfReader(str(fragment))
+        if remaining is not None and len(reader.pages) > remaining:
+            writer.append(reader, pages=list(range(remaining)))
+        else:
+            writer.append(reader)
+
+    section_pages = {}
+    for section, start in zip(sections, start_pages):
+        for anchor in section.ids:
+            section_pages[anchor] = start
+
+    _resolve_section_links(pypdf, writer, section_pages)
+    _add_section_outline(writer, sections, start_pages)
+
+    with open(output_path, 'wb') as f:
+        writer.write(f)
+
+    return start_pages
+
+
+def _resolve_section_links(pypdf, writer, section_pages: Dict[str, int]) -> None:
+    """将跨章节占位链接替换为文档内跳转"""
+    generic = pypdf.generic
+    named = writer.named_destinations
+
+    for page in writer.pages:
+        for annot_ref in page.get('/Annots') or []:
+            annot = annot_ref.get_object()
+            action = annot.get('/A')
+            if action is None:
+                continue
+            action = action.get_object()
+            uri = action.get('/URI')
+            if action.get('/S') != '/URI' or not str(uri or '').startswith(SECTION_LINK_PREFIX):
+                continue
+
+            anchor = unquote(str(uri)[len(SECTION_LINK_PREFIX):])
+            if anchor in named:
+                # Chromium 为被链接的元素生成了命名目标，可以精确跳转
+                dest = named[anchor].dest_array
+            elif anchor in section_pages:
+                # 退化为跳转到目标所在章节的首页
+                page_ref = writer.pages[section_pages[anchor]].indirect_reference
+                dest = generic.ArrayObject([page_ref, generic.NameObject('/Fit')])
+            else:
+                continue
+
+            annot[generic.NameObject('/A')] = generic.DictionaryObject({
+                generic.NameObject('/S'): generic.NameObject('/GoTo'),
+                generic.NameObject('/D'): dest,
+            })
+
+
+def _add_section_outline(writer, sections: Sequence[DocumentSection], start_pages: List[int]) -> None:
+    """为h1/h2章节生成PDF书签"""
+    parent = None
+    for section, start in zip(sections, start_pages):
+        if not section.title:
+            continue
+        if section.level == 'h1':
+            parent = writer.add_outline_item(section.title, start)
+        else:
+            writer.add_outline_item(section.title, start, parent=parent)
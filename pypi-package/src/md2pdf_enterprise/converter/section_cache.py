@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+章节缓存 - 增量渲染支持
+=======================
+
+记录上一次构建的章节哈希与对应PDF片段，只重新渲染发生变化的章节
+"""
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+
+class SectionCache:
+    """章节PDF片段缓存
+
+    缓存目录结构::
+
+        <cache_dir>/
+            manifest.json      # 上一次构建的章节哈希列表
+            <hash>.pdf         # 章节PDF片段
+            <hash>.page-N.png  # 章节页面缩略图（启用缩略图时）
+    """
+
+    MANIFEST_NAME = "manifest.json"
+
+    def __init__(self, cache_dir: Path):
+        self.cache_dir = Path(cache_dir)
+        self.manifest_path = self.cache_dir / self.MANIFEST_NAME
+
+    @staticmethod
+    def fingerprint(section_html: str, title: str, theme_css: str, pdf_options: Dict) -> str:
+        """计算章节渲染指纹
+
+        指纹覆盖章节HTML、文档标题、主题CSS和PDF参数，
+        任意一项变化都会使对应片段失效。
+        """
+        digest = hashlib.sha256()
+        for part in (
+            section_html,
+            title,
+            theme_css,
+            json.dumps(pdf_options, sort_keys=True, ensure_ascii=False, default=str),
+        ):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def fragment_path(self, section_hash: str) -> Path:
+        """获取章节片段路径"""
+        return self.cache_dir / f"{section_hash}.pdf"
+
+    def has_fragment(self, section_hash: str) -> bool:
+        """检查章节片段是否已缓存"""
+        path = self.fragment_path(section_hash)
+        return path.exists() and path.stat().st_size > 0
+
+    def thumbnail_paths(self, section_hash: str) -> List[Path]:
+        """获取章节已缓存的缩略图路径（按页码排序）"""
+        return sorted(self.cache_dir.glob(f"{section_hash}.page-[0-9][0-9][0-9].png"))
+
+    def load_thumbnails(self, section_hash: str) -> List[bytes]:
+        """读取章节缓存的缩略图"""
+        return [path.read_bytes() for path in self.thumbnail_paths(section_hash)]
+
+    def save_thumbnails(self, section_hash: str, images: List[bytes]) -> None:
+        """缓存章节缩略图"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for path in self.thumbnail_paths(section_hash):
+            path.unlink()
+        for page_number, image in enumerate(images, 1):
+            (self.cache_dir / f"{section_hash}.page-{page_number:03d}.png").write_bytes(image)
+
+    def load_manifest(self) -> List[str]:
+        """读取上一次构建的章节哈希列表"""
+        if not self.manifest_path.exists():
+            return []
+        try:
+            with open(self.manifest_path, 'r', encoding='utf-8') as f:
+                return list(json.load(f).get('sections', []))
+        except Exception:
+            # 清单损坏，视为首次构建
+            return []
+
+    def save_manifest(self, section_hashes: List[str]) -> None:
+        """保存本次构建的章节哈希列表"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with open(self.manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({'sections': section_hashes}, f, indent=2)
+
+    def prune(self, keep: Iterable[str]) -> int:
+        """删除不再使用的章节片段及其缩略图
+
+        Returns:
+            删除的片段数量
+        """
+        if not self.cache_dir.exists():
+            return 0
+
+        keep = set(keep)
+        removed = 0
+        for path in self.cache_dir.glob("*.pdf"):
+            if path.stem not in keep:
+                path.unlink()
+                removed += 1
+        for path in self.cache_dir.glob("*.png"):
+            if path.name.split('.', 1)[0] not in keep:
+                path.unlink()
+        return removed
+
+    def changed_sections(self, section_hashes: List[str]) -> List[int]:
+        """返回需要重新渲染的章节索引"""
+        return [
+            index for index, section_hash in enumerate(section_hashes)
+            if not self.has_fragment(section_hash)
+        ]
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+WeasyPrint转换器 - 纯Python PDF后端
+===================================
+
+使用WeasyPrint排版同一份HTML和主题CSS，无需Chromium，
+适合没有浏览器的主机和轻量文档的批量转换
+"""
+
+import asyncio
+
+from ..core.converter_base import ConversionTask
+from ..core.exceptions import DependencyError
+from .pdf_converter import PDFConverter
+
+
+def _load_weasyprint():
+    """按需导入WeasyPrint（可选依赖）"""
+    try:
+        import weasyprint
+    except ImportError:
+        raise DependencyError("weasyprint", "纯Python渲染需要 WeasyPrint: pip install weasyprint")
+    except OSError as e:
+        # 已安装但缺少 Pango 等系统库
+        raise DependencyError("weasyprint", f"缺少系统库: {e}")
+    return weasyprint
+
+
+class WeasyPrintConverter(PDFConverter):
+    """WeasyPrint PDF转换器实现
+
+    复用 ``PDFConverter`` 的Markdown处理流程，只替换渲染引擎。
+    章节拆分、增量缓存和缩略图依赖浏览器页面，在此后端中不启用。
+    """
+
+    async def start(self):
+        """无需浏览器，不做预热"""
+        pass
+
+    async def close(self):
+        """无需浏览器，无资源释放"""
+        pass
+
+    async def _write_output(self, html_content: str, title: str, theme_css: str, task: ConversionTask):
+        """使用WeasyPrint渲染PDF"""
+        weasyprint = _load_weasyprint()
+        zoom = self._build_pdf_options(task.options).get('scale', 1.0)
+        # 纸张与页边距放在主题CSS之前，主题中的 @page 规则优先（与Chromium的 preferCSSPageSize 一致）
+        document = self._create_html_document(
+            html_content, title, self._page_css(task.options) + theme_css
+        )
+
+        def render():
+            html = weasyprint.HTML(string=document, base_url=str(task.source.parent))
+            html.write_pdf(str(task.target), zoom=zoom)
+
+        # 排版是同步的CPU计算，放到线程中执行以免阻塞事件循环（watch模式）
+        loop = asyncio.get_event_loop()
+        await loop.run_in_executor(None, render)
+
+    def _page_css(self, options: dict) -> str:
+        """将纸张、页边距和背景配置转换为 @page 规则"""
+        pdf_options = self._build_pdf_options(options)
+        margin = pdf_options.get('margin') or {}
+        rules = [f"size: {pdf_options['format']};"]
+        rules += [
+            f"margin-{side}: {margin[side]};"
+            for side in ('top', 'right', 'bottom', 'left') if side in margin
+        ]
+
+        css = "@page { " + " ".join(rules) + " }"
+        if not pdf_options.get('printBackground', True):
+            css += " * { background: none !important; }"
+        return f"<style>{css}</style>\n    "
+
+    def _thumbnail_mode(self) -> str:
+        """WeasyPrint后端不生成缩略图"""
+        return 'none'
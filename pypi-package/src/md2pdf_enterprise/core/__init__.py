@@ -1,13 +1,15 @@
 """核心模块"""
 
-from .config_manager import ConfigManager
-from .theme_manager import ThemeManager, Theme
+from .config_manager import ConfigManager, RenderProfile
+from .theme_manager import ThemeManager, Theme, get_theme_manager
 from .converter_base import ConverterBase, ConversionTask, ConversionResult, ConversionStatus
 
 __all__ = [
     "ConfigManager",
+    "RenderProfile",
     "ThemeManager",
     "Theme",
+    "get_theme_manager",
     "ConverterBase",
     "ConversionTask",
     "ConversionResult",
@@ -8,9 +8,49 @@
 
 import json
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, asdict
 
+from .exceptions import ConfigurationError
+
+
+@dataclass(frozen=True)
+class RenderProfile:
+    """渲染质量档位"""
+    name: str
+    description: str
+    device_scale_factor: float = 2
+    max_image_width: int = 0          # 超过该宽度(px)的图片降采样，0表示不处理
+    wait_strategy: str = "images"     # none: 不等待外部资源; images: 等待图片和字体
+    wait_timeout: float = 5.0         # 等待资源的超时时间（秒）
+    settle_delay: float = 0.0         # 资源就绪后的额外等待（秒）
+    print_background: bool = True
+    page_limit: int = 0               # 最多输出的页数，0表示不限制
+
+
+RENDER_PROFILES: Dict[str, RenderProfile] = {
+    "draft": RenderProfile(
+        name="draft",
+        description="快速预览：1倍像素、不等待外部资源、不打印背景、最多10页",
+        device_scale_factor=1,
+        max_image_width=800,
+        wait_strategy="none",
+        wait_timeout=1.0,
+        print_background=False,
+        page_limit=10,
+    ),
+    "standard": RenderProfile(
+        name="standard",
+        description="标准输出：2倍像素、等待图片和字体加载完成",
+    ),
+    "print": RenderProfile(
+        name="print",
+        description="印刷输出：2倍像素、较长资源等待并额外留出外部图片加载时间",
+        wait_timeout=10.0,
+        settle_delay=3.0,
+    ),
+}
+
 
 @dataclass
 class ConverterConfig:
@@ -22,8 +62,32 @@ class ConverterConfig:
     auto_open: bool = False
     output_dir: str = ""
     batch_mode: bool = False
+    # 大文档分段并行渲染（需要pypdf）
+    split_large_documents: bool = False
+    split_threshold_kb: int = 512
+    max_parallel_pages: int = 4
+    # 章节级增量渲染，片段缓存在输出目录下的 cache_dir 中
+    incremental: bool = False
+    cache_dir: str = ".md2pdf-cache"
+    # 渲染质量档位: draft / standard / print
+    render_profile: str = "standard"
+    # 页面缩略图: none / first(仅首页) / all(全部页面)，宽度单位为像素
+    thumbnails: str = "none"
+    thumbnail_width: int = 320
+    # 转换前识别文档类型并应用对应的预处理插件（工作总结、会议纪要等）
+    document_processing: bool = True
+    # PDF输出使用主题的打印变体（去掉:hover、transition等屏幕专用规则并压缩，打印效果不变）
+    print_theme: bool = True
+    # 打印变体同时去掉阴影、将渐变背景压平为纯色（改变视觉效果，换取更快的栅格化和更小的PDF）
+    flatten_theme_effects: bool = False
+    # 只输出可能作用于当前文档的主题规则（按文档中出现的标签、class、id裁剪）
+    prune_theme_css: bool = True
+    # 用户主题目录，其中的 <名称>.css 自动作为主题（同名时覆盖内置主题）
+    theme_dirs: List[str] = None
     
     def __post_init__(self):
+        if self.theme_dirs is None:
+            self.theme_dirs = []
         if self.margins is None:
             self.margins = {
                 "top": "20mm",
@@ -77,6 +141,26 @@ class ConfigManager:
         except Exception:
             return False
     
+    def get_render_profile(self, name: Optional[str] = None) -> RenderProfile:
+        """获取渲染档位，默认使用配置中的 render_profile"""
+        name = name or self._config.render_profile
+        if name not in RENDER_PROFILES:
+            raise ConfigurationError(
+                f"未知的渲染档位 {name}，可选: {', '.join(RENDER_PROFILES)}"
+            )
+        return RENDER_PROFILES[name]
+    
+    @staticmethod
+    def get_render_profiles() -> List[RenderProfile]:
+        """获取所有渲染档位"""
+        return list(RENDER_PROFILES.values())
+    
+    def override(self, **kwargs) -> None:
+        """临时覆盖配置（仅对当前进程生效，不写入配置文件）"""
+        for key, value in kwargs.items():
+            if hasattr(self._config, key):
+                setattr(self._config, key, value)
+    
     def reset_config(self) -> bool:
         """重置为默认配置"""
         self._config = ConverterConfig()
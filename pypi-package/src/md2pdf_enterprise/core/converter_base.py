@@ -7,7 +7,7 @@
 """
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from datetime import datetime
@@ -27,7 +27,8 @@ class ConversionTask:
     """转换任务数据结构"""
     source: Path
     target: Path
-    theme: str = "github"
+    # 为None时使用文档Front Matter中的theme，其次为配置的默认主题
+    theme: Optional[str] = "github"
     options: Dict[str, Any] = None
     status: ConversionStatus = ConversionStatus.PENDING
     error: Optional[str] = None
@@ -48,11 +49,16 @@ class ConversionResult:
     error_message: Optional[str] = None
     duration: Optional[float] = None
     file_size: Optional[int] = None
+    thumbnails: List[Path] = field(default_factory=list)
+    doc_type: Optional[str] = None
 
 
 class ConverterBase(ABC):
     """转换器基础抽象类"""
     
+    # 输出文件扩展名，未指定输出路径时使用
+    output_suffix: str = ".pdf"
+    
     @abstractmethod
     async def convert_single(self, task: ConversionTask) -> ConversionResult:
         """转换单个文件"""
@@ -71,4 +77,19 @@ class ConverterBase(ABC):
     @abstractmethod
     def validate_task(self, task: ConversionTask) -> bool:
         """验证转换任务"""
-        pass
\ No newline at end of file
+        pass
+    
+    async def start(self):
+        """预热转换资源（watch等长时间运行场景），默认无操作"""
+        pass
+    
+    async def close(self):
+        """释放预热的转换资源，默认无操作"""
+        pass
+    
+    async def __aenter__(self):
+        await self.start()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
\ No newline at end of file
@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+打印主题编译器 - 生成主题的打印变体
+===================================
+
+主题CSS同时服务于屏幕预览和PDF输出。打印变体去掉打印时不会生效的
+规则（:hover、transition 等）和不可见的固定定位图层，并压缩空白；
+可选地去掉阴影、将渐变背景压平为纯色，减少Chromium栅格化的
+透明图层，缩小PDF体积。
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Union
+
+
+# 只在交互时生效的伪类
+SCREEN_ONLY_PSEUDO = re.compile(r':(?:hover|focus|focus-within|focus-visible|active)\b')
+# 打印时不起作用的声明
+SCREEN_ONLY_PROPERTIES = (
+    'transition', 'animation', 'cursor', 'pointer-events', 'user-select', 'will-change',
+)
+# flatten_effects 时去掉的声明（产生透明图层或离屏合成）
+EFFECT_PROPERTIES = ('box-shadow', 'text-shadow', 'filter', 'backdrop-filter')
+# 伪元素图层有这些声明时才可能可见
+VISIBLE_LAYER_PROPERTIES = (
+    'background', 'border', 'outline', 'box-shadow', 'width', 'height',
+)
+
+GRADIENT_FUNCTION = re.compile(r'(?:repeating-)?(?:linear|radial|conic)-gradient\(')
+# 渐变参数中的方向、形状关键字（不是色标）
+GRADIENT_KEYWORDS = (
+    'to', 'at', 'from', 'circle', 'ellipse',
+    'closest-side', 'closest-corner', 'farthest-side', 'farthest-corner',
+)
+SCREEN_ONLY_AT_RULE = re.compile(
+    r'@(?:media\s+(?:only\s+)?screen\b|(?:-[a-z]+-)?keyframes\b)', re.IGNORECASE
+)
+STYLE_WRAPPER = re.compile(r'^\s*<style[^>]*>(.*)</style>\s*$', re.DOTALL | re.IGNORECASE)
+COMMENT = re.compile(r'/\*.*?\*/', re.DOTALL)
+# 字符串原样保留，其余连续空白压缩为一个空格
+WHITESPACE_OR_STRING = re.compile(r'("(?:\\.|[^"\\])*"|\'(?:\\.|[^\'\\])*\')|\s+')
+TRANSPARENT_COLOR = re.compile(
+    r'^(?:transparent|(?:rgba|hsla)\(.*,\s*0?\.?0*\s*\)|#[0-9a-f]{6}00|#[0-9a-f]{3}0)$',
+    re.IGNORECASE
+)
+
+
+@dataclass
+class Declaration:
+    """CSS声明（或 @import 等无块的at规则）"""
+    text: str
+
+
+@dataclass
+class Block:
+    """规则块：选择器或at规则 + 块内容"""
+    prelude: str
+    children: List[Union['Block', Declaration]] = field(default_factory=list)
+
+
+Node = Union[Block, Declaration]
+
+
+def _collapse(text: str) -> str:
+    """压缩字符串以外的空白"""
+    return WHITESPACE_OR_STRING.sub(lambda m: m.group(1) or ' ', text).strip()
+
+
+def parse_css(css: str) -> List[Node]:
+    """将CSS解析为规则树（支持 @media / @page 等嵌套块，不校验语法）"""
+    css = COMMENT.sub('', css)
+    root: List[Node] = []
+    stack: List[List[Node]] = [root]
+    buffer: List[str] = []
+    depth_paren = 0
+    quote = None
+    i = 0
+
+    while i < len(css):
+        char = css[i]
+        if quote:
+            buffer.append(char)
+            if char == '\\' and i + 1 < len(css):
+                buffer.append(css[i + 1])
+                i += 1
+            elif char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+            buffer.append(char)
+        elif char == '(':
+            depth_paren += 1
+            buffer.append(char)
+        elif char == ')':
+            depth_paren = max(depth_paren - 1, 0)
+            buffer.append(char)
+        elif depth_paren:
+            # url(...)、渐变参数中的分号和括号不作为结构字符
+            buffer.append(char)
+        elif char == '{':
+            block = Block(_collapse(''.join(buffer)))
+            stack[-1].append(block)
+            stack.append(block.children)
+            buffer = []
+        elif char in ';}':
+            text = _collapse(''.join(buffer))
+            if text:
+                stack[-1].append(Declaration(text))
+            buffer = []
+            if char == '}' and len(stack) > 1:
+                stack.pop()
+        else:
+            buffer.append(char)
+        i += 1
+
+    text = _collapse(''.join(buffer))
+    if text:
+        stack[-1].append(Declaration(text))
+    return root
+
+
+def _property(declaration: Declaration) -> str:
+    """声明的属性名（小写，去掉 -webkit- 等厂商前缀）"""
+    name = declaration.text.split(':', 1)[0].strip().lower()
+    return re.sub(r'^-[a-z]+-', '', name)
+
+
+def _value(declaration: Declaration) -> str:
+    return declaration.text.split(':', 1)[1].strip() if ':' in declaration.text else ''
+
+
+def split_top_level(text: str, separator: str = ',') -> List[str]:
+    """按顶层分隔符切分（忽略括号和字符串内的分隔符）"""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, char in enumerate(text):
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '(':
+            depth += 1
+        elif char == ')':
+            depth -= 1
+        elif char == separator and depth == 0:
+            parts.append(text[start:i])
+            start = i + 1
+    parts.append(text[start:])
+    return [part.strip() for part in parts]
+
+
+def gradient_fallback_color(gradient: str) -> Optional[str]:
+    """取渐变的第一个不透明色标作为纯色（无法解析时为None）"""
+    match = GRADIENT_FUNCTION.match(gradient)
+    if not match or not gradient.endswith(')'):
+        return None
+    arguments = split_top_level(gradient[match.end():-1])
+    for argument in arguments:
+        # 色标形如 "#3b82f6 50%"，颜色本身可能带括号（rgba(...)）
+        color = split_top_level(argument, ' ')[0]
+        if not color or re.match(r'^[\d.+-]', color) or color.lower() in GRADIENT_KEYWORDS:
+            continue
+        if not TRANSPARENT_COLOR.match(color):
+            return color
+    return None
+
+
+def _flatten_gradient(declaration: Declaration) -> Declaration:
+    """``background: linear-gradient(...)`` → ``background: <第一个色标>``"""
+    name = _property(declaration)
+    if name not in ('background', 'background-image'):
+        return declaration
+    value = _value(declaration)
+    important = ''
+    if value.lower().endswith('!important'):
+        value, important = value[:-len('!important')].strip(), ' !important'
+    # 只处理单个渐变图层，多图层背景保持原样
+    if len(split_top_level(value)) != 1 or not GRADIENT_FUNCTION.match(value):
+        return declaration
+    color = gradient_fallback_color(value)
+    if color is None:
+        return declaration
+    target = 'background' if name == 'background' else 'background-color'
+    return Declaration(f"{target}: {color}{important}")
+
+
+def _is_invisible_layer(block: Block) -> bool:
+    """内容为空且没有背景、边框、尺寸的伪元素（如占位水印），打印时只多出一个合成图层"""
+    if not re.search(r'::?(?:before|after)\s*$', block.prelude):
+        return False
+    declarations = [child for child in block.children if isinstance(child, Declaration)]
+    content = next((_value(d) for d in declarations if _property(d) == 'content'), None)
+    if content not in ('""', "''"):
+        return False
+    return not any(
+        _property(d).startswith(VISIBLE_LAYER_PROPERTIES) for d in declarations
+    )
+
+
+def _transform(nodes: List[Node], flatten_effects: bool) -> List[Node]:
+    result: List[Node] = []
+    for node in nodes:
+        if isinstance(node, Declaration):
+            name = _property(node)
+            if name.startswith(SCREEN_ONLY_PROPERTIES):
+                continue
+            if flatten_effects:
+                if name in EFFECT_PROPERTIES:
+                    continue
+                node = _flatten_gradient(node)
+            result.append(node)
+            continue
+
+        if node.prelude.startswith('@'):
+            # 仅屏幕的 @media 打印时不生效，动画已随 animation 声明去掉
+            if SCREEN_ONLY_AT_RULE.match(node.prelude) and ',' not in node.prelude:
+                continue
+            children = _transform(node.children, flatten_effects)
+            if children:
+                result.append(Block(node.prelude, children))
+            continue
+
+        selectors = [
+            selector for selector in split_top_level(node.prelude)
+            if not SCREEN_ONLY_PSEUDO.search(selector)
+        ]
+        if not selectors:
+            continue
+        block = Block(','.join(selectors), _transform(node.children, flatten_effects))
+        if block.children and not _is_invisible_layer(block):
+            result.append(block)
+    return result
+
+
+def serialize_css(nodes: List[Node], minify: bool = True, indent: int = 0) -> str:
+    """将规则树输出为CSS文本"""
+    if minify:
+        parts = []
+        for node in nodes:
+            if isinstance(node, Declaration):
+                name, _, value = node.text.partition(':')
+                at_statement = node.text.startswith('@')
+                parts.append(f"{name.strip()}:{value.strip()};" if value and not at_statement else f"{node.text};")
+            else:
+                parts.append(f"{node.prelude}{{{serialize_css(node.children, True)}}}")
+        return ''.join(parts)
+
+    pad = '    ' * indent
+    lines = []
+    for node in nodes:
+        if isinstance(node, Declaration):
+            lines.append(f"{pad}{node.text};")
+        else:
+            lines.append(f"{pad}{node.prelude} {{")
+            lines.append(serialize_css(node.children, False, indent + 1))
+            lines.append(f"{pad}}}")
+    return '\n'.join(line for line in lines if line)
+
+
+def compile_print_css(css: str, flatten_effects: bool = False, minify: bool = True) -> str:
+    """编译CSS的打印变体
+
+    Args:
+        css: 主题CSS（可带 ``<style>`` 包装，输出时保持相同形式）
+        flatten_effects: 去掉阴影、将渐变背景压平为第一个不透明色标
+        minify: 压缩输出
+    """
+    wrapped = STYLE_WRAPPER.match(css)
+    source = wrapped.group(1) if wrapped else css
+    compiled = serialize_css(_transform(parse_css(source), flatten_effects), minify)
+    return f"<style>\n{compiled}\n</style>" if wrapped else compiled
+
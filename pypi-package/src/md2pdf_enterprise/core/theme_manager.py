@@ -3,15 +3,22 @@
 主题管理器 - 统一主题接口
 =========================
 
-管理所有转换主题，提供统一访问接口
+管理所有转换主题，提供统一访问接口。
+
+主题即主题目录中的 ``<名称>.css`` 文件（内置目录 + 用户目录），
+构造时不读取任何文件：按名称查找主题时只探测对应文件，CSS在首次使用时读取，
+包装好的 ``<style>`` 块按文件修改时间缓存，文件变化后自动重新加载。
 """
 
+import os
+import re
 from dataclasses import dataclass
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple, Union
 from pathlib import Path
 from abc import ABC, abstractmethod
 
 from .exceptions import ThemeNotFoundError, ThemeLoadError
+from .theme_compiler import compile_print_css
 
 
 @dataclass
@@ -37,70 +44,218 @@ class ThemeProvider(ABC):
         pass
 
 
-class ThemeManager:
-    """主题管理器 - 从外部CSS文件加载主题"""
+# 用户主题目录环境变量（多个目录用 os.pathsep 分隔）
+THEME_PATH_ENV = "MD2PDF_THEME_PATH"
 
-    def __init__(self):
-        self._themes: Dict[str, Theme] = {}
-        self._providers: List[ThemeProvider] = []
-        self._theme_dir = Path(__file__).parent.parent / "themes"
-        self._initialize_builtin_themes()
-
-    def _initialize_builtin_themes(self):
-        """初始化内置主题 - 从外部CSS文件加载"""
-        # GitHub主题
-        github_theme = Theme(
-            name="github",
-            display_name="GitHub",
-            description="Modern technical documentation style",
-            css_content=self._load_css_from_file("github.css")
+BUILTIN_THEME_DIR = Path(__file__).parent.parent / "themes"
+
+# 主题文件开头的注释块，可用 @name / @description 声明显示名和描述
+HEADER_COMMENT = re.compile(r'\s*/\*(.*?)\*/', re.DOTALL)
+HEADER_DIRECTIVE = re.compile(r'^[\s*]*@(name|description)\s+(.+?)\s*$', re.MULTILINE)
+THEME_NAME = re.compile(r'^[\w-]+$')
+
+
+def parse_theme_header(name: str, css: str) -> Tuple[str, str]:
+    """从主题CSS开头的注释中读取 (显示名, 描述)
+
+    未声明 @name 时使用主题名；未声明 @description 时使用注释首行。
+    """
+    match = HEADER_COMMENT.match(css)
+    if match is None:
+        return name, ""
+    comment = match.group(1)
+    directives = dict(HEADER_DIRECTIVE.findall(comment))
+    first_line = comment.strip().splitlines()[0].strip() if comment.strip() else ""
+    if first_line.startswith('@'):
+        first_line = ""
+    return directives.get('name', name), directives.get('description', first_line)
+
+
+def _read_theme_file(theme_name: str, css_path: Path) -> str:
+    """读取主题文件原文"""
+    if not css_path.exists():
+        raise ThemeLoadError(
+            theme_name=theme_name,
+            reason=f"主题文件不存在: {css_path}"
         )
-        self._themes["github"] = github_theme
-
-        # 企业主题
-        enterprise_theme = Theme(
-            name="enterprise",
-            display_name="Enterprise",
-            description="Professional business document style with corporate branding",
-            css_content=self._load_css_from_file("enterprise.css")
+
+    try:
+        with open(css_path, 'r', encoding='utf-8') as f:
+            return f.read()
+    except Exception as e:
+        raise ThemeLoadError(
+            theme_name=theme_name,
+            reason=f"读取主题文件失败: {str(e)}"
         )
-        self._themes["enterprise"] = enterprise_theme
 
-    def _load_css_from_file(self, filename: str) -> str:
-        """从文件加载CSS内容"""
-        css_path = self._theme_dir / filename
-        if not css_path.exists():
-            raise ThemeLoadError(
-                theme_name=filename.replace('.css', ''),
-                reason=f"主题文件不存在: {css_path}"
+
+class _ThemeFile:
+    """主题目录中的一个CSS文件，按 (mtime, size) 缓存加载结果"""
+
+    __slots__ = ('name', 'path', '_stamp', '_theme')
+
+    def __init__(self, name: str, path: Path):
+        self.name = name
+        self.path = path
+        self._stamp: Optional[Tuple[int, int]] = None
+        self._theme: Optional[Theme] = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._theme is not None
+
+    def load(self) -> Theme:
+        """返回主题，文件修改过则重新读取"""
+        try:
+            stat = self.path.stat()
+            stamp = (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            stamp = None
+        if self._theme is None or stamp != self._stamp:
+            css = _read_theme_file(self.name, self.path)
+            display_name, description = parse_theme_header(self.name, css)
+            self._theme = Theme(
+                name=self.name,
+                display_name=display_name,
+                description=description,
+                # 包装在<style>标签中
+                css_content=f"<style>\n{css}\n</style>"
             )
+            self._stamp = stamp
+        return self._theme
+
+
+class ThemeManager:
+    """主题管理器 - 从主题目录中的CSS文件加载主题
 
+    查找顺序：提供者注册的主题 > 后添加的用户目录 > 先添加的用户目录 > 内置目录。
+    """
+
+    def __init__(self, theme_dirs: Optional[List[Union[str, Path]]] = None):
+        self._providers: List[ThemeProvider] = []
+        # 提供者注册的主题（优先于主题文件）
+        self._provided: Dict[str, Theme] = {}
+        self._theme_dir = BUILTIN_THEME_DIR
+        # 用户主题目录，后添加的优先
+        self._user_dirs: List[Path] = []
+        # 已定位的主题文件: 主题名 -> 文件（CSS首次使用时才读取）
+        self._files: Dict[str, _ThemeFile] = {}
+        # 目录列表缓存: 目录 -> (目录mtime, 主题名列表)，目录内容变化时重新列出
+        self._listings: Dict[Path, Tuple[int, List[str]]] = {}
+        # 打印变体缓存: (主题名, 是否压平效果) -> (源CSS, 编译结果)
+        self._print_css: Dict[Tuple[str, bool], Tuple[str, str]] = {}
+
+        env_dirs = os.environ.get(THEME_PATH_ENV, "")
+        for directory in env_dirs.split(os.pathsep) + list(theme_dirs or []):
+            if directory:
+                self.add_theme_dir(directory)
+
+    def add_theme_dir(self, directory: Union[str, Path]):
+        """添加用户主题目录，其中的 ``<名称>.css`` 即为主题（同名时覆盖已有目录中的主题）"""
+        path = Path(directory).expanduser()
+        if path == self._theme_dir or path in self._user_dirs:
+            return
+        self._user_dirs.append(path)
+        # 新目录可能覆盖已定位的同名主题
+        self._files.clear()
+
+    @property
+    def theme_dirs(self) -> List[Path]:
+        """按优先级排列的主题目录"""
+        return list(reversed(self._user_dirs)) + [self._theme_dir]
+
+    def _list_dir(self, directory: Path) -> List[str]:
+        """列出目录中的主题名（按目录mtime缓存）"""
         try:
-            with open(css_path, 'r', encoding='utf-8') as f:
-                css_content = f.read()
-        except Exception as e:
-            raise ThemeLoadError(
-                theme_name=filename.replace('.css', ''),
-                reason=f"读取主题文件失败: {str(e)}"
+            mtime = directory.stat().st_mtime_ns
+        except OSError:
+            return []
+        cached = self._listings.get(directory)
+        if cached is None or cached[0] != mtime:
+            names = sorted(
+                entry.name[:-4] for entry in os.scandir(directory)
+                if entry.name.endswith('.css') and entry.is_file()
             )
+            cached = (mtime, names)
+            self._listings[directory] = cached
+        return cached[1]
+
+    def _locate(self, name: str) -> Optional[_ThemeFile]:
+        """定位主题文件，只探测各目录下的 ``<名称>.css``"""
+        entry = self._files.get(name)
+        if entry is not None and entry.path.exists():
+            return entry
+        self._files.pop(name, None)
+        if not THEME_NAME.match(name):
+            return None
+        for directory in self.theme_dirs:
+            css_path = directory / f"{name}.css"
+            if css_path.is_file():
+                entry = _ThemeFile(name, css_path)
+                self._files[name] = entry
+                return entry
+        return None
+
+    @property
+    def _themes(self) -> Dict[str, Union[Theme, _ThemeFile]]:
+        """全部主题（主题文件只定位不读取）"""
+        themes: Dict[str, Union[Theme, _ThemeFile]] = {}
+        for name in self.get_theme_names():
+            themes[name] = self._provided.get(name) or self._locate(name)
+        return themes
 
+    def _load_css_from_file(self, filename: str) -> str:
+        """从内置主题目录加载CSS内容"""
+        css = _read_theme_file(filename.replace('.css', ''), self._theme_dir / filename)
         # 包装在<style>标签中
-        return f"<style>\n{css_content}\n</style>"
-        
+        return f"<style>\n{css}\n</style>"
     
+    def has_theme(self, name: str) -> bool:
+        """主题是否存在（不读取CSS）"""
+        return name in self._provided or self._locate(name) is not None
+
     def get_theme(self, name: str) -> Theme:
-        """获取主题"""
-        if name not in self._themes:
+        """获取主题，首次使用或文件修改后读取CSS"""
+        theme = self._provided.get(name)
+        if theme is not None:
+            return theme
+        entry = self._locate(name)
+        if entry is None:
             raise ThemeNotFoundError(name)
-        return self._themes[name]
+        return entry.load()
     
     def get_theme_css(self, name: str) -> str:
         """获取主题CSS"""
         return self.get_theme(name).css_content
     
+    def get_print_theme_css(self, name: str, flatten_effects: bool = False) -> str:
+        """获取主题的打印变体CSS
+
+        去掉 :hover、transition 等打印时不生效的规则并压缩，结果按主题缓存，
+        主题被重新注册或主题文件修改（CSS内容变化）时重新编译。
+
+        Args:
+            name: 主题名
+            flatten_effects: 同时去掉阴影、将渐变背景压平为纯色
+        """
+        source = self.get_theme_css(name)
+        key = (name, flatten_effects)
+        cached = self._print_css.get(key)
+        if cached is None or cached[0] != source:
+            cached = (source, compile_print_css(source, flatten_effects=flatten_effects))
+            self._print_css[key] = cached
+        return cached[1]
+
+    def get_theme_names(self) -> List[str]:
+        """获取所有可用主题名（只列出主题目录，不读取CSS）"""
+        names = set(self._provided)
+        for directory in self.theme_dirs:
+            names.update(self._list_dir(directory))
+        return sorted(names)
+    
     def get_available_themes(self) -> List[Theme]:
-        """获取所有可用主题"""
-        return list(self._themes.values())
+        """获取所有可用主题（读取各主题CSS以获得显示名和描述）"""
+        return [self.get_theme(name) for name in self.get_theme_names()]
     
     def register_provider(self, provider: ThemeProvider):
         """注册主题提供者"""
@@ -108,5 +263,21 @@ class ThemeManager:
 
         # 加载提供者的主题
         for theme in provider.get_available_themes():
-            self._themes[theme.name] = theme
-    
+            self._provided[theme.name] = theme
+
+
+_shared_manager: Optional[ThemeManager] = None
+
+
+def get_theme_manager(theme_dirs: Optional[List[Union[str, Path]]] = None) -> ThemeManager:
+    """获取进程内共享的主题管理器
+
+    Args:
+        theme_dirs: 追加的用户主题目录（已添加的目录会被忽略）
+    """
+    global _shared_manager
+    if _shared_manager is None:
+        _shared_manager = ThemeManager()
+    for directory in theme_dirs or []:
+        _shared_manager.add_theme_dir(directory)
+    return _shared_manager
@@ -1,12 +1,14 @@
 """工具模块"""
 
 from .file_scanner import FileScanner
+from .file_watcher import FileWatcher
 from .cli_formatter import CLIFormatter
 from .dependency_checker import DependencyChecker
 from .theme_selector import interactive_theme_selection, fallback_theme_selection
 
 __all__ = [
     "FileScanner",
+    "FileWatcher",
     "CLIFormatter",
     "DependencyChecker",
     "interactive_theme_selection",
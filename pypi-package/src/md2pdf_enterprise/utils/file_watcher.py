@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+文件监视器 - 保存即重建
+=======================
+
+基于FileScanner监视Markdown文件变化，支持事件防抖。
+安装 watchdog 时使用系统文件事件（inotify/FSEvents），否则退化为轮询。
+"""
+
+import asyncio
+import fnmatch
+import hashlib
+from pathlib import Path
+from typing import AsyncIterator, Callable, Dict, List, Optional, Tuple
+
+from .file_scanner import FileScanner
+
+
+class FileWatcher:
+    """Markdown文件监视器"""
+
+    def __init__(
+        self,
+        scanner: Optional[FileScanner] = None,
+        recursive: bool = True,
+        debounce: float = 0.3,
+        poll_interval: float = 0.5,
+        exclude_patterns: Optional[List[str]] = None,
+        use_native: bool = True
+    ):
+        self.scanner = scanner or FileScanner()
+        self.recursive = recursive
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.exclude_patterns = exclude_patterns if exclude_patterns is not None else ['README.md']
+        self.use_native = use_native
+        self._digests: Dict[Path, str] = {}
+
+    @property
+    def base_dir(self) -> Path:
+        """监视的根目录"""
+        return self.scanner.base_dir.resolve()
+
+    @property
+    def backend(self) -> str:
+        """当前使用的监视后端"""
+        if self.use_native:
+            try:
+                import watchdog  # noqa: F401
+                return "watchdog"
+            except ImportError:
+                pass
+        return "polling"
+
+    def snapshot(self) -> Dict[Path, Tuple[float, int]]:
+        """获取当前Markdown文件的 (修改时间, 大小) 快照"""
+        files = self.scanner.scan_markdown_files(
+            exclude_patterns=self.exclude_patterns,
+            recursive=self.recursive
+        )
+        return {
+            f.path.resolve(): (f.modified_time.timestamp(), f.size)
+            for f in files
+        }
+
+    async def changes(self) -> AsyncIterator[List[Path]]:
+        """持续产出内容发生变化的文件批次
+
+        收到第一个事件后等待 ``debounce`` 秒内不再有新事件才产出，
+        编辑器保存时的多次写入会合并为一次重建。
+        """
+        for path in self.snapshot():
+            self._digests[path] = self._digest(path)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        if self.backend == "watchdog":
+            stop = self._start_watchdog(queue)
+        else:
+            stop = self._start_polling(queue)
+
+        try:
+            while True:
+                pending = {await queue.get()}
+                while True:
+                    try:
+                        pending.add(await asyncio.wait_for(queue.get(), self.debounce))
+                    except asyncio.TimeoutError:
+                        break
+
+                changed = [path for path in sorted(pending) if self._content_changed(path)]
+                if changed:
+                    yield changed
+        finally:
+            stop()
+
+    def _is_watched(self, path: Path) -> bool:
+        """检查路径是否属于监视范围"""
+        if path.suffix.lower() != '.md':
+            return False
+        if any(fnmatch.fnmatch(path.name, pattern) for pattern in self.exclude_patterns):
+            return False
+        if not self.recursive and path.parent != self.base_dir:
+            return False
+        return True
+
+    def _content_changed(self, path: Path) -> bool:
+        """只有内容真正变化的文件才需要重建（忽略仅触碰修改时间的保存）"""
+        if not self._is_watched(path) or not path.is_file():
+            return False
+        digest = self._digest(path)
+        if digest is None or self._digests.get(path) == digest:
+            return False
+        self._digests[path] = digest
+        return True
+
+    @staticmethod
+    def _digest(path: Path) -> Optional[str]:
+        """计算文件内容摘要"""
+        try:
+            return hashlib.sha1(path.read_bytes()).hexdigest()
+        except OSError:
+            return None
+
+    def _start_polling(self, queue: asyncio.Queue) -> Callable[[], None]:
+        """启动轮询后端"""
+
+        async def poll():
+            previous = self.snapshot()
+            while True:
+                await asyncio.sleep(self.poll_interval)
+                current = self.snapshot()
+                for path, stamp in current.items():
+                    if previous.get(path) != stamp:
+                        queue.put_nowait(path)
+                previous = current
+
+        task = asyncio.ensure_future(poll())
+        return task.cancel
+
+    def _start_watchdog(self, queue: asyncio.Queue) -> Callable[[], None]:
+        """启动watchdog后端（inotify/FSEvents/ReadDirectoryChangesW）"""
+        from watchdog.events import FileSystemEventHandler
+        from watchdog.observers import Observer
+
+        loop = asyncio.get_event_loop()
+
+        class _Handler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                if event.is_directory:
+                    return
+                # 编辑器常用“写临时文件再改名”的方式保存，同时关注目标路径
+                for attr in ('src_path', 'dest_path'):
+                    path = getattr(event, attr, None)
+                    if path:
+                        loop.call_soon_threadsafe(queue.put_nowait, Path(path).resolve())
+
+        observer = Observer()
+        observer.schedule(_Handler(), str(self.base_dir), recursive=self.recursive)
+        observer.start()
+
+        def stop():
+            observer.stop()
+            observer.join()
+
+        return stop
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+关键CSS裁剪测试
+===============
+
+测试选择器匹配条件、按文档裁剪主题规则和裁剪结果缓存
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# 添加src到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.converter import HTMLConverter
+from md2pdf_enterprise.converter.critical_css import (
+    _pruned_css,
+    document_tokens,
+    prune_theme_css,
+    selector_requirements,
+)
+from md2pdf_enterprise.core.converter_base import ConversionTask
+
+
+THEME = """<style>
+body { margin: 0; }
+h2 { color: blue; }
+pre, blockquote { border: 1px solid; }
+ul li:before { content: "▸"; }
+h2[id="3"], .module-reports-section { margin-top: 32px; }
+p:not(.lead) { color: #333; }
+@page { size: A4; @bottom-right { content: counter(page); } }
+@media print { pre { white-space: pre-wrap; } h2 + table { page-break-before: avoid; } }
+</style>"""
+
+
+class TestSelectorRequirements:
+    """选择器匹配条件测试类"""
+
+    @pytest.mark.parametrize("selector, expected", [
+        ('h2', {'h2'}),
+        ('ul li:before', {'ul', 'li'}),
+        ('h2 + table > td.num', {'h2', 'table', 'td', '.num'}),
+        ('h2[id="3"]', {'h2'}),
+        ('p:not(.lead)', {'p'}),
+        ('h1:has(+ *)', {'h1'}),
+        ('#summary .note', {'#summary', '.note'}),
+        ('body', set()),
+        ('*', set()),
+    ])
+    def test_requirements(self, selector, expected):
+        """测试伪类、属性条件视为可满足，模板元素无需匹配"""
+        assert selector_requirements(selector) == frozenset(expected)
+
+    def test_unparsable_selector(self):
+        """测试无法解析的选择器返回None"""
+        assert selector_requirements('a\\:b') is None
+
+    def test_document_tokens(self):
+        """测试提取HTML中的标签、class和id"""
+        html = '<h2 id="3" class="meeting-section first">标题</h2><P class=lead>正文</P>'
+        assert document_tokens(html) == frozenset({'h2', 'p', '#3', '.meeting-section', '.first', '.lead'})
+
+
+class TestPruneThemeCSS:
+    """主题裁剪测试类"""
+
+    def test_prune(self):
+        """测试只保留文档用到的规则，at规则内逐条裁剪"""
+        pruned = prune_theme_css(THEME, '<h2 id="2">议题</h2><ul><li>事项</li></ul>')
+
+        assert pruned == (
+            "<style>\n"
+            "body{margin:0;}h2{color:blue;}ul li:before{content:\"▸\";}h2[id=\"3\"]{margin-top:32px;}"
+            "@page{size:A4;@bottom-right{content:counter(page);}}"
+            "\n</style>"
+        )
+
+    def test_selector_list_partially_kept(self):
+        """测试选择器列表只保留匹配的选择器"""
+        pruned = prune_theme_css(THEME, '<pre><code>x</code></pre><p class="module-reports-section">p</p>')
+
+        assert "pre{border:1px solid;}" in pruned
+        assert ".module-reports-section{margin-top:32px;}" in pruned
+        assert "p:not(.lead){color:#333;}" in pruned
+        assert "@media print{pre{white-space:pre-wrap;}}" in pruned
+
+    def test_memoized_by_signature(self):
+        """测试标签/class结构相同的文档共享裁剪结果"""
+        _pruned_css.cache_clear()
+        first = prune_theme_css(THEME, '<h2 id="a">甲</h2><p>一</p>')
+        second = prune_theme_css(THEME, '<h2 id="b">乙</h2><p>二</p><span class="unused">三</span>')
+
+        assert first == second
+        assert _pruned_css.cache_info().hits == 1
+
+    def test_unwrapped_css_unchanged(self):
+        """测试非<style>包装的主题原样返回"""
+        css = '<link rel="stylesheet" href="theme.css">'
+        assert prune_theme_css(css, '<p>x</p>') == css
+
+    @pytest.mark.asyncio
+    async def test_converter_prunes_theme(self, tmp_path):
+        """测试转换时按文档裁剪主题，可通过配置关闭"""
+        converter = HTMLConverter()
+        converter.config_manager.config_file = tmp_path / "config.json"
+        source = tmp_path / "minutes.md"
+        source.write_text("# 会议纪要\n\n正文\n", encoding='utf-8')
+
+        task = ConversionTask(source=source, target=tmp_path / "pruned.html", theme="enterprise")
+        assert (await converter.convert_single(task)).success
+        assert "blockquote" not in task.target.read_text(encoding='utf-8')
+
+        converter.config_manager.override(prune_theme_css=False)
+        task = ConversionTask(source=source, target=tmp_path / "full.html", theme="enterprise")
+        assert (await converter.convert_single(task)).success
+        assert "blockquote" in task.target.read_text(encoding='utf-8')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
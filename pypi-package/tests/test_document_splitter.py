@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+文档分段测试
+============
+
+测试大文档按章节拆分与PDF片段合并
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# 添加src到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.converter.pdf_converter import PDFConverter
+from md2pdf_enterprise.converter.document_splitter import (
+    split_html_sections,
+    SECTION_LINK_PREFIX
+)
+from md2pdf_enterprise.converter.pdf_merger import merge_section_pdfs
+
+
+@pytest.fixture
+def converter():
+    """创建转换器实例"""
+    return PDFConverter()
+
+
+@pytest.fixture
+def long_html(converter):
+    """生成带目录链接的多章节HTML"""
+    markdown_text = (
+        "# 年度会议纪要\n\n"
+        "[跳转到第二次会议](#第二次会议)\n\n"
+        "## 第一次会议\n\n内容一\n\n| 列1 | 列2 |\n|---|---|\n| a | b |\n\n"
+        "## 第二次会议\n\n内容二\n\n### 行动项目\n\n- 任务A\n"
+    )
+    return converter._convert_markdown_to_html(markdown_text)
+
+
+class TestDocumentSplitter:
+    """文档分段测试类"""
+
+    def test_split_at_top_level_headings(self, long_html):
+        """测试按h1/h2拆分"""
+        sections = split_html_sections(long_html)
+
+        assert [section.title for section in sections] == ["年度会议纪要", "第一次会议", "第二次会议"]
+        assert [section.level for section in sections] == ["h1", "h2", "h2"]
+        # h3 不触发拆分
+        assert "行动项目" in sections[2].html
+
+    def test_tables_stay_inside_section(self, long_html):
+        """测试表格不被截断"""
+        sections = split_html_sections(long_html)
+        assert "<table>" in sections[1].html
+        assert "</table>" in sections[1].html
+
+    def test_cross_section_links_rewritten(self, long_html):
+        """测试跨章节链接改写"""
+        sections = split_html_sections(long_html)
+
+        assert SECTION_LINK_PREFIX in sections[0].html
+        assert "第二次会议" in sections[2].ids
+        # 目标章节补充了隐藏链接，保证生成命名目标
+        assert "hidden" in sections[2].html
+
+    def test_document_without_headings(self):
+        """测试无标题文档保持为单个章节"""
+        sections = split_html_sections("<p>正文</p>")
+        assert len(sections) == 1
+        assert sections[0].title == ""
+        assert sections[0].level is None
+
+    def test_should_split_threshold(self, converter, long_html):
+        """测试分段阈值"""
+        config = converter.config_manager.get_config()
+        assert converter._should_split(long_html) is False
+
+        config.split_large_documents = True
+        config.split_threshold_kb = 0
+        assert converter._should_split(long_html) is True
+
+        config.split_threshold_kb = 1024
+        assert converter._should_split(long_html) is False
+
+
+class TestPDFMerger:
+    """PDF合并测试类"""
+
+    def test_merge_keeps_order_and_outline(self, long_html, tmp_path):
+        """测试合并页序与书签"""
+        pypdf = pytest.importorskip("pypdf")
+
+        sections = split_html_sections(long_html)
+        fragments = []
+        for section in sections:
+            writer = pypdf.PdfWriter()
+            for _ in range(section.index + 1):
+                writer.add_blank_page(200, 200)
+            fragment = tmp_path / f"section-{section.index}.pdf"
+            with open(fragment, 'wb') as f:
+                writer.write(f)
+            fragments.append(fragment)
+
+        output = tmp_path / "merged.pdf"
+        start_pages = merge_section_pdfs(sections, fragments, output)
+
+        assert start_pages == [0, 1, 3]
+        reader = pypdf.PdfReader(str(output))
+        assert len(reader.pages) == 6
+        assert reader.outline[0].title == "年度会议纪要"
+        assert [item.title for item in reader.outline[1]] == ["第一次会议", "第二次会议"]
+
+    def test_merge_page_limit(self, long_html, tmp_path):
+        """测试页数限制作用于合并后的整篇文档"""
+        pypdf = pytest.importorskip("pypdf")
+
+        sections = split_html_sections(long_html)
+        fragments = []
+        for section in sections:
+            writer = pypdf.PdfWriter()
+            for _ in range(3):
+                writer.add_blank_page(200, 200)
+            fragment = tmp_path / f"section-{section.index}.pdf"
+            with open(fragment, 'wb') as f:
+                writer.write(f)
+            fragments.append(fragment)
+
+        output = tmp_path / "merged.pdf"
+        start_pages = merge_section_pdfs(sections, fragments, output, page_limit=4)
+
+        assert start_pages == [0, 3]
+        reader = pypdf.PdfReader(str(output))
+        assert len(reader.pages) == 4
+        assert reader.outline[0].title == "年度会议纪要"
+        assert [item.title for item in reader.outline[1]] == ["第一次会议"]
+
+
+class FakeBrowser:
+    """不启动Chromium的浏览器替身"""
+
+    async def close(self):
+        pass
+
+
+class TestDraftPageLimit:
+    """分段渲染下的页数限制测试类"""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("incremental", [False, True])
+    async def test_draft_limits_merged_pages(self, monkeypatch, tmp_path, incremental):
+        """测试draft档位下分段/增量渲染合并后的文档不超过10页"""
+        pypdf = pytest.importorskip("pypdf")
+        converter = PDFConverter()
+        converter.config_manager.override(
+            render_profile="draft", split_large_documents=True, incremental=incremental
+        )
+        page_ranges = []
+
+        async def fake_launch():
+            return FakeBrowser()
+
+        async def fake_render(browser, html_content, output_path, pdf_options, thumbnails='none'):
+            # 每个章节渲染为4页
+            page_ranges.append(pdf_options.get('pageRanges'))
+            writer = pypdf.PdfWriter()
+            for _ in range(4):
+                writer.add_blank_page(200, 200)
+            with open(output_path, 'wb') as f:
+                writer.write(f)
+            return []
+
+        monkeypatch.setattr(converter, "_launch_browser", fake_launch)
+        monkeypatch.setattr(converter, "_render_page", fake_render)
+
+        markdown_text = "".join(f"## 第{i}次会议\n\n内容{i}\n\n" for i in range(1, 6))
+        html = converter._convert_markdown_to_html(markdown_text)
+        theme_css = converter.theme_manager.get_theme_css("enterprise")
+        output = tmp_path / "minutes.pdf"
+        if incremental:
+            await converter._convert_sections_incremental(html, "minutes", theme_css, output, {})
+        else:
+            await converter._convert_sections_to_pdf(html, "minutes", theme_css, output, {})
+
+        assert len(page_ranges) == 5
+        assert len(pypdf.PdfReader(str(output)).pages) == 10
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+文档类型识别测试
+================
+
+测试特征匹配的识别结果、提前结束和预处理插件
+"""
+
+import re
+
+import pytest
+from pathlib import Path
+import sys
+
+# 添加src到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.converter import HTMLConverter
+from md2pdf_enterprise.converter.document_types import (
+    DOCUMENT_FEATURES,
+    DocumentProcessor,
+    DocumentTypeDetector,
+    WorkSummaryProcessor,
+)
+from md2pdf_enterprise.converter.pdf_converter import PDFConverter
+from md2pdf_enterprise.core.converter_base import ConversionTask
+
+
+WORK_SUMMARY = (
+    "# 2024年度工作总结\n\n姓名：张三\n\n## 年度成果概览\n\n"
+    "- [版本发布](#一版本发布)\n\n## 一、版本发布\n\n| 版本 | 数量 |\n|---|---|\n| V1 | 4个 |\n"
+)
+
+MEETING_MINUTES = "# 项目例会会议纪要\n\n会议时间：2025-11-24\n\n## 参会人员\n\n## 决策事项\n"
+
+
+def reference_scores(content):
+    """逐个特征全文搜索的原始算法，作为对照"""
+    scores = {}
+    for doc_type, features in DOCUMENT_FEATURES.items():
+        scores[doc_type] = (
+            3 * sum(1 for p in features['must_have'] if re.search(p, content, re.MULTILINE))
+            + sum(1 for p in features['should_have'] if re.search(p, content, re.MULTILINE))
+        )
+    return scores
+
+
+@pytest.fixture
+def detector():
+    return DocumentTypeDetector()
+
+
+class TestDocumentTypeDetector:
+    """文档类型识别测试类"""
+
+    @pytest.mark.parametrize("content, expected", [
+        (WORK_SUMMARY, 'work-summary'),
+        (MEETING_MINUTES, 'meeting-minutes'),
+        ("# 普通文档\n\n正文内容\n", 'generic'),
+        ("只提到会议纪要和行动计划\n", 'generic'),
+        ("", 'generic'),
+    ])
+    def test_detect(self, detector, content, expected):
+        """测试识别结果"""
+        assert detector.detect(content) == expected
+
+    def test_full_scores_match_reference(self, detector):
+        """测试完整检查的得分与逐个搜索一致"""
+        for content in (WORK_SUMMARY, MEETING_MINUTES, WORK_SUMMARY + MEETING_MINUTES, "工作总结 会议时间"):
+            assert detector.scores(content) == reference_scores(content)
+
+    def test_features_starting_at_same_position(self):
+        """测试同一位置开始的多个特征都被计分"""
+        detector = DocumentTypeDetector({'demo': {'must_have': ['会议'], 'should_have': ['会议纪要']}})
+        assert detector.scores("会议纪要") == {'demo': 4}
+
+    def test_feature_inside_other_match(self):
+        """测试包含在其他特征命中范围内的特征也被计分"""
+        detector = DocumentTypeDetector({'demo': {'must_have': ['会议纪要'], 'should_have': ['纪要', '^会议']}})
+        assert detector.scores("会议纪要") == {'demo': 5}
+
+    def test_multiline_anchor(self, detector):
+        """测试行首特征只匹配行首（含原文开头）"""
+        assert detector.scores("正文 ## 一、标题")['work-summary'] == 0
+        assert detector.scores("正文\n## 一、标题")['work-summary'] == 1
+        assert detector.scores("## 一、标题")['work-summary'] == 1
+
+    def test_early_exit(self, detector):
+        """测试结果确定后停止检查"""
+        content = WORK_SUMMARY + "\n" + "正文\n" * 1000 + "会议时间：下周一\n"
+        # 工作总结两个必须特征命中且缺少“参会人员”后，会议纪要最多同分，不再检查“会议时间”
+        assert detector.scores(content, early_exit=True)['meeting-minutes'] == 0
+        assert detector.scores(content)['meeting-minutes'] == 3
+        assert detector.detect(content) == 'work-summary'
+
+    def test_tie_prefers_first_declared_type(self, detector):
+        """测试同分时取先声明的类型"""
+        assert detector.detect("年度成果概览\n参会人员\n") == 'work-summary'
+
+
+class TestWorkSummaryProcessor:
+    """工作总结预处理测试类"""
+
+    def test_process(self):
+        """测试锚点修复、分页标记和数量列简化"""
+        content = WorkSummaryProcessor().process(WORK_SUMMARY, {})
+
+        assert "(#一、版本发布)" in content
+        assert '<div style="page-break-before: always;"></div>\n\n## 一、版本发布' in content
+        assert "| V1 | 4 |" in content
+
+    def test_existing_page_break_kept(self):
+        """测试已有分页标记时不重复添加"""
+        content = '正文\n<div style="page-break-before: always;"></div>\n## 一、版本发布\n'
+        assert WorkSummaryProcessor().process(content, {}).count('page-break') == 1
+
+
+class TestPreprocessStage:
+    """转换器预处理阶段测试类"""
+
+    @pytest.fixture
+    def converter(self, tmp_path):
+        converter = HTMLConverter()
+        converter.config_manager.config_file = tmp_path / "config.json"
+        return converter
+
+    @pytest.mark.asyncio
+    async def test_detected_type_applied(self, converter, tmp_path):
+        """测试转换时自动识别并应用插件"""
+        source = tmp_path / "summary.md"
+        source.write_text(WORK_SUMMARY, encoding='utf-8')
+        task = ConversionTask(source=source, target=tmp_path / "summary.html")
+
+        result = await converter.convert_single(task)
+
+        assert result.success, result.error_message
+        assert result.doc_type == 'work-summary'
+        assert "page-break-before" in task.target.read_text(encoding='utf-8')
+
+    @pytest.mark.asyncio
+    async def test_registered_plugin_and_override(self, converter, tmp_path):
+        """测试注册插件并通过任务选项指定类型"""
+        class StampProcessor(DocumentProcessor):
+            doc_type = 'stamp'
+
+            def process(self, content, metadata):
+                return content + f"\n\n{metadata['stamp']}\n"
+
+        converter.register_processor(StampProcessor())
+        source = tmp_path / "doc.md"
+        source.write_text("# 文档\n", encoding='utf-8')
+        task = ConversionTask(
+            source=source, target=tmp_path / "doc.html",
+            options={'doc_type': 'stamp', 'metadata': {'stamp': '已审核'}}
+        )
+
+        result = await converter.convert_single(task)
+
+        assert result.doc_type == 'stamp'
+        assert "已审核" in task.target.read_text(encoding='utf-8')
+
+    @pytest.mark.asyncio
+    async def test_processing_disabled(self, converter, tmp_path):
+        """测试关闭预处理"""
+        converter.config_manager.override(document_processing=False)
+        source = tmp_path / "summary.md"
+        source.write_text(WORK_SUMMARY, encoding='utf-8')
+        task = ConversionTask(source=source, target=tmp_path / "summary.html")
+
+        result = await converter.convert_single(task)
+
+        assert result.doc_type is None
+        assert "page-break-before" not in task.target.read_text(encoding='utf-8')
+
+    def test_preprocess_options_not_passed_to_pdf(self):
+        """测试预处理选项不进入page.pdf参数"""
+        pdf_options = PDFConverter()._build_pdf_options({'doc_type': 'generic', 'metadata': {}, 'scale': 0.8})
+        assert 'doc_type' not in pdf_options
+        assert 'metadata' not in pdf_options
+        assert pdf_options['scale'] == 0.8
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
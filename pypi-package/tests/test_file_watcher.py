@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+文件监视器测试
+==============
+
+测试watch模式的变化检测与防抖
+"""
+
+import asyncio
+import pytest
+from pathlib import Path
+import sys
+
+# 添加src到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.utils import FileScanner, FileWatcher
+
+
+@pytest.fixture
+def watch_dir(tmp_path):
+    """创建带Markdown文件的监视目录"""
+    (tmp_path / "a.md").write_text("# A\n", encoding="utf-8")
+    (tmp_path / "b.md").write_text("# B\n", encoding="utf-8")
+    (tmp_path / "README.md").write_text("# Readme\n", encoding="utf-8")
+    return tmp_path
+
+
+@pytest.fixture
+def watcher(watch_dir):
+    """创建轮询模式的监视器"""
+    return FileWatcher(
+        FileScanner(watch_dir),
+        debounce=0.1,
+        poll_interval=0.05,
+        use_native=False
+    )
+
+
+async def next_batch(changes, timeout: float = 3.0):
+    """获取下一批变化文件"""
+    return await asyncio.wait_for(changes.__anext__(), timeout)
+
+
+class TestFileWatcher:
+    """文件监视器测试类"""
+
+    def test_snapshot_respects_excludes(self, watcher, watch_dir):
+        """测试快照排除README"""
+        names = sorted(path.name for path in watcher.snapshot())
+        assert names == ["a.md", "b.md"]
+        assert watcher.backend == "polling"
+
+    @pytest.mark.asyncio
+    async def test_detects_changed_file(self, watcher, watch_dir):
+        """测试检测到修改的文件"""
+        changes = watcher.changes()
+        pending = asyncio.ensure_future(next_batch(changes))
+        await asyncio.sleep(0.1)
+
+        (watch_dir / "a.md").write_text("# A 修改\n", encoding="utf-8")
+
+        batch = await pending
+        assert [path.name for path in batch] == ["a.md"]
+        await changes.aclose()
+
+    @pytest.mark.asyncio
+    async def test_debounce_merges_rapid_saves(self, watcher, watch_dir):
+        """测试连续保存合并为一次重建"""
+        changes = watcher.changes()
+        pending = asyncio.ensure_future(next_batch(changes))
+        await asyncio.sleep(0.1)
+
+        for i in range(3):
+            (watch_dir / "a.md").write_text(f"# A {i}\n", encoding="utf-8")
+            (watch_dir / "b.md").write_text(f"# B {i}\n", encoding="utf-8")
+            await asyncio.sleep(0.06)
+
+        batch = await pending
+        assert sorted(path.name for path in batch) == ["a.md", "b.md"]
+        await changes.aclose()
+
+    def test_unchanged_content_is_ignored(self, watcher, watch_dir):
+        """测试仅修改时间变化不触发重建"""
+        path = (watch_dir / "a.md").resolve()
+        watcher._digests[path] = watcher._digest(path)
+        assert watcher._content_changed(path) is False
+
+        path.write_text("# A 新内容\n", encoding="utf-8")
+        assert watcher._content_changed(path) is True
+        assert watcher._content_changed((watch_dir / "README.md").resolve()) is False
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
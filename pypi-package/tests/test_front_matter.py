@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Front Matter读取测试
+====================
+
+测试只读取文件头部的元数据解析，以及转换时的主题、文档类型选择
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# 添加src到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.converter import HTMLConverter, read_front_matter
+from md2pdf_enterprise.converter.front_matter import MAX_FRONT_MATTER_BYTES, read_document
+from md2pdf_enterprise.core.converter_base import ConversionTask
+
+
+HEADER = "---\ntitle: \"年度总结\"\ndoc_type: work-summary\ntheme: enterprise\ntoc: yes\n# 注释\n---\n"
+
+
+class TestReadFrontMatter:
+    """Front Matter读取测试类"""
+
+    def test_read_metadata(self, tmp_path):
+        """测试解析键值、去引号、布尔值和注释"""
+        source = tmp_path / "doc.md"
+        source.write_text(HEADER + "# 正文\n", encoding='utf-8')
+
+        front_matter = read_front_matter(source)
+
+        assert front_matter.present
+        assert front_matter.metadata == {
+            'title': '年度总结', 'doc_type': 'work-summary', 'theme': 'enterprise', 'toc': True
+        }
+        assert front_matter.body_offset == len(HEADER.encode('utf-8'))
+
+    def test_body_not_decoded(self, tmp_path):
+        """测试只读取头部：正文不是合法UTF-8也不影响"""
+        source = tmp_path / "archive.md"
+        source.write_bytes(HEADER.encode('utf-8') + b'\xff\xfe' * 1024)
+
+        assert read_front_matter(source).metadata['doc_type'] == 'work-summary'
+
+    @pytest.mark.parametrize("content", [
+        "# 没有Front Matter\n\n---\n\nkey: value\n",
+        "---\ntitle: 未闭合\n\n正文\n",
+        "",
+    ])
+    def test_without_front_matter(self, tmp_path, content):
+        """测试没有（或未闭合的）Front Matter时整篇都是正文"""
+        source = tmp_path / "doc.md"
+        source.write_text(content, encoding='utf-8')
+
+        front_matter, body = read_document(source)
+
+        assert not front_matter.present
+        assert front_matter.metadata == {}
+        assert body == content
+
+    def test_oversized_header_ignored(self, tmp_path):
+        """测试头部超过上限时不继续读取"""
+        source = tmp_path / "doc.md"
+        source.write_text("---\n" + "x: y\n" * MAX_FRONT_MATTER_BYTES + "---\n", encoding='utf-8')
+
+        assert not read_front_matter(source).present
+
+    def test_read_document_body(self, tmp_path):
+        """测试正文从偏移处读取，支持BOM和CRLF换行"""
+        source = tmp_path / "doc.md"
+        source.write_bytes(b'\xef\xbb\xbf---\r\ntheme: github\r\n---\r\n# \xe6\xa0\x87\xe9\xa2\x98\r\n\r\n\xe6\xad\xa3\xe6\x96\x87\r\n')
+
+        front_matter, body = read_document(source)
+
+        assert front_matter.metadata == {'theme': 'github'}
+        assert body == "# 标题\n\n正文\n"
+
+
+class TestConverterFrontMatter:
+    """转换时使用Front Matter测试类"""
+
+    @pytest.fixture
+    def converter(self, tmp_path):
+        converter = HTMLConverter()
+        converter.config_manager.config_file = tmp_path / "config.json"
+        return converter
+
+    @pytest.mark.asyncio
+    async def test_theme_and_doc_type_from_front_matter(self, converter, tmp_path):
+        """测试未指定主题时使用Front Matter中的主题和文档类型，且不输出Front Matter"""
+        source = tmp_path / "summary.md"
+        source.write_text(HEADER + "# 总结\n\n正文内容\n", encoding='utf-8')
+        task = ConversionTask(source=source, target=tmp_path / "summary.html", theme=None)
+
+        result = await converter.convert_single(task)
+
+        assert result.success, result.error_message
+        assert task.theme == 'enterprise'
+        assert result.doc_type == 'work-summary'
+        html = task.target.read_text(encoding='utf-8')
+        assert "doc_type" not in html
+        assert "正文内容" in html
+
+    @pytest.mark.asyncio
+    async def test_explicit_options_win(self, converter, tmp_path):
+        """测试任务指定的主题和文档类型优先于Front Matter"""
+        source = tmp_path / "summary.md"
+        source.write_text(HEADER + "# 总结\n", encoding='utf-8')
+        task = ConversionTask(
+            source=source, target=tmp_path / "summary.html",
+            theme='github', options={'doc_type': 'generic'}
+        )
+
+        result = await converter.convert_single(task)
+
+        assert task.theme == 'github'
+        assert result.doc_type == 'generic'
+
+    @pytest.mark.asyncio
+    async def test_default_theme_without_front_matter(self, converter, tmp_path):
+        """测试没有Front Matter时使用配置的默认主题"""
+        source = tmp_path / "doc.md"
+        source.write_text("# 文档\n", encoding='utf-8')
+        task = ConversionTask(source=source, target=tmp_path / "doc.html", theme=None)
+
+        result = await converter.convert_single(task)
+
+        assert result.success, result.error_message
+        assert task.theme == converter.config_manager.get_config().theme
+
+    @pytest.mark.asyncio
+    async def test_unknown_front_matter_theme(self, converter, tmp_path):
+        """测试Front Matter中的主题不存在时转换失败"""
+        source = tmp_path / "doc.md"
+        source.write_text("---\ntheme: missing\n---\n# 文档\n", encoding='utf-8')
+        task = ConversionTask(source=source, target=tmp_path / "doc.html", theme=None)
+
+        result = await converter.convert_single(task)
+
+        assert not result.success
+        assert "missing" in result.error_message
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
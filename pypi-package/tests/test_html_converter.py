@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+HTML转换器测试
+==============
+
+测试无浏览器的HTML输出
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# 添加src到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.app import MarkdownToPDFApp
+from md2pdf_enterprise.converter import ConverterFactory, HTMLConverter
+from md2pdf_enterprise.core.converter_base import ConversionTask
+
+
+@pytest.fixture
+def converter(monkeypatch):
+    """创建HTML转换器，启动浏览器即视为失败"""
+    converter = HTMLConverter()
+
+    async def forbidden_launch():
+        raise AssertionError("HTML输出不应启动浏览器")
+
+    monkeypatch.setattr(converter, "_launch_browser", forbidden_launch)
+    return converter
+
+
+class TestHTMLConverter:
+    """HTML转换器测试类"""
+
+    def test_registered_in_factory(self):
+        """测试工厂注册"""
+        assert 'html' in ConverterFactory.get_available_converters()
+        assert isinstance(ConverterFactory.create_converter('html'), HTMLConverter)
+
+    @pytest.mark.asyncio
+    async def test_convert_single(self, converter, tmp_path):
+        """测试输出带主题CSS的完整HTML"""
+        source = tmp_path / "minutes.md"
+        source.write_text("# 会议纪要\n\n## 1. 会议基本信息\n\n| 项目 | 内容 |\n|---|---|\n| 时间 | 10:00 |\n", encoding='utf-8')
+        target = tmp_path / "minutes.html"
+
+        result = await converter.convert_single(ConversionTask(source=source, target=target, theme="enterprise"))
+
+        assert result.success, result.error_message
+        html = target.read_text(encoding='utf-8')
+        assert html.startswith("<!DOCTYPE html>")
+        assert "<style>" in html
+        assert "first-page-section" in html
+        assert result.thumbnails == []
+
+    @pytest.mark.asyncio
+    async def test_local_images_inlined(self, converter, tmp_path):
+        """测试本地图片内嵌，远程图片保持原样"""
+        (tmp_path / "images").mkdir()
+        (tmp_path / "images" / "logo.png").write_bytes(b"\x89PNG\r\n\x1a\n")
+        source = tmp_path / "doc.md"
+        source.write_text(
+            "![logo](images/logo.png)\n\n![remote](https://example.com/a.png)\n",
+            encoding='utf-8'
+        )
+        target = tmp_path / "out" / "doc.html"
+
+        result = await converter.convert_single(ConversionTask(source=source, target=target, theme="github"))
+
+        assert result.success, result.error_message
+        html = target.read_text(encoding='utf-8')
+        assert "data:image/png;base64," in html
+        assert "https://example.com/a.png" in html
+
+    @pytest.mark.asyncio
+    async def test_batch(self, converter, tmp_path):
+        """测试批量转换"""
+        tasks = []
+        for index in range(5):
+            source = tmp_path / f"doc{index}.md"
+            source.write_text(f"# 文档 {index}\n", encoding='utf-8')
+            tasks.append(ConversionTask(source=source, target=source.with_suffix('.html'), theme="github"))
+
+        results = await converter.convert_batch(tasks)
+        assert all(result.success for result in results)
+        assert all(task.target.exists() for task in tasks)
+
+    def test_app_default_suffix(self, tmp_path):
+        """测试应用按转换器类型选择输出扩展名"""
+        app = MarkdownToPDFApp(str(tmp_path / "config.json"), converter_type='html')
+        assert app.initialize()
+        task = app.create_conversion_task(str(tmp_path / "doc.md"))
+        assert task.target.suffix == ".html"
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+页面缩略图测试
+==============
+
+测试PDF旁缩略图的分页截图、写入与增量缓存
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# 添加src到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.converter.pdf_converter import PDFConverter
+from md2pdf_enterprise.converter.page_thumbnails import (
+    css_length_to_px,
+    page_content_box,
+    thumbnail_path,
+    find_thumbnails,
+    write_thumbnails
+)
+from md2pdf_enterprise.core.exceptions import ConfigurationError
+
+
+MINUTES = (
+    "# 项目例会\n\n"
+    "## 1. 会议基本信息\n\n会议时间 2025-11-14\n\n"
+    "## 2. 参会人员\n\n- 张三\n- 李四\n"
+)
+
+
+class FakePage:
+    """记录截图调用的页面替身"""
+
+    def __init__(self, scroll_height):
+        self.scroll_height = scroll_height
+        self.viewports = []
+        self.clips = []
+        self.media = None
+
+    async def emulateMedia(self, media):
+        self.media = media
+
+    async def setViewport(self, viewport):
+        self.viewports.append(viewport)
+
+    async def evaluate(self, script):
+        return self.scroll_height
+
+    async def screenshot(self, options):
+        self.clips.append(options['clip'])
+        return b"png-%d" % len(self.clips)
+
+
+class FakeBrowser:
+    """不启动Chromium的浏览器替身"""
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def converter():
+    """创建转换器实例"""
+    return PDFConverter()
+
+
+class TestThumbnailHelpers:
+    """缩略图辅助函数测试类"""
+
+    def test_css_length_to_px(self):
+        """测试CSS长度换算"""
+        assert css_length_to_px("1in") == 96
+        assert css_length_to_px("25.4mm") == pytest.approx(96)
+        assert css_length_to_px("12px") == 12
+        assert css_length_to_px("auto") == 0
+
+    def test_page_content_box(self):
+        """测试内容区尺寸扣除页边距"""
+        full_width, full_height = page_content_box("A4", {})
+        width, height = page_content_box("A4", {"left": "15mm", "right": "15mm", "top": "20mm"})
+        assert full_width == 793
+        assert width < full_width
+        assert height < full_height
+
+    def test_write_removes_stale_pages(self, tmp_path):
+        """测试写入缩略图时清理多余旧页面"""
+        output = tmp_path / "minutes.pdf"
+        write_thumbnails(output, [b"1", b"2", b"3"])
+        assert len(find_thumbnails(output)) == 3
+
+        written = write_thumbnails(output, [b"new"])
+        assert written == [thumbnail_path(output, 1)]
+        assert find_thumbnails(output) == written
+        assert written[0].name == "minutes.page-001.png"
+        assert written[0].read_bytes() == b"new"
+
+
+class TestThumbnailCapture:
+    """页面截图测试类"""
+
+    @pytest.mark.asyncio
+    async def test_capture_first_page(self, converter):
+        """测试只截取首页并在浏览器内缩放"""
+        page = FakePage(scroll_height=5000)
+        images = await converter._capture_thumbnails(page, 'first')
+
+        assert images == [b"png-1"]
+        assert page.media == 'print'
+        width, _ = page_content_box("A4", converter.config_manager.get_config().margins)
+        assert page.viewports[0]['deviceScaleFactor'] == pytest.approx(320 / width)
+
+    @pytest.mark.asyncio
+    async def test_capture_all_pages(self, converter):
+        """测试按内容区高度分页截图"""
+        _, height = page_content_box("A4", converter.config_manager.get_config().margins)
+        page = FakePage(scroll_height=height * 2 + 10)
+        images = await converter._capture_thumbnails(page, 'all')
+
+        assert len(images) == 3
+        assert [clip['y'] for clip in page.clips] == [0, height, height * 2]
+        # 视口拉高到覆盖全部页面
+        assert page.viewports[-1]['height'] == height * 3
+
+    @pytest.mark.asyncio
+    async def test_capture_respects_page_limit(self, converter):
+        """测试draft档位的页数限制"""
+        converter.config_manager.override(render_profile="draft")
+        _, height = page_content_box("A4", converter.config_manager.get_config().margins)
+        page = FakePage(scroll_height=height * 30)
+        images = await converter._capture_thumbnails(page, 'all')
+        assert len(images) == 10
+
+    def test_unknown_mode(self, converter):
+        """测试未知缩略图模式"""
+        converter.config_manager.override(thumbnails="middle")
+        with pytest.raises(ConfigurationError):
+            converter._thumbnail_mode()
+
+
+class TestIncrementalThumbnails:
+    """增量渲染缩略图测试类"""
+
+    @pytest.mark.asyncio
+    async def test_first_page_thumbnail_cached(self, converter, tmp_path, monkeypatch):
+        """测试首页缩略图随章节片段缓存"""
+        pypdf = pytest.importorskip("pypdf")
+        converter.config_manager.override(incremental=True, thumbnails="first")
+        rendered = []
+
+        async def fake_launch():
+            return FakeBrowser()
+
+        async def fake_render(browser, html_content, output_path, pdf_options, thumbnails='none'):
+            rendered.append(thumbnails)
+            writer = pypdf.PdfWriter()
+            writer.add_blank_page(200, 200)
+            with open(output_path, 'wb') as f:
+                writer.write(f)
+            return [] if thumbnails == 'none' else [b"first-page"]
+
+        monkeypatch.setattr(converter, "_launch_browser", fake_launch)
+        monkeypatch.setattr(converter, "_render_page", fake_render)
+
+        output = tmp_path / "minutes.pdf"
+        html = converter._convert_markdown_to_html(MINUTES)
+        theme_css = converter.theme_manager.get_theme_css("enterprise")
+
+        await converter._convert_sections_incremental(html, "minutes", theme_css, output, {})
+        assert rendered == ['first', 'none', 'none']
+        assert [path.read_bytes() for path in find_thumbnails(output)] == [b"first-page"]
+
+        # 缩略图被删除后从缓存恢复，无需重新渲染
+        find_thumbnails(output)[0].unlink()
+        rendered.clear()
+        edited = converter._convert_markdown_to_html(MINUTES.replace("李四", "王五"))
+        await converter._convert_sections_incremental(edited, "minutes", theme_css, output, {})
+        assert rendered == ['none']
+        assert [path.read_bytes() for path in find_thumbnails(output)] == [b"first-page"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+渲染档位测试
+============
+
+测试 draft/standard/print 渲染档位配置
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# 添加src到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.core.config_manager import ConfigManager, RENDER_PROFILES
+from md2pdf_enterprise.core.exceptions import ConfigurationError
+from md2pdf_enterprise.converter.pdf_converter import PDFConverter
+
+
+@pytest.fixture
+def config_manager(tmp_path):
+    """创建使用临时配置文件的配置管理器"""
+    return ConfigManager(tmp_path / ".md2pdf_config.json")
+
+
+class TestRenderProfiles:
+    """渲染档位测试类"""
+
+    def test_default_profile(self, config_manager):
+        """测试默认使用standard档位"""
+        profile = config_manager.get_render_profile()
+        assert profile.name == "standard"
+        assert profile.wait_strategy == "images"
+        assert profile.settle_delay == 0
+
+    def test_builtin_profiles(self, config_manager):
+        """测试内置档位"""
+        names = [profile.name for profile in config_manager.get_render_profiles()]
+        assert names == ["draft", "standard", "print"]
+        assert RENDER_PROFILES["draft"].device_scale_factor < RENDER_PROFILES["print"].device_scale_factor
+        assert RENDER_PROFILES["draft"].wait_strategy == "none"
+
+    def test_unknown_profile(self, config_manager):
+        """测试未知档位"""
+        with pytest.raises(ConfigurationError):
+            config_manager.get_render_profile("ultra")
+
+    def test_override_profile(self, config_manager):
+        """测试临时切换档位不写入配置文件"""
+        config_manager.override(render_profile="draft")
+        assert config_manager.get_render_profile().name == "draft"
+        assert not config_manager.config_file.exists()
+
+    def test_draft_pdf_options(self):
+        """测试draft档位的PDF参数"""
+        converter = PDFConverter()
+        converter.config_manager.override(render_profile="draft")
+        pdf_options = converter._build_pdf_options({})
+
+        assert pdf_options['printBackground'] is False
+        assert pdf_options['pageRanges'] == "1-10"
+
+    def test_standard_pdf_options(self):
+        """测试standard档位的PDF参数"""
+        converter = PDFConverter()
+        converter.config_manager.override(render_profile="standard")
+        pdf_options = converter._build_pdf_options({})
+
+        assert pdf_options['printBackground'] is True
+        assert 'pageRanges' not in pdf_options
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
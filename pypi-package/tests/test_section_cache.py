@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+章节增量渲染测试
+================
+
+测试章节指纹缓存与增量重新渲染
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# 添加src到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.converter.pdf_converter import PDFConverter
+from md2pdf_enterprise.converter.section_cache import SectionCache
+
+
+MINUTES = (
+    "# 项目例会\n\n"
+    "## 1. 会议基本信息\n\n会议时间 2025-11-14\n\n"
+    "## 2. 参会人员\n\n- 张三\n- 李四\n\n"
+    "## 3. 各模块进展\n\n### 3.2 硬件测试\n\n进展顺利\n"
+)
+
+
+class FakeBrowser:
+    """不启动Chromium的浏览器替身"""
+
+    async def close(self):
+        pass
+
+
+@pytest.fixture
+def converter(monkeypatch):
+    """创建记录渲染次数的转换器"""
+    pypdf = pytest.importorskip("pypdf")
+    converter = PDFConverter()
+    converter.config_manager.override(incremental=True)
+    converter.rendered = []
+
+    async def fake_launch():
+        return FakeBrowser()
+
+    async def fake_render(browser, html_content, output_path, pdf_options, thumbnails='none'):
+        converter.rendered.append(html_content)
+        writer = pypdf.PdfWriter()
+        writer.add_blank_page(200, 200)
+        with open(output_path, 'wb') as f:
+            writer.write(f)
+        return [] if thumbnails == 'none' else [html_content.encode('utf-8')]
+
+    monkeypatch.setattr(converter, "_launch_browser", fake_launch)
+    monkeypatch.setattr(converter, "_render_page", fake_render)
+    return converter
+
+
+class TestSectionCache:
+    """章节缓存测试类"""
+
+    def test_fingerprint_depends_on_inputs(self):
+        """测试指纹覆盖所有渲染输入"""
+        base = SectionCache.fingerprint("<h2>A</h2>", "doc", "<style></style>", {'scale': 1})
+        assert base == SectionCache.fingerprint("<h2>A</h2>", "doc", "<style></style>", {'scale': 1})
+        assert base != SectionCache.fingerprint("<h2>B</h2>", "doc", "<style></style>", {'scale': 1})
+        assert base != SectionCache.fingerprint("<h2>A</h2>", "doc", "<style>p{}</style>", {'scale': 1})
+        assert base != SectionCache.fingerprint("<h2>A</h2>", "doc", "<style></style>", {'scale': 0.9})
+
+    def test_manifest_roundtrip_and_prune(self, tmp_path):
+        """测试清单读写与过期片段清理"""
+        cache = SectionCache(tmp_path / "cache")
+        assert cache.load_manifest() == []
+
+        cache.save_manifest(["a", "b"])
+        assert cache.load_manifest() == ["a", "b"]
+
+        for name in ["a", "b", "stale"]:
+            cache.fragment_path(name).write_bytes(b"%PDF")
+        assert cache.changed_sections(["a", "b", "c"]) == [2]
+        assert cache.prune(["a", "b"]) == 1
+        assert not cache.fragment_path("stale").exists()
+
+    @pytest.mark.asyncio
+    async def test_only_changed_sections_rerendered(self, converter, tmp_path):
+        """测试只重新渲染修改过的章节"""
+        output = tmp_path / "minutes.pdf"
+        html = converter._convert_markdown_to_html(MINUTES)
+        theme_css = converter.theme_manager.get_theme_css("enterprise")
+
+        await converter._convert_sections_incremental(html, "minutes", theme_css, output, {})
+        assert len(converter.rendered) == 4
+        assert output.exists()
+
+        # 未修改时不渲染
+        converter.rendered.clear()
+        await converter._convert_sections_incremental(html, "minutes", theme_css, output, {})
+        assert converter.rendered == []
+
+        # 修改 3.2 节中的错别字，只渲染所在章节
+        edited = converter._convert_markdown_to_html(MINUTES.replace("进展顺利", "进展正常"))
+        await converter._convert_sections_incremental(edited, "minutes", theme_css, output, {})
+        assert len(converter.rendered) == 1
+        assert "进展正常" in converter.rendered[0]
+
+        cache_dir = tmp_path / ".md2pdf-cache" / "minutes"
+        assert len(list(cache_dir.glob("*.pdf"))) == 4
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+打印主题编译测试
+================
+
+测试打印变体的规则裁剪、渐变压平、压缩输出和主题缓存
+"""
+
+import pytest
+from pathlib import Path
+import sys
+
+# 添加src到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.converter import HTMLConverter, PDFConverter
+from md2pdf_enterprise.core.theme_compiler import compile_print_css, gradient_fallback_color
+from md2pdf_enterprise.core.theme_manager import Theme, ThemeManager, ThemeProvider
+
+
+class TestCompilePrintCSS:
+    """打印变体编译测试类"""
+
+    def test_screen_only_rules_removed(self):
+        """测试去掉悬停选择器和过渡声明，保留同组的其他选择器"""
+        css = "a, a:hover { color: red; transition: all 0.2s; -webkit-transition: all 0.2s; }\ntr:hover { background: blue; }"
+        assert compile_print_css(css) == "a{color:red;}"
+
+    def test_media_rules(self):
+        """测试去掉仅屏幕的@media，保留打印规则和嵌套页边栏"""
+        css = (
+            "@media screen and (min-width: 600px) { p { margin: 0; } }\n"
+            "@media screen, print { p { color: red; } }\n"
+            "@media print { h1:hover { color: red; } h2 { page-break-after: avoid; } }\n"
+            "@page { size: A4; @bottom-right { content: \"Page \" counter(page) \" of \" counter(pages); } }"
+        )
+        assert compile_print_css(css) == (
+            "@media screen, print{p{color:red;}}"
+            "@media print{h2{page-break-after:avoid;}}"
+            "@page{size:A4;@bottom-right{content:\"Page \" counter(page) \" of \" counter(pages);}}"
+        )
+
+    def test_invisible_layer_removed(self):
+        """测试去掉空内容的固定定位图层，保留有背景的装饰伪元素"""
+        css = (
+            "body::before { content: \"\"; position: fixed; z-index: -1; color: rgba(0,0,0,0.03); }\n"
+            "h1::before { content: \"\"; height: 6px; background: #1e40af; }"
+        )
+        assert compile_print_css(css) == "h1::before{content:\"\";height:6px;background:#1e40af;}"
+
+    def test_effects_kept_by_default(self):
+        """测试默认保留阴影和渐变"""
+        css = "table { box-shadow: 0 2px 8px rgba(0,0,0,0.1); }\nth { background: linear-gradient(135deg, #1e40af 0%, #3b82f6 100%); }"
+        compiled = compile_print_css(css)
+        assert "box-shadow" in compiled
+        assert "linear-gradient" in compiled
+
+    def test_flatten_effects(self):
+        """测试压平效果：去掉阴影，单层渐变改为第一个不透明色标"""
+        css = (
+            "table { box-shadow: 0 2px 8px rgba(0,0,0,0.1); margin: 0; }\n"
+            "h2 { background: linear-gradient(90deg, rgba(219,234,254,0.0) 0%, #dbeafe 100%) !important; }\n"
+            "div { background-image: radial-gradient(circle at center, #fff, #000); }\n"
+            "p { background: url(a.png), linear-gradient(#fff, #000); }"
+        )
+        assert compile_print_css(css, flatten_effects=True) == (
+            "table{margin:0;}"
+            "h2{background:#dbeafe !important;}"
+            "div{background-color:#fff;}"
+            "p{background:url(a.png), linear-gradient(#fff, #000);}"
+        )
+
+    @pytest.mark.parametrize("gradient, expected", [
+        ("linear-gradient(to right, #e5e7eb 0%, #9ca3af 50%)", "#e5e7eb"),
+        ("linear-gradient(transparent, rgb(1, 2, 3) 10px)", "rgb(1, 2, 3)"),
+        ("repeating-linear-gradient(45deg, red 0 10px, blue 10px 20px)", "red"),
+        ("linear-gradient(transparent, rgba(0,0,0,0))", None),
+    ])
+    def test_gradient_fallback_color(self, gradient, expected):
+        """测试渐变的纯色回退"""
+        assert gradient_fallback_color(gradient) == expected
+
+    def test_strings_and_urls_preserved(self):
+        """测试字符串和url()中的分号、括号、空白原样保留"""
+        css = "@import url('https://example.com/css?family=A:wght@300;400&display=swap');\nli:before { content: \"a;  b { }\"; }"
+        assert compile_print_css(css) == (
+            "@import url('https://example.com/css?family=A:wght@300;400&display=swap');"
+            "li:before{content:\"a;  b { }\";}"
+        )
+
+    def test_style_wrapper_kept(self):
+        """测试带<style>包装的主题输出时保持包装"""
+        assert compile_print_css("<style>\n/* 注释 */\np { color: red; }\n</style>") == "<style>\np{color:red;}\n</style>"
+
+    def test_builtin_themes(self):
+        """测试内置主题的打印变体"""
+        manager = ThemeManager()
+        for theme in manager.get_available_themes():
+            compiled = manager.get_print_theme_css(theme.name, flatten_effects=True)
+            assert compiled.startswith("<style>")
+            assert len(compiled) < len(theme.css_content)
+            assert ":hover" not in compiled
+            assert "transition" not in compiled
+            assert "gradient" not in compiled
+            assert "@page" in compiled
+
+
+class TestPrintThemeCache:
+    """打印变体缓存测试类"""
+
+    def test_cached(self):
+        """测试重复获取返回缓存结果"""
+        manager = ThemeManager()
+        first = manager.get_print_theme_css("enterprise")
+        assert manager.get_print_theme_css("enterprise") is first
+        assert manager.get_print_theme_css("enterprise", flatten_effects=True) is not first
+
+    def test_recompiled_after_register(self):
+        """测试主题被重新注册后重新编译"""
+        class Provider(ThemeProvider):
+            def __init__(self, css):
+                self.css = css
+
+            def get_theme_css(self, theme_name):
+                return self.css
+
+            def get_available_themes(self):
+                return [Theme("custom", "Custom", "", self.css)]
+
+        manager = ThemeManager()
+        manager.register_provider(Provider("p { color: red; }"))
+        assert manager.get_print_theme_css("custom") == "p{color:red;}"
+        manager.register_provider(Provider("p { color: blue; }"))
+        assert manager.get_print_theme_css("custom") == "p{color:blue;}"
+
+
+class TestConverterThemeVariant:
+    """转换器主题变体选择测试类"""
+
+    def test_pdf_uses_print_variant(self):
+        """测试PDF输出默认使用打印变体，可通过配置关闭"""
+        converter = PDFConverter()
+        assert converter._theme_css("enterprise") == converter.theme_manager.get_print_theme_css("enterprise")
+
+        converter.config_manager.override(print_theme=False)
+        assert converter._theme_css("enterprise") == converter.theme_manager.get_theme_css("enterprise")
+
+    def test_pdf_flatten_config(self):
+        """测试压平效果配置"""
+        converter = PDFConverter()
+        converter.config_manager.override(flatten_theme_effects=True)
+        assert "gradient" not in converter._theme_css("enterprise")
+
+    def test_html_keeps_screen_theme(self):
+        """测试HTML输出保留完整主题"""
+        converter = HTMLConverter()
+        assert converter._theme_css("enterprise") == converter.theme_manager.get_theme_css("enterprise")
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
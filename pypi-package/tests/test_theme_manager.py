@@ -6,6 +6,7 @@
 测试主题管理器的功能
 """
 
+import os
 import pytest
 from pathlib import Path
 import sys
@@ -13,7 +14,13 @@ import sys
 # 添加src到路径
 sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from md2pdf_enterprise.core.theme_manager import ThemeManager, Theme
+from md2pdf_enterprise.core.theme_manager import (
+    THEME_PATH_ENV,
+    ThemeManager,
+    Theme,
+    get_theme_manager,
+    parse_theme_header,
+)
 from md2pdf_enterprise.core.exceptions import ThemeNotFoundError, ThemeLoadError
 
 
@@ -143,5 +150,145 @@ class TestThemeManager:
         assert isinstance(theme.css_content, str)
 
 
+def write_theme(directory: Path, name: str, css: str) -> Path:
+    """在主题目录中写入主题文件"""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.css"
+    path.write_text(css, encoding='utf-8')
+    return path
+
+
+class TestThemeDiscovery:
+    """主题目录发现测试类"""
+
+    def test_user_theme_dir(self, tmp_path):
+        """测试用户目录中的CSS文件无需注册即可使用"""
+        write_theme(tmp_path, "minutes", "/* 会议纪要\n * @name Minutes\n */\nbody { color: #111; }")
+        manager = ThemeManager(theme_dirs=[tmp_path])
+
+        assert manager.get_theme_names() == ["enterprise", "github", "minutes"]
+        theme = manager.get_theme("minutes")
+        assert theme.display_name == "Minutes"
+        assert theme.description == "会议纪要"
+        assert theme.css_content == "<style>\n/* 会议纪要\n * @name Minutes\n */\nbody { color: #111; }\n</style>"
+
+    def test_user_theme_overrides_builtin(self, tmp_path):
+        """测试后添加的目录覆盖同名主题"""
+        manager = ThemeManager()
+        assert "Enterprise" == manager.get_theme("enterprise").display_name
+
+        write_theme(tmp_path, "enterprise", "body { color: red; }")
+        manager.add_theme_dir(tmp_path)
+        manager.add_theme_dir(tmp_path)
+        assert manager.theme_dirs == [tmp_path, manager._theme_dir]
+        assert manager.get_theme_css("enterprise") == "<style>\nbody { color: red; }\n</style>"
+        assert manager.get_theme_names().count("enterprise") == 1
+
+    def test_env_theme_path(self, tmp_path, monkeypatch):
+        """测试通过环境变量添加主题目录"""
+        write_theme(tmp_path / "a", "alpha", "p { margin: 0; }")
+        write_theme(tmp_path / "b", "beta", "p { margin: 0; }")
+        monkeypatch.setenv(THEME_PATH_ENV, os.pathsep.join([str(tmp_path / "a"), str(tmp_path / "b")]))
+
+        manager = ThemeManager()
+        assert manager.has_theme("alpha")
+        assert manager.has_theme("beta")
+
+    def test_new_file_discovered(self, tmp_path):
+        """测试目录中新增的主题出现在主题列表中"""
+        manager = ThemeManager(theme_dirs=[tmp_path])
+        assert "later" not in manager.get_theme_names()
+
+        write_theme(tmp_path, "later", "p { margin: 0; }")
+        os.utime(tmp_path, ns=(0, tmp_path.stat().st_mtime_ns + 10**9))
+        assert "later" in manager.get_theme_names()
+
+    def test_name_outside_theme_dirs(self, tmp_path):
+        """测试主题名不能指向主题目录之外的文件"""
+        write_theme(tmp_path, "outside", "p { margin: 0; }")
+        manager = ThemeManager(theme_dirs=[tmp_path / "themes"])
+
+        with pytest.raises(ThemeNotFoundError):
+            manager.get_theme("../outside")
+
+    @pytest.mark.parametrize("css, expected", [
+        ("/* 标题 - 描述 */\np {}", ("custom", "标题 - 描述")),
+        ("/*\n * @name Custom\n * @description 自定义主题\n */", ("Custom", "自定义主题")),
+        ("p {}", ("custom", "")),
+    ])
+    def test_parse_theme_header(self, css, expected):
+        """测试从开头注释读取显示名和描述"""
+        assert parse_theme_header("custom", css) == expected
+
+
+class TestLazyLoading:
+    """按需加载测试类"""
+
+    def test_construct_reads_nothing(self, tmp_path):
+        """测试构造和列出主题名时不读取CSS"""
+        write_theme(tmp_path, "custom", "p {}")
+        manager = ThemeManager(theme_dirs=[tmp_path])
+
+        assert manager._files == {}
+        assert "custom" in manager.get_theme_names()
+        assert manager._files == {}
+        assert manager.has_theme("github")
+        assert not manager._files["github"].loaded
+
+        manager.get_theme_css("github")
+        assert manager._files["github"].loaded
+        assert "enterprise" not in manager._files
+
+    def test_cached_until_modified(self, tmp_path):
+        """测试主题按修改时间缓存，文件变化后重新加载"""
+        path = write_theme(tmp_path, "custom", "p { color: red; }")
+        manager = ThemeManager(theme_dirs=[tmp_path])
+        first = manager.get_theme("custom")
+        assert manager.get_theme("custom") is first
+        assert manager.get_print_theme_css("custom") == "<style>\np{color:red;}\n</style>"
+
+        path.write_text("p { color: blue; }", encoding='utf-8')
+        os.utime(path, ns=(0, path.stat().st_mtime_ns + 10**9))
+        assert manager.get_theme_css("custom") == "<style>\np { color: blue; }\n</style>"
+        assert manager.get_print_theme_css("custom") == "<style>\np{color:blue;}\n</style>"
+
+    def test_deleted_theme(self, tmp_path):
+        """测试用户主题删除后回退到内置同名主题"""
+        path = write_theme(tmp_path, "github", "p { color: red; }")
+        manager = ThemeManager(theme_dirs=[tmp_path])
+        assert manager.get_theme("github").display_name == "github"
+
+        path.unlink()
+        assert manager.get_theme("github").display_name == "GitHub"
+
+
+class TestSharedThemeManager:
+    """共享主题管理器测试类"""
+
+    def test_shared_instance(self, tmp_path):
+        """测试应用和转换器共用同一个主题管理器"""
+        from md2pdf_enterprise import MarkdownToPDFApp
+        from md2pdf_enterprise.converter import PDFConverter
+
+        manager = get_theme_manager()
+        assert get_theme_manager() is manager
+        assert PDFConverter().theme_manager is manager
+        assert MarkdownToPDFApp(config_file=str(tmp_path / "config.json")).theme_manager is manager
+
+    def test_config_theme_dirs(self, tmp_path, monkeypatch):
+        """测试配置中的主题目录加入共享管理器"""
+        from md2pdf_enterprise.converter import PDFConverter
+        from md2pdf_enterprise.core import ConfigManager, theme_manager as module
+
+        monkeypatch.setattr(module, "_shared_manager", None)
+
+        write_theme(tmp_path / "themes", "minutes", "p { margin: 0; }")
+        config_manager = ConfigManager(str(tmp_path / "config.json"))
+        config_manager.override(theme_dirs=[str(tmp_path / "themes")])
+
+        converter = PDFConverter(config_manager)
+        assert "minutes" in converter.get_supported_themes()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
\ No newline at end of file
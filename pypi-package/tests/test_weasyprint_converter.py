@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+WeasyPrint转换器测试
+====================
+
+测试纯Python PDF后端
+"""
+
+import pytest
+from pathlib import Path
+import sys
+import types
+
+# 添加src到路径
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from md2pdf_enterprise.converter import ConverterFactory, WeasyPrintConverter
+from md2pdf_enterprise.core.converter_base import ConversionTask
+
+
+@pytest.fixture
+def source(tmp_path):
+    """创建示例Markdown文件"""
+    path = tmp_path / "minutes.md"
+    path.write_text("# 会议纪要\n\n## 1. 会议基本信息\n\n- 张三\n", encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def fake_weasyprint(monkeypatch):
+    """记录排版调用的WeasyPrint替身"""
+    calls = []
+
+    class HTML:
+        def __init__(self, string, base_url):
+            calls.append({'string': string, 'base_url': base_url})
+
+        def write_pdf(self, target, zoom=1):
+            calls[-1]['zoom'] = zoom
+            Path(target).write_bytes(b"%PDF-1.7")
+
+    monkeypatch.setitem(sys.modules, "weasyprint", types.SimpleNamespace(HTML=HTML))
+    return calls
+
+
+class TestWeasyPrintConverter:
+    """WeasyPrint转换器测试类"""
+
+    def test_registered_in_factory(self):
+        """测试工厂注册"""
+        assert isinstance(ConverterFactory.create_converter('weasyprint'), WeasyPrintConverter)
+
+    def test_page_css_from_config(self):
+        """测试纸张和页边距配置转换为 @page 规则"""
+        converter = WeasyPrintConverter()
+        css = converter._page_css({})
+        assert "size: A4;" in css
+        assert "margin-top: 20mm;" in css
+        assert "margin-left: 15mm;" in css
+
+    @pytest.mark.asyncio
+    async def test_convert_single(self, source, fake_weasyprint):
+        """测试渲染同一份HTML和主题CSS"""
+        converter = WeasyPrintConverter()
+
+        async def forbidden_launch():
+            raise AssertionError("WeasyPrint后端不应启动浏览器")
+
+        converter._launch_browser = forbidden_launch
+        task = ConversionTask(source=source, target=source.with_suffix('.pdf'), theme="enterprise")
+        result = await converter.convert_single(task)
+
+        assert result.success, result.error_message
+        assert task.target.read_bytes().startswith(b"%PDF")
+        document = fake_weasyprint[0]['string']
+        # 配置的 @page 在主题CSS之前，主题可以覆盖
+        assert document.index("@page { size: A4;") < document.index("Source Sans Pro")
+        assert fake_weasyprint[0]['base_url'] == str(source.parent)
+        assert fake_weasyprint[0]['zoom'] == 1.0
+
+    @pytest.mark.asyncio
+    async def test_missing_dependency(self, source, monkeypatch):
+        """测试未安装WeasyPrint时给出依赖提示"""
+        monkeypatch.setitem(sys.modules, "weasyprint", None)
+        converter = WeasyPrintConverter()
+        task = ConversionTask(source=source, target=source.with_suffix('.pdf'), theme="github")
+        result = await converter.convert_single(task)
+
+        assert not result.success
+        assert "pip install weasyprint" in result.error_message
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
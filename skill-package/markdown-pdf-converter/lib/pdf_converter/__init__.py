@@ -5,6 +5,12 @@ Simplified PDF Converter for VCU Meeting Minutes
 Integrated PDF conversion functionality without external dependencies.
 """
 
-from .converter import convert_markdown_to_pdf
+from .converter import (
+    convert_documents_to_pdf,
+    convert_html_to_pdf,
+    convert_markdown_content_to_pdf,
+    convert_markdown_to_pdf
+)
 
-__all__ = ['convert_markdown_to_pdf']
+__all__ = ['convert_markdown_to_pdf', 'convert_markdown_content_to_pdf', 'convert_html_to_pdf',
+           'convert_documents_to_pdf']
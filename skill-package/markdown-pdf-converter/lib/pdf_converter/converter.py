@@ -10,7 +10,7 @@ import asyncio
 import markdown
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, List, Optional, Tuple
 from pyppeteer import launch
 
 
@@ -40,6 +40,47 @@ def convert_markdown_to_pdf(
         with open(markdown_path, 'r', encoding='utf-8') as f:
             markdown_content = f.read()
 
+        return convert_markdown_content_to_pdf(
+            markdown_content,
+            markdown_path.with_suffix('.pdf'),
+            theme=theme,
+            auto_open=auto_open,
+            title=markdown_path.stem
+        )
+
+    except Exception as e:
+        print(f"❌ PDF转换错误: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
+def convert_markdown_content_to_pdf(
+    markdown_content: str,
+    pdf_path,
+    theme: str = "enterprise",
+    auto_open: bool = True,
+    title: Optional[str] = None
+) -> Optional[Path]:
+    """
+    Convert an in-memory Markdown string to PDF
+
+    Used by in-process pipelines (e.g. the OCR extractor) that already hold
+    the rendered minutes and should not re-read them from disk.
+
+    Args:
+        markdown_content: Markdown text
+        pdf_path: Output PDF path
+        theme: Theme name (enterprise/github)
+        auto_open: Whether to open PDF after generation
+        title: Document title, defaults to the PDF file stem
+
+    Returns:
+        Path to generated PDF file, or None if failed
+    """
+    try:
+        pdf_path = Path(pdf_path)
+
         # Convert to HTML
         html_content = _convert_markdown_to_html(markdown_content)
 
@@ -49,37 +90,57 @@ def convert_markdown_to_pdf(
         # Create full HTML document
         full_html = _create_html_document(
             html_content,
-            markdown_path.stem,
+            title or pdf_path.stem,
             theme_css
         )
 
         # Convert to PDF
-        pdf_path = markdown_path.with_suffix('.pdf')
-
-        # Run async conversion
-        if sys.platform == 'win32':
-            asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
-
-        loop = asyncio.get_event_loop()
-        loop.run_until_complete(_convert_html_to_pdf(full_html, pdf_path))
-
-        if pdf_path.exists():
-            print(f"✅ PDF已生成: {pdf_path}")
-
-            if auto_open:
-                import subprocess
-                if sys.platform == 'darwin':
-                    subprocess.run(['open', str(pdf_path)])
-                elif sys.platform == 'win32':
-                    subprocess.run(['start', str(pdf_path)], shell=True)
-                else:
-                    subprocess.run(['xdg-open', str(pdf_path)])
-
-            return pdf_path
-        else:
-            print("❌ PDF生成失败")
+        return _render_pdf(full_html, pdf_path, auto_open)
+
+    except Exception as e:
+        print(f"❌ PDF转换错误: {e}")
+        import traceback
+        traceback.print_exc()
+        return None
+
+
+def convert_html_to_pdf(
+    html_file: str,
+    theme: str = "enterprise",
+    auto_open: bool = True
+) -> Optional[Path]:
+    """
+    Convert a pre-built HTML fragment to PDF, skipping Markdown parsing
+
+    The fragment is expected to carry the same markup and semantic classes
+    that _convert_markdown_to_html produces (e.g. output of
+    templates/vcu-meeting-template.html.j2).
+
+    Args:
+        html_file: Path to HTML body fragment
+        theme: Theme name (enterprise/github)
+        auto_open: Whether to open PDF after generation
+
+    Returns:
+        Path to generated PDF file, or None if failed
+    """
+    try:
+        html_path = Path(html_file)
+        if not html_path.exists():
+            print(f"❌ HTML文件不存在: {html_file}")
             return None
 
+        with open(html_path, 'r', encoding='utf-8') as f:
+            html_content = f.read()
+
+        full_html = _create_html_document(
+            html_content,
+            html_path.stem,
+            _get_theme_css(theme)
+        )
+
+        return _render_pdf(full_html, html_path.with_suffix('.pdf'), auto_open)
+
     except Exception as e:
         print(f"❌ PDF转换错误: {e}")
         import traceback
@@ -87,6 +148,97 @@ def convert_markdown_to_pdf(
         return None
 
 
+def convert_documents_to_pdf(
+    documents: Iterable[Tuple[str, str]],
+    theme: str = "enterprise",
+    html: bool = False,
+    concurrency: int = 4
+) -> List[Optional[Path]]:
+    """
+    Convert many in-memory documents to PDF with a single browser
+
+    Launching Chromium dominates the cost of a single conversion, so batch
+    callers (e.g. MeetingMinutesGenerator.generate_batch) hand over all
+    rendered documents at once; they are printed in parallel pages of one
+    browser instance.
+
+    Args:
+        documents: (content, pdf_path) pairs; the title is the PDF file stem
+        theme: Theme name (enterprise/github)
+        html: Contents are HTML fragments (skip Markdown parsing)
+        concurrency: Maximum number of pages printed at the same time
+
+    Returns:
+        PDF path for each document in input order, None for failed ones
+    """
+    theme_css = _get_theme_css(theme)
+    jobs = []
+    for content, pdf_path in documents:
+        pdf_path = Path(pdf_path)
+        body = content if html else _convert_markdown_to_html(content)
+        jobs.append((_create_html_document(body, pdf_path.stem, theme_css), pdf_path))
+
+    if not jobs:
+        return []
+
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+    # asyncio.run creates a fresh loop: callers may already have run (and
+    # closed) one, e.g. the OCR extractor, leaving no current event loop
+    results = asyncio.run(_convert_batch(jobs, max(1, concurrency)))
+
+    success = sum(1 for result in results if result)
+    print(f"✅ PDF已生成: {success}/{len(results)}")
+    return results
+
+
+async def _convert_batch(jobs: List[Tuple[str, Path]], concurrency: int) -> List[Optional[Path]]:
+    """Print HTML documents to PDF, sharing one browser between all pages"""
+    semaphore = asyncio.Semaphore(concurrency)
+    browser = await _launch_browser()
+
+    async def print_one(full_html: str, pdf_path: Path) -> Optional[Path]:
+        async with semaphore:
+            try:
+                await _print_page(browser, full_html, pdf_path)
+            except Exception as e:
+                print(f"❌ PDF转换错误 ({pdf_path.name}): {e}")
+                return None
+        return pdf_path if pdf_path.exists() else None
+
+    try:
+        return await asyncio.gather(*(print_one(full_html, pdf_path) for full_html, pdf_path in jobs))
+    finally:
+        await browser.close()
+
+
+def _render_pdf(full_html: str, pdf_path: Path, auto_open: bool) -> Optional[Path]:
+    """Render a complete HTML document to PDF and optionally open it"""
+    # Run async conversion
+    if sys.platform == 'win32':
+        asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
+
+    asyncio.run(_convert_html_to_pdf(full_html, pdf_path))
+
+    if pdf_path.exists():
+        print(f"✅ PDF已生成: {pdf_path}")
+
+        if auto_open:
+            import subprocess
+            if sys.platform == 'darwin':
+                subprocess.run(['open', str(pdf_path)])
+            elif sys.platform == 'win32':
+                subprocess.run(['start', str(pdf_path)], shell=True)
+            else:
+                subprocess.run(['xdg-open', str(pdf_path)])
+
+        return pdf_path
+    else:
+        print("❌ PDF生成失败")
+        return None
+
+
 def _convert_markdown_to_html(markdown_content: str) -> str:
     """Convert Markdown to HTML"""
     md = markdown.Markdown(
@@ -204,22 +356,32 @@ def _create_html_document(html_content: str, title: str, theme_css: str) -> str:
 </html>"""
 
 
+_PDF_OPTIONS = {
+    'format': 'A4',
+    'margin': {
+        'top': '2.5cm',
+        'bottom': '3cm',
+        'left': '2cm',
+        'right': '2cm'
+    },
+    'printBackground': True,
+    'displayHeaderFooter': False,
+    'preferCSSPageSize': True,
+    'scale': 1.0
+}
+
+
 async def _convert_html_to_pdf(html_content: str, output_path: Path):
     """Convert HTML to PDF using pyppeteer"""
-    pdf_options = {
-        'format': 'A4',
-        'margin': {
-            'top': '2.5cm',
-            'bottom': '3cm',
-            'left': '2cm',
-            'right': '2cm'
-        },
-        'printBackground': True,
-        'displayHeaderFooter': False,
-        'preferCSSPageSize': True,
-        'scale': 1.0
-    }
+    browser = await _launch_browser()
+    try:
+        await _print_page(browser, html_content, output_path)
+    finally:
+        await browser.close()
+
 
+async def _launch_browser():
+    """Launch a headless browser for PDF printing"""
     launch_kwargs = {
         'headless': True,
         'args': [
@@ -239,10 +401,13 @@ async def _convert_html_to_pdf(html_content: str, output_path: Path):
     if exec_path:
         launch_kwargs['executablePath'] = exec_path
 
-    browser = await launch(**launch_kwargs)
+    return await launch(**launch_kwargs)
 
+
+async def _print_page(browser, html_content: str, output_path: Path):
+    """Print one HTML document to PDF in a new page of a running browser"""
+    page = await browser.newPage()
     try:
-        page = await browser.newPage()
         await page.setViewport({
             'width': 1200,
             'height': 800,
@@ -269,10 +434,10 @@ async def _convert_html_to_pdf(html_content: str, output_path: Path):
             pass  # No images or timeout, continue
 
         # Generate PDF
-        await page.pdf({**pdf_options, 'path': str(output_path)})
+        await page.pdf({**_PDF_OPTIONS, 'path': str(output_path)})
 
     finally:
-        await browser.close()
+        await page.close()
 
 
 def _detect_browser_executable() -> Optional[str]:
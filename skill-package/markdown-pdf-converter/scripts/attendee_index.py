@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+参会人员匹配索引
+由 attendees.yaml 构建的工号/姓名精确索引和姓名BK树（编辑距离模糊匹配），
+索引以JSON持久化到缓存目录（每个名册一个文件），attendees.yaml 修改后自动重建
+"""
+
+import hashlib
+import json
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from yaml_loader import load_yaml
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "vcu-meeting-ocr"
+
+CATEGORIES = ('hosts', 'managers', 'engineers')
+
+# 索引结构调整时递增，使旧的持久化索引失效
+INDEX_VERSION = 2
+
+_WHITESPACE = re.compile(r'[\s　]+')
+
+
+def normalize_name(name) -> str:
+    """去掉识别结果中的空格（含全角空格）"""
+    return _WHITESPACE.sub('', str(name or ''))
+
+
+def normalize_id(employee_id) -> str:
+    """工号只保留数字"""
+    return re.sub(r'\D', '', str(employee_id or ''))
+
+
+def edit_distance(a: str, b: str) -> int:
+    """Levenshtein编辑距离"""
+    if len(a) < len(b):
+        a, b = b, a
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(
+                previous[j] + 1,
+                current[j - 1] + 1,
+                previous[j - 1] + (char_a != char_b)
+            ))
+        previous = current
+    return previous[-1]
+
+
+class BKTree:
+    """编辑距离BK树
+
+    按三角不等式剪枝，查询只访问距离区间内的子树，
+    名册规模增大时模糊查询的开销基本不变。
+    """
+
+    def __init__(self):
+        self.root: Optional[Tuple[str, Dict[int, tuple]]] = None
+
+    def add(self, word: str):
+        if self.root is None:
+            self.root = (word, {})
+            return
+        node = self.root
+        while True:
+            distance = edit_distance(word, node[0])
+            if distance == 0:
+                return
+            child = node[1].get(distance)
+            if child is None:
+                node[1][distance] = (word, {})
+                return
+            node = child
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """查找编辑距离不超过 ``max_distance`` 的词，按距离排序"""
+        if self.root is None:
+            return []
+        results = []
+        stack = [self.root]
+        while stack:
+            candidate, children = stack.pop()
+            distance = edit_distance(word, candidate)
+            if distance <= max_distance:
+                results.append((distance, candidate))
+            for child_distance in range(distance - max_distance, distance + max_distance + 1):
+                child = children.get(child_distance)
+                if child is not None:
+                    stack.append(child)
+        return sorted(results)
+
+
+class AttendeeIndex:
+    """参会人员索引"""
+
+    def __init__(self, attendees_db: Dict):
+        by_id, by_name = {}, {}
+        for category in CATEGORIES:
+            for person in attendees_db.get(category) or []:
+                emp_id = normalize_id(person.get('employee_id'))
+                name = normalize_name(person.get('name'))
+                if emp_id:
+                    by_id[emp_id] = person
+                if name:
+                    by_name[name] = person
+        self._build(by_id, by_name)
+
+    def _build(self, by_id: Dict[str, Dict], by_name: Dict[str, Dict]):
+        self.by_id = by_id
+        self.by_name = by_name
+        self.names = BKTree()
+        for name in by_name:
+            self.names.add(name)
+
+    @classmethod
+    def from_maps(cls, by_id: Dict[str, Dict], by_name: Dict[str, Dict]) -> "AttendeeIndex":
+        """由工号/姓名索引恢复（BK树按姓名重新构建）"""
+        index = cls.__new__(cls)
+        index._build(by_id, by_name)
+        return index
+
+    @staticmethod
+    def max_distance(name: str) -> int:
+        """允许的姓名编辑距离：每三个字容忍一个错字
+
+        两个字的姓名错一个字已无法可靠区分（如 李四/李梅），不做模糊匹配
+        """
+        return len(name) // 3
+
+    def fuzzy_candidates(self, name: str) -> List[Tuple[int, Dict]]:
+        """模糊匹配候选人（按编辑距离排序）"""
+        name = normalize_name(name)
+        if not self.max_distance(name):
+            return []
+        return [
+            (distance, self.by_name[candidate])
+            for distance, candidate in self.names.search(name, self.max_distance(name))
+        ]
+
+    def lookup(self, name: str = '', employee_id: str = '') -> Tuple[Optional[Dict], str]:
+        """查找人员
+
+        依次尝试工号精确匹配、姓名精确匹配和姓名模糊匹配；
+        模糊匹配只在最近的候选人唯一时采用，避免张冠李戴。
+
+        Returns:
+            tuple: (人员信息或None, 匹配方式: id/name/fuzzy/空字符串)
+        """
+        emp_id = normalize_id(employee_id)
+        if emp_id and emp_id in self.by_id:
+            return self.by_id[emp_id], 'id'
+
+        normalized = normalize_name(name)
+        if normalized in self.by_name:
+            return self.by_name[normalized], 'name'
+
+        candidates = self.fuzzy_candidates(normalized)
+        if candidates and (len(candidates) == 1 or candidates[0][0] < candidates[1][0]):
+            return candidates[0][1], 'fuzzy'
+
+        return None, ''
+
+    @classmethod
+    def load(cls, attendees_file, cache_dir=None) -> "AttendeeIndex":
+        """加载索引，attendees.yaml 未修改时直接读取持久化的索引
+
+        缓存文件名包含名册路径的哈希，不同名册互不覆盖；缓存只保存
+        工号/姓名索引（JSON），BK树在加载时重新构建。
+
+        Args:
+            attendees_file: attendees.yaml 路径
+            cache_dir: 索引缓存目录，默认 ``~/.cache/vcu-meeting-ocr``
+        """
+        attendees_file = Path(attendees_file).resolve()
+        stat = attendees_file.stat()
+        signature = [INDEX_VERSION, str(attendees_file), stat.st_mtime_ns, stat.st_size]
+
+        cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        path_hash = hashlib.sha256(str(attendees_file).encode('utf-8')).hexdigest()[:16]
+        cache_path = cache_dir / f"attendee-index-{path_hash}.json"
+        try:
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached['signature'] == signature:
+                return cls.from_maps(cached['by_id'], cached['by_name'])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass  # 缓存不存在或已损坏，重新构建
+
+        index = cls(load_yaml(attendees_file) or {})
+
+        try:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix('.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(
+                    {'signature': signature, 'by_id': index.by_id, 'by_name': index.by_name},
+                    f, ensure_ascii=False, default=str
+                )
+            tmp_path.replace(cache_path)
+        except OSError:
+            pass  # 缓存目录不可写时仅在内存中使用
+
+        return index
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+会议图片批量识别辅助工具
+目录扫描与按内容去重、令牌桶限速、断点续跑记录
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from image_preprocess import MEDIA_TYPES
+
+
+CHECKPOINT_FILE = ".ocr-batch-checkpoint.json"
+
+
+def find_images(directory) -> Dict[str, List[Path]]:
+    """递归查找目录下的图片并按内容哈希去重
+
+    Returns:
+        dict: 内容哈希 -> 内容相同的图片路径列表（第一个为处理对象）
+    """
+    groups: Dict[str, List[Path]] = {}
+    for path in sorted(Path(directory).rglob('*')):
+        if not path.is_file() or path.suffix.lower() not in MEDIA_TYPES:
+            continue
+        digest = hashlib.sha256(path.read_bytes()).hexdigest()
+        groups.setdefault(digest, []).append(path)
+    return groups
+
+
+class TokenBucket:
+    """令牌桶限速器
+
+    以 ``rate`` 个/秒的速度补充令牌，最多积累 ``capacity`` 个，
+    每次API调用前取走一个令牌，令牌不足时等待。
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(1.0, rate)
+        self.tokens = self.capacity
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, burst: Optional[float] = None) -> "TokenBucket":
+        """按每分钟请求数创建限速器"""
+        return cls(requests_per_minute / 60.0, burst)
+
+    async def acquire(self):
+        """取走一个令牌，必要时等待补充"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class BatchCheckpoint:
+    """批量识别进度记录
+
+    每完成一张图片立即写盘，中断后重新运行会跳过已完成的图片，
+    失败的图片会在下次运行时重试。
+    """
+
+    def __init__(self, output_dir):
+        self.path = Path(output_dir) / CHECKPOINT_FILE
+        self.entries: Dict[str, Dict] = {}
+        if self.path.exists():
+            with open(self.path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+
+    def is_done(self, digest: str) -> bool:
+        return self.entries.get(digest, {}).get('status') == 'done'
+
+    def record(self, digest: str, entry: Dict):
+        """记录一张图片的处理结果并写盘"""
+        self.entries[digest] = entry
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, ensure_ascii=False, indent=2)
+        tmp_path.replace(self.path)
@@ -52,6 +52,7 @@ VCU项目会议纪要生成工具
   -o, --output <file>     指定输出文件名
   -t, --template <file>   指定模板文件
   -p, --pdf               生成后自动转换为PDF
+  --html                  使用HTML模板生成，PDF转换跳过Markdown解析
   --example               使用示例配置生成
 
 示例:
@@ -67,8 +68,12 @@ VCU项目会议纪要生成工具
   # 指定输出文件名
   $0 -o custom-name.md my-meeting.yaml
 
+  # HTML模板直出PDF（模板 → HTML → PDF）
+  $0 --html -p my-meeting.yaml
+
 模板文件:
   templates/vcu-meeting-template.j2
+  templates/vcu-meeting-template.html.j2   # --html
 
 数据文件:
   data/attendees.yaml                # 参会人员数据库
@@ -104,6 +109,10 @@ main() {
                 generate_pdf=true
                 shift
                 ;;
+            --html)
+                template="vcu-meeting-template.html.j2"
+                shift
+                ;;
             --example)
                 use_example=true
                 shift
@@ -191,7 +200,7 @@ main() {
 
         # 使用内置转换器（不自动打开，与原行为保持一致）
         LIB_DIR="$SKILL_DIR/lib"
-        MD_FILE="$generated_file" THEME="enterprise" LIB_DIR="$LIB_DIR" python3 - <<'PY'
+        SOURCE_FILE="$generated_file" THEME="enterprise" LIB_DIR="$LIB_DIR" python3 - <<'PY'
 import os, sys
 from pathlib import Path
 
@@ -199,15 +208,17 @@ lib_dir = Path(os.environ["LIB_DIR"])
 sys.path.insert(0, str(lib_dir))
 
 try:
-    from pdf_converter import convert_markdown_to_pdf
+    from pdf_converter import convert_html_to_pdf, convert_markdown_to_pdf
 except Exception as e:
     print(f"❌ 导入内置PDF转换模块失败: {e}")
     sys.exit(1)
 
-md_file = os.environ["MD_FILE"]
+source_file = os.environ["SOURCE_FILE"]
 theme = os.environ.get("THEME", "enterprise")
 
-pdf_path = convert_markdown_to_pdf(md_file, theme=theme, auto_open=False)
+# HTML模板生成的文件已带语义类，直接渲染
+convert = convert_html_to_pdf if source_file.endswith('.html') else convert_markdown_to_pdf
+pdf_path = convert(source_file, theme=theme, auto_open=False)
 if not pdf_path:
     print("❌ PDF转换失败")
     sys.exit(1)
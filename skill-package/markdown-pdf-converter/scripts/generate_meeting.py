@@ -2,23 +2,93 @@
 """
 VCU项目会议纪要生成器（可导入模块）
 基于YAML配置文件和Jinja2模板生成会议纪要Markdown文档
+（.html.j2 模板直接生成HTML片段，可跳过Markdown解析直接转换PDF）
 """
 
+import os
 import sys
-import yaml
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from jinja2 import Environment, FileSystemLoader, TemplateNotFound
+from jinja2 import (
+    Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateNotFound, select_autoescape
+)
+
+try:
+    from .meeting_schema import validate_meeting
+    from .yaml_loader import load_yaml
+except ImportError:
+    # 直接以脚本方式运行
+    from meeting_schema import validate_meeting
+    from yaml_loader import load_yaml
+
+
+# 模块级共享的Jinja2环境（按模板目录），同一进程内多次生成只编译一次模板
+_ENVIRONMENTS = {}
+
+
+class HeadingIds:
+    """HTML模板的标题id生成器
+
+    使用 Markdown toc 扩展的 slugify 与去重规则，
+    生成的id与 pdf_converter 转换同一份Markdown时完全一致（锚点与分页类可互换）。
+    每次渲染在模板中创建一个实例，同一文档内的重复id依次追加 _1、_2。
+    """
+
+    def __init__(self):
+        from markdown.extensions.toc import slugify, unique
+        self._slugify = slugify
+        self._unique = unique
+        self._used = set()
+
+    def __call__(self, text):
+        return self._unique(self._slugify(str(text), '-'), self._used)
+
+
+def get_jinja_env(skill_dir):
+    """获取指定Skill包的共享Jinja2环境
+
+    编译后的模板字节码缓存在 ``<skill_dir>/.cache/jinja2``，
+    新进程直接加载字节码，模板文件修改后自动重新编译。
+    """
+    skill_dir = Path(skill_dir).resolve()
+    env = _ENVIRONMENTS.get(skill_dir)
+    if env is not None:
+        return env
+
+    bytecode_cache = None
+    cache_dir = skill_dir / ".cache" / "jinja2"
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        gitignore = cache_dir.parent / ".gitignore"
+        if not gitignore.exists():
+            gitignore.write_text("*\n", encoding='utf-8')
+        bytecode_cache = FileSystemBytecodeCache(str(cache_dir))
+    except OSError:
+        pass  # 只读安装时不使用字节码缓存
+
+    # 仅HTML模板自动转义，Markdown模板保持原样输出
+    env = Environment(
+        loader=FileSystemLoader(str(skill_dir / "templates")),
+        autoescape=select_autoescape(enabled_extensions=('html.j2',), default_for_string=False),
+        bytecode_cache=bytecode_cache,
+        trim_blocks=True,
+        lstrip_blocks=True
+    )
+    env.globals['heading_ids'] = HeadingIds
+    _ENVIRONMENTS[skill_dir] = env
+    return env
 
 
 class MeetingMinutesGenerator:
     """会议纪要生成器"""
 
-    def __init__(self, skill_dir=None):
+    def __init__(self, skill_dir=None, yaml_snapshots=False):
         """初始化生成器
 
         Args:
             skill_dir: Skill包根目录，默认为脚本所在目录的父目录
+            yaml_snapshots: 是否把解析后的YAML持久化为JSON快照（``<skill_dir>/.cache/yaml``），默认关闭
         """
         if skill_dir is None:
             skill_dir = Path(__file__).parent.parent
@@ -29,20 +99,17 @@ class MeetingMinutesGenerator:
         self.templates_dir = skill_dir / "templates"
         self.data_dir = skill_dir / "data"
 
-        # 初始化Jinja2环境
-        self.jinja_env = Environment(
-            loader=FileSystemLoader(str(self.templates_dir)),
-            trim_blocks=True,
-            lstrip_blocks=True
-        )
+        # 共享Jinja2环境（带字节码缓存）
+        self.jinja_env = get_jinja_env(skill_dir)
+
+        self.snapshot_dir = skill_dir / ".cache" / "yaml" if yaml_snapshots else None
 
     def load_yaml(self, yaml_file):
-        """加载YAML配置文件"""
+        """加载YAML配置文件（返回共享的缓存结果，不要原地修改）"""
         yaml_path = Path(yaml_file)
         if not yaml_path.exists():
             raise FileNotFoundError(f"配置文件不存在: {yaml_file}")
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return load_yaml(yaml_path, self.snapshot_dir)
 
     def generate_filename(self, meeting_time):
         """生成会议纪要文件名"""
@@ -54,72 +121,274 @@ class MeetingMinutesGenerator:
             date_str = datetime.now().strftime("%Y%m%d")
         return f"RB99125046安全运算与控制平台（VCU）项目例会会议纪要_{date_str}.md"
 
+    def load_default_attendees(self):
+        """加载 attendees.yaml 中的默认参会人员（文件未修改时不重复解析）"""
+        attendees_file = self.data_dir / "attendees.yaml"
+        if not attendees_file.exists():
+            return {}
+
+        attendees_data = load_yaml(attendees_file, self.snapshot_dir) or {}
+        attendees = {
+            'hosts': [attendees_data['hosts'][0]] if 'hosts' in attendees_data else [],
+            'managers': attendees_data.get('managers', []),
+            'engineers': attendees_data.get('engineers', [])
+        }
+        # 默认出席（复制人员信息，不修改缓存的解析结果）
+        return {
+            category: [{**person, 'present': person.get('present', True)} for person in people]
+            for category, people in attendees.items()
+        }
+
     def merge_attendees(self, config_data):
-        """合并参会人员数据（若未提供，则从 attendees.yaml 加载默认）"""
+        """合并参会人员数据（若未提供，则从 attendees.yaml 加载默认）
+
+        返回新的配置字典，不修改传入的配置
+        """
         if 'attendees' not in config_data or not config_data['attendees']:
-            attendees_file = self.data_dir / "attendees.yaml"
-            if attendees_file.exists():
-                with open(attendees_file, 'r', encoding='utf-8') as f:
-                    attendees_data = yaml.safe_load(f)
-                    config_data['attendees'] = {
-                        'hosts': [attendees_data['hosts'][0]] if 'hosts' in attendees_data else [],
-                        'managers': attendees_data.get('managers', []),
-                        'engineers': attendees_data.get('engineers', [])
-                    }
-                    # 默认出席
-                    for category in config_data['attendees'].values():
-                        for person in category:
-                            person['present'] = person.get('present', True)
+            attendees = self.load_default_attendees()
+            if attendees:
+                return {**config_data, 'attendees': attendees}
         return config_data
 
+    def render(self, config_data, template="vcu-meeting-template.j2"):
+        """将配置数据渲染为会议纪要文本（不读写文件）
+
+        Args:
+            config_data: 会议配置字典（与YAML结构一致）
+            template: 模板文件名
+
+        Returns:
+            str: 渲染结果（Markdown，HTML模板为HTML片段）
+
+        Raises:
+            MeetingSchemaError: 配置不符合会议输入结构
+        """
+        validate_meeting(config_data)
+        config_data = self.merge_attendees(config_data)
+        return self.get_template(template).render(**config_data)
+
+    def get_template(self, template):
+        """获取已编译的模板"""
+        try:
+            return self.jinja_env.get_template(template)
+        except TemplateNotFound:
+            raise FileNotFoundError(f"模板文件不存在: {self.templates_dir / template}")
+
+    def default_output_path(self, config_data, template="vcu-meeting-template.j2"):
+        """根据会议时间和模板类型确定默认输出文件名"""
+        meeting_time = config_data.get('meeting_time', datetime.now().strftime("%Y-%m-%d"))
+        output_file = Path(self.generate_filename(meeting_time))
+        if template.endswith('.html.j2'):
+            output_file = output_file.with_suffix('.html')
+        return output_file
+
     def generate(self, input_file, output_file=None, template="vcu-meeting-template.j2"):
-        """生成会议纪要 Markdown"""
+        """生成会议纪要 Markdown（HTML模板生成 .html 文件）"""
         print(f"📄 加载配置: {input_file}")
         config_data = self.load_yaml(input_file)
-        config_data = self.merge_attendees(config_data)
+        validate_meeting(config_data, Path(input_file).name)
 
         if output_file is None:
-            meeting_time = config_data.get('meeting_time', datetime.now().strftime("%Y-%m-%d"))
-            output_file = self.generate_filename(meeting_time)
+            output_file = self.default_output_path(config_data, template)
 
         output_path = Path(output_file)
         print(f"📋 使用模板: {template}")
-        try:
-            template_obj = self.jinja_env.get_template(template)
-        except TemplateNotFound:
-            raise FileNotFoundError(f"模板文件不存在: {self.templates_dir / template}")
-
         print(f"⚙️  生成会议纪要...")
-        content = template_obj.render(**config_data)
-        with open(output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
+        template_obj = self.get_template(template)
+        config_data = self.merge_attendees(config_data)
+        # 流式渲染，逐块写入输出文件；渲染出错时不留下半个文件
+        try:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                f.writelines(template_obj.generate(**config_data))
+        except Exception:
+            output_path.unlink(missing_ok=True)
+            raise
 
         print(f"✅ 会议纪要已生成: {output_path}")
         print(f"   文件大小: {output_path.stat().st_size / 1024:.1f} KB")
         return output_path
 
+    def generate_batch(
+        self,
+        inputs,
+        output_dir=None,
+        template="vcu-meeting-template.j2",
+        workers=None,
+        pdf=False,
+        theme="enterprise"
+    ):
+        """在同一进程内批量生成会议纪要
+
+        各工作线程共享已编译的模板和已解析的参会人员数据；
+        所有输入先完成加载和结构校验，不合规的输入直接报告错误字段并跳过，不进入渲染；
+        ``pdf=True`` 时渲染结果直接交给PDF转换器的批量接口（共用一个浏览器），
+        不写中间的 Markdown/HTML 文件。
+
+        Args:
+            inputs: YAML文件路径列表，或包含YAML文件的目录
+            output_dir: 输出目录，默认当前目录
+            template: 模板文件名
+            workers: 工作线程数，默认 min(8, CPU核数)
+            pdf: 是否直接生成PDF
+            theme: PDF主题（enterprise/github）
+
+        Returns:
+            list: 与输入顺序一致的输出文件路径，失败的输入为None
+        """
+        input_files = self._collect_inputs(inputs)
+        output_dir = Path(output_dir) if output_dir else Path.cwd()
+        output_dir.mkdir(parents=True, exist_ok=True)
+        workers = workers or min(8, os.cpu_count() or 1)
+
+        print(f"📂 批量生成: {len(input_files)} 个配置 (模板: {template}, 线程: {workers})")
+        template_obj = self.get_template(template)
+
+        def load_one(input_file):
+            config_data = self.load_yaml(input_file)
+            validate_meeting(config_data, input_file.name)
+            return config_data
+
+        def render_one(config_data):
+            return template_obj.render(**self.merge_attendees(config_data))
+
+        results = [None] * len(input_files)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # 第一阶段：加载并校验全部输入
+            valid = []
+            for i, (input_file, future) in enumerate(
+                zip(input_files, [pool.submit(load_one, input_file) for input_file in input_files])
+            ):
+                try:
+                    valid.append((i, input_file, future.result()))
+                except Exception as e:
+                    print(f"❌ {input_file.name}: {e}", file=sys.stderr)
+
+            if len(valid) < len(input_files):
+                print(f"⚠️  {len(input_files) - len(valid)} 个配置未通过加载/校验，已跳过", file=sys.stderr)
+
+            # 第二阶段：只渲染通过校验的输入
+            futures = [pool.submit(render_one, config_data) for _, _, config_data in valid]
+
+        documents = []
+        used_names = set()
+        for (i, input_file, config_data), future in zip(valid, futures):
+            try:
+                content = future.result()
+            except Exception as e:
+                print(f"❌ {input_file.name}: {e}", file=sys.stderr)
+                continue
+
+            output_path = output_dir / self.default_output_path(config_data, template).name
+            if output_path.name in used_names:
+                # 同一天的多份会议以输入文件名区分
+                output_path = output_path.with_name(f"{output_path.stem}_{input_file.stem}{output_path.suffix}")
+            used_names.add(output_path.name)
+
+            if pdf:
+                documents.append((i, content, output_path.with_suffix('.pdf')))
+            else:
+                output_path.write_text(content, encoding='utf-8')
+                print(f"✅ {input_file.name} → {output_path}")
+                results[i] = output_path
+
+        if documents:
+            lib_dir = str(self.skill_dir / "lib")
+            if lib_dir not in sys.path:
+                sys.path.insert(0, lib_dir)
+            from pdf_converter import convert_documents_to_pdf
+
+            pdf_paths = convert_documents_to_pdf(
+                [(content, pdf_path) for _, content, pdf_path in documents],
+                theme=theme,
+                html=template.endswith('.html.j2')
+            )
+            for (i, _, _), pdf_path in zip(documents, pdf_paths):
+                results[i] = pdf_path
+
+        success = sum(1 for result in results if result)
+        print(f"✓ {success}/{len(input_files)} 生成完成")
+        return results
+
+    @staticmethod
+    def _collect_inputs(inputs):
+        """展开批量输入：目录取其中的 *.yaml（不含 attendees.yaml）"""
+        if isinstance(inputs, (str, Path)):
+            inputs = [inputs]
+
+        input_files = []
+        for item in inputs:
+            path = Path(item)
+            if path.is_dir():
+                input_files.extend(
+                    sorted(p for p in path.glob('*.yaml') if p.name != 'attendees.yaml')
+                )
+            else:
+                input_files.append(path)
+        return input_files
+
+
+def batch_main(argv):
+    """批量生成入口: generate-meeting.py --batch <目录或YAML...>"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="generate-meeting.py --batch",
+        description="在同一进程内批量生成会议纪要"
+    )
+    parser.add_argument("inputs", nargs="+", help="YAML文件或包含YAML文件的目录")
+    parser.add_argument("-o", "--output-dir", help="输出目录（默认当前目录）")
+    parser.add_argument("-t", "--template", default="vcu-meeting-template.j2", help="模板文件名")
+    parser.add_argument("-w", "--workers", type=int, help="工作线程数")
+    parser.add_argument("-p", "--pdf", action="store_true", help="直接生成PDF（不写中间文件）")
+    parser.add_argument("--theme", default="enterprise", help="PDF主题（enterprise/github）")
+    args = parser.parse_args(argv)
+
+    generator = MeetingMinutesGenerator()
+    results = generator.generate_batch(
+        args.inputs,
+        output_dir=args.output_dir,
+        template=args.template,
+        workers=args.workers,
+        pdf=args.pdf,
+        theme=args.theme
+    )
+    if not all(results):
+        sys.exit(1)
+
 
 def main():
     """兼容 CLI 的入口"""
+    if len(sys.argv) > 1 and sys.argv[1] == "--batch":
+        return batch_main(sys.argv[2:])
+
     if len(sys.argv) < 2:
         print("用法: python generate-meeting.py <input.yaml> [output.md] [template.j2]")
+        print("      python generate-meeting.py --batch <目录或YAML...> [-o 输出目录] [-p]")
         print()
         print("示例:")
         print("  python generate-meeting.py data/meeting-input-example.yaml")
         print("  python generate-meeting.py input.yaml output.md")
         print("  python generate-meeting.py input.yaml output.md custom-template.j2")
+        print("  python generate-meeting.py input.yaml vcu-meeting-template.html.j2")
+        print("  python generate-meeting.py --batch data/ -o output/")
         sys.exit(1)
 
     input_file = sys.argv[1]
     output_file = sys.argv[2] if len(sys.argv) > 2 else None
     template = sys.argv[3] if len(sys.argv) > 3 else "vcu-meeting-template.j2"
+    # 只给模板不给输出文件时（如 generate-wrapper.sh --html），第二个参数即模板
+    if output_file and output_file.endswith('.j2') and len(sys.argv) == 3:
+        output_file, template = None, output_file
     try:
         generator = MeetingMinutesGenerator()
         output_path = generator.generate(input_file, output_file, template)
         print()
         print("📌 下一步:")
         print(f"  查看文件: open '{output_path}'")
-        print(f"  转换PDF:  ./scripts/convert.sh '{output_path}'")
+        if output_path.suffix == '.html':
+            print(f"  转换PDF:  ./scripts/generate-wrapper.sh --html -p '{input_file}'")
+        else:
+            print(f"  转换PDF:  ./scripts/convert.sh '{output_path}'")
     except Exception as e:
         print(f"❌ 错误: {e}", file=sys.stderr)
         sys.exit(1)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+会议图片预处理
+上传识别前解码图片、裁掉空白边距、缩放到模型所需分辨率并重新压缩编码，
+结果按源文件哈希缓存
+"""
+
+import hashlib
+import io
+from pathlib import Path
+from typing import Optional, Tuple
+
+# Pillow 为可选依赖，未安装时直接上传原图
+try:
+    from PIL import Image, ImageChops, ImageOps
+except ImportError:
+    Image = None
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "vcu-meeting-ocr" / "images"
+
+# 视觉模型处理的最大长边，更大的图片会被服务端缩小，上传多余像素只会增加耗时
+MAX_LONG_EDGE = 1568
+
+# 裁剪时视为背景的亮度差阈值，以及保留的边距（像素）
+CROP_THRESHOLD = 24
+CROP_PADDING = 16
+
+JPEG_QUALITY = 85
+
+MEDIA_TYPES = {
+    '.jpg': 'image/jpeg',
+    '.jpeg': 'image/jpeg',
+    '.png': 'image/png',
+    '.gif': 'image/gif',
+    '.webp': 'image/webp'
+}
+
+
+def pillow_available() -> bool:
+    """是否可以进行图片预处理"""
+    return Image is not None
+
+
+def crop_to_content(image: "Image.Image") -> "Image.Image":
+    """裁掉与四角背景色接近的边距，保留表格/文字区域"""
+    gray = image.convert('L')
+    background = Image.new('L', gray.size, gray.getpixel((0, 0)))
+    diff = ImageChops.difference(gray, background).point(
+        lambda value: 255 if value > CROP_THRESHOLD else 0
+    )
+    bbox = diff.getbbox()
+    if not bbox:
+        return image
+
+    left, top, right, bottom = bbox
+    width, height = image.size
+    return image.crop((
+        max(0, left - CROP_PADDING),
+        max(0, top - CROP_PADDING),
+        min(width, right + CROP_PADDING),
+        min(height, bottom + CROP_PADDING),
+    ))
+
+
+def _encode(image: "Image.Image") -> Tuple[bytes, str]:
+    """分别按PNG和JPEG编码，取体积较小者
+
+    截图类图片（色块、文字）PNG更小，照片类图片JPEG更小
+    """
+    candidates = []
+
+    png = io.BytesIO()
+    image.save(png, format='PNG', optimize=True)
+    candidates.append((png.getvalue(), 'image/png'))
+
+    if image.mode in ('RGB', 'L'):
+        jpeg = io.BytesIO()
+        image.save(jpeg, format='JPEG', quality=JPEG_QUALITY, optimize=True)
+        candidates.append((jpeg.getvalue(), 'image/jpeg'))
+
+    return min(candidates, key=lambda candidate: len(candidate[0]))
+
+
+def preprocess_image(
+    image_path,
+    max_edge: int = MAX_LONG_EDGE,
+    crop: bool = True,
+    cache_dir: Optional[Path] = None
+) -> Tuple[bytes, str]:
+    """预处理图片并返回编码后的数据
+
+    Args:
+        image_path: 图片文件路径
+        max_edge: 缩放后的最大长边（像素）
+        crop: 是否裁掉空白边距
+        cache_dir: 缓存目录，默认 ``~/.cache/vcu-meeting-ocr/images``
+
+    Returns:
+        tuple: (图片数据, 媒体类型)；未安装Pillow时返回原图
+    """
+    image_path = Path(image_path)
+    source = image_path.read_bytes()
+    original = (source, MEDIA_TYPES.get(image_path.suffix.lower(), 'image/jpeg'))
+    if not pillow_available():
+        return original
+
+    cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+    key = hashlib.sha256(source).hexdigest()
+    stem = f"{key}-{max_edge}-{'crop' if crop else 'full'}"
+    for media_type, suffix in (('image/png', '.png'), ('image/jpeg', '.jpg')):
+        cached = cache_dir / f"{stem}{suffix}"
+        if cached.exists():
+            return cached.read_bytes(), media_type
+
+    with Image.open(io.BytesIO(source)) as opened:
+        # 手机照片按EXIF方向摆正
+        image = ImageOps.exif_transpose(opened)
+        image = image.convert('RGBA' if 'A' in image.getbands() else 'RGB')
+
+    if crop:
+        image = crop_to_content(image)
+    image.thumbnail((max_edge, max_edge), Image.LANCZOS)
+
+    data, media_type = _encode(image)
+    if len(data) >= len(source) and original[1] in ('image/png', 'image/jpeg'):
+        # 原图已经足够紧凑
+        data, media_type = original
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    suffix = '.png' if media_type == 'image/png' else '.jpg'
+    (cache_dir / f"{stem}{suffix}").write_bytes(data)
+
+    return data, media_type
@@ -0,0 +1,463 @@
+#!/usr/bin/env python3
+"""
+VCU项目会议纪要PDF直出渲染器（可导入模块）
+直接从会议YAML数据排版生成PDF，跳过Markdown解析与浏览器渲染，
+版式贴近 enterprise 主题，适合批量生成周例会纪要
+"""
+
+import re
+import sys
+from pathlib import Path
+from xml.sax.saxutils import escape
+
+try:
+    from reportlab.lib import colors
+    from reportlab.lib.enums import TA_CENTER
+    from reportlab.lib.pagesizes import A4
+    from reportlab.lib.styles import ParagraphStyle
+    from reportlab.lib.units import mm
+    from reportlab.pdfbase import pdfmetrics
+    from reportlab.pdfbase.cidfonts import UnicodeCIDFont
+    from reportlab.platypus import (
+        HRFlowable, KeepTogether, ListFlowable, ListItem,
+        Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+    )
+except ImportError:
+    print("❌ 错误: PDF直出需要安装 reportlab 库")
+    print("   安装命令: pip install reportlab")
+    raise
+
+try:
+    from .generate_meeting import MeetingMinutesGenerator
+except ImportError:
+    # 直接以脚本方式运行
+    from generate_meeting import MeetingMinutesGenerator
+
+
+# 内置CJK字体，无需额外字体文件
+FONT_NAME = "STSong-Light"
+
+# enterprise 主题配色
+PRIMARY = colors.HexColor("#1e40af")
+ACCENT = colors.HexColor("#3b82f6")
+TITLE = colors.HexColor("#1a365d")
+TEXT = colors.HexColor("#374151")
+MUTED = colors.HexColor("#6b7280")
+SECTION_BG = colors.HexColor("#dbeafe")
+GROUP_BG = colors.HexColor("#eff6ff")
+STRIPE_BG = colors.HexColor("#f8fafc")
+RULE = colors.HexColor("#e5e7eb")
+
+# 内置CJK字体不含emoji，状态标记替换为同色符号
+STATUS_MARKS = {
+    "✅": '<font color="#16a34a">√</font>',
+    "❌": '<font color="#dc2626">×</font>',
+    "⚠️": '<font color="#d97706">!</font>',
+    "⚠": '<font color="#d97706">!</font>',
+    "🔴": '<font color="#dc2626">●</font>',
+    "🟠": '<font color="#ea580c">●</font>',
+    "🟡": '<font color="#ca8a04">●</font>',
+    "🟢": '<font color="#16a34a">●</font>',
+}
+
+_EMOJI_PATTERN = re.compile("[\U00010000-\U0010ffff\u2600-\u27bf\ufe0f\u200d]")
+
+
+def _markup(value) -> str:
+    """将YAML中的文本转换为reportlab段落标记"""
+    text = escape(str(value if value is not None else "")).replace("\n", "<br/>")
+    for mark, replacement in STATUS_MARKS.items():
+        text = text.replace(mark, replacement)
+    text = _EMOJI_PATTERN.sub("", text)
+    # 模板中使用 `code` 与 **粗体**，这里保留强调效果
+    text = re.sub(r"\*\*(.+?)\*\*", r'<font color="#1a365d">\1</font>', text)
+    return text.replace("`", "").strip()
+
+
+class MeetingPDFRenderer:
+    """会议纪要PDF直出渲染器
+
+    输出结构与 ``vcu-meeting-template.j2`` 一致：
+    基本信息、参会人员、项目状态、模块进展、领导指示、任务、决策、风险。
+    """
+
+    def __init__(self, skill_dir=None, generator=None):
+        """初始化渲染器
+
+        Args:
+            skill_dir: Skill包根目录，默认为脚本所在目录的父目录
+            generator: 复用的 MeetingMinutesGenerator（用于加载YAML与合并参会人员）
+        """
+        self.generator = generator or MeetingMinutesGenerator(skill_dir)
+        if FONT_NAME not in pdfmetrics.getRegisteredFontNames():
+            pdfmetrics.registerFont(UnicodeCIDFont(FONT_NAME))
+        self.styles = self._build_styles()
+        self.page_width = A4[0] - 30 * mm
+
+    def _build_styles(self):
+        """构建与 enterprise 主题对应的段落样式"""
+        base = ParagraphStyle("body", fontName=FONT_NAME, fontSize=10, leading=15, textColor=TEXT)
+        return {
+            "body": base,
+            "h1": ParagraphStyle("h1", parent=base, fontSize=20, leading=28,
+                                 textColor=TITLE, alignment=TA_CENTER),
+            "h2": ParagraphStyle("h2", parent=base, fontSize=15, leading=20, textColor=PRIMARY),
+            "h3": ParagraphStyle("h3", parent=base, fontSize=12.5, leading=18,
+                                 textColor=TEXT, spaceBefore=10),
+            "h4": ParagraphStyle("h4", parent=base, fontSize=11, leading=16,
+                                 textColor=colors.HexColor("#4b5563"), spaceBefore=6, spaceAfter=2),
+            "cell": ParagraphStyle("cell", parent=base, fontSize=9, leading=12.5),
+            "head": ParagraphStyle("head", parent=base, fontSize=9, leading=12.5,
+                                   textColor=colors.white),
+            "footer": ParagraphStyle("footer", parent=base, fontSize=8, textColor=MUTED),
+        }
+
+    def render_file(self, input_file, output_file=None, output_dir=None):
+        """从YAML配置文件生成PDF
+
+        Args:
+            input_file: 会议YAML配置文件
+            output_file: 输出PDF路径，默认按会议日期生成文件名
+            output_dir: 未指定 output_file 时的输出目录，默认为当前目录
+
+        Returns:
+            生成的PDF路径
+        """
+        config_data = self.generator.load_yaml(input_file)
+        config_data = self.generator.merge_attendees(config_data)
+
+        if output_file is None:
+            meeting_time = str(config_data.get('meeting_time', ''))
+            filename = Path(self.generator.generate_filename(meeting_time)).with_suffix('.pdf')
+            output_file = Path(output_dir or '.') / filename
+
+        return self.render(config_data, output_file)
+
+    def render(self, data, output_file):
+        """将会议数据排版为PDF"""
+        output_path = Path(output_file)
+        title = "RB99125046安全运算与控制平台(VCU)项目例会会议纪要"
+
+        doc = SimpleDocTemplate(
+            str(output_path),
+            pagesize=A4,
+            leftMargin=15 * mm,
+            rightMargin=15 * mm,
+            topMargin=20 * mm,
+            bottomMargin=20 * mm,
+            title=title,
+            author=str(data.get('recorder', '')),
+        )
+
+        story = [
+            Paragraph(_markup(title), self.styles["h1"]),
+            Spacer(1, 4),
+            HRFlowable(width="100%", thickness=2.5, color=colors.HexColor("#2563eb"), spaceAfter=8),
+        ]
+        story += self._meeting_info(data)
+        story += self._attendees(data.get('attendees') or {})
+        story += self._project_status(data)
+        story += self._modules(data.get('modules') or [])
+
+        section = 5
+        for builder in (self._leadership, self._tasks, self._decisions, self._risks):
+            flowables = builder(data, section)
+            if flowables:
+                story += flowables
+                section += 1
+
+        story += self._closing(data)
+
+        def draw_footer(canvas, document):
+            canvas.saveState()
+            canvas.setFont(FONT_NAME, 8)
+            canvas.setFillColor(MUTED)
+            canvas.drawString(15 * mm, 10 * mm, title)
+            canvas.drawRightString(A4[0] - 15 * mm, 10 * mm, f"第 {document.page} 页")
+            canvas.restoreState()
+
+        doc.build(story, onFirstPage=draw_footer, onLaterPages=draw_footer)
+        return output_path
+
+    # ---------- 排版元素 ----------
+
+    def _h2(self, text):
+        """二级标题：蓝色左边框与浅蓝底色"""
+        table = Table([[Paragraph(_markup(text), self.styles["h2"])]], colWidths=[self.page_width])
+        table.setStyle(TableStyle([
+            ("BACKGROUND", (0, 0), (-1, -1), SECTION_BG),
+            ("LINEBEFORE", (0, 0), (0, -1), 4, ACCENT),
+            ("LEFTPADDING", (0, 0), (-1, -1), 12),
+            ("TOPPADDING", (0, 0), (-1, -1), 6),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 8),
+        ]))
+        return [Spacer(1, 14), table, Spacer(1, 8)]
+
+    def _h3(self, text):
+        """三级标题：下划分隔线"""
+        return [
+            Paragraph(_markup(text), self.styles["h3"]),
+            HRFlowable(width="100%", thickness=1.5, color=RULE, spaceBefore=2, spaceAfter=6),
+        ]
+
+    def _h4(self, text):
+        return [Paragraph(_markup(text), self.styles["h4"])]
+
+    def _bullets(self, items):
+        """无序列表，项目符号使用主题强调色"""
+        if not items:
+            return []
+        return [ListFlowable(
+            [ListItem(Paragraph(_markup(item), self.styles["body"]), leftIndent=14) for item in items],
+            bulletType="bullet",
+            bulletFontName="Helvetica",
+            bulletColor=ACCENT,
+            bulletFontSize=8,
+            leftIndent=14,
+        ), Spacer(1, 4)]
+
+    def _table(self, header, rows, widths, group_rows=()):
+        """表格：渐变表头近似为主色、隔行底色、浅灰分隔线
+
+        Args:
+            header: 表头文字
+            rows: 数据行
+            widths: 列宽比例
+            group_rows: 分组标题行的索引（不含表头），整行合并显示
+        """
+        total = float(sum(widths))
+        col_widths = [self.page_width * width / total for width in widths]
+        cells = [[Paragraph(_markup(text), self.styles["head"]) for text in header]]
+        cells += [[Paragraph(_markup(value), self.styles["cell"]) for value in row] for row in rows]
+
+        style = [
+            ("BACKGROUND", (0, 0), (-1, 0), PRIMARY),
+            ("VALIGN", (0, 0), (-1, -1), "TOP"),
+            ("LINEBELOW", (0, 1), (-1, -1), 0.5, RULE),
+            ("TOPPADDING", (0, 0), (-1, -1), 5),
+            ("BOTTOMPADDING", (0, 0), (-1, -1), 5),
+            ("LEFTPADDING", (0, 0), (-1, -1), 7),
+            ("RIGHTPADDING", (0, 0), (-1, -1), 7),
+        ]
+        for index in range(2, len(cells), 2):
+            style.append(("BACKGROUND", (0, index), (-1, index), STRIPE_BG))
+        for index in group_rows:
+            style.append(("SPAN", (0, index + 1), (-1, index + 1)))
+            style.append(("BACKGROUND", (0, index + 1), (-1, index + 1), GROUP_BG))
+
+        table = Table(cells, colWidths=col_widths, repeatRows=1)
+        table.setStyle(TableStyle(style))
+        return [table, Spacer(1, 8)]
+
+    # ---------- 各章节 ----------
+
+    def _meeting_info(self, data):
+        meeting_time = str(data.get('meeting_time', ''))
+        meeting_id = data.get('meeting_id') or 'VCU-MEET-' + meeting_time[:10].replace('-', '')
+        rows = [
+            ("会议编号", meeting_id),
+            ("会议主题", "RB99125046安全运算与控制平台(VCU)项目例会"),
+            ("会议时间", f"{meeting_time} (时长: {data.get('meeting_duration', '90分钟')})"),
+            ("会议地点", data.get('meeting_location', '企业微信会议')),
+            ("会议主持", data.get('meeting_host', '')),
+            ("会议性质", data.get('meeting_nature', '定期项目例会')),
+            ("记录人员", data.get('recorder', '')),
+        ]
+        return self._h2("1. 会议基本信息") + self._table(["项目", "内容"], rows, [1, 4])
+
+    def _attendees(self, attendees):
+        rows, groups = [], []
+
+        def present(person):
+            return "✅ 出席" if person.get('present', True) else "❌ 缺席"
+
+        for label, key in (("会议主持", "hosts"), ("管理人员", "managers"), ("技术汇报人员", "engineers")):
+            groups.append(len(rows))
+            rows.append([label, "", "", "", ""])
+            for person in attendees.get(key) or []:
+                status = "✅ 出席(主持人)" if key == "hosts" else present(person)
+                rows.append([
+                    person.get('name', ''), person.get('id', ''), person.get('role', ''),
+                    status, person.get('module', '-'),
+                ])
+
+        return self._h2("2. 参会人员") + self._table(
+            ["姓名", "工号", "部门/职责", "出席情况", "汇报模块"], rows, [1.2, 1, 1.6, 1.4, 2], groups
+        )
+
+    def _project_status(self, data):
+        story = self._h2("3. 项目整体状态")
+        story.append(self._label_line("当前阶段", data.get('project_phase', '开发阶段')))
+        story.append(Spacer(1, 6))
+        for key, label in (
+            ('project_overview', '项目进度概况'),
+            ('key_milestones', '关键里程碑'),
+            ('critical_risks', '关键路径风险'),
+        ):
+            if data.get(key):
+                story.append(Paragraph(f"{label}：", self.styles["h4"]))
+                story += self._bullets(data[key])
+        return story
+
+    def _modules(self, modules):
+        story = self._h2("4. 各模块进展汇报")
+        for module in modules:
+            block = self._h3(f"{module.get('section', '')} {module.get('name', '')}")
+
+            info = [("负责人", module.get('owner', '')), ("进展状态", module.get('status', ''))]
+            if module.get('priority'):
+                info.append(("优先级", module['priority']))
+            if module.get('owner') or module.get('status'):
+                block += self._table(["项目", "内容"], info, [1, 4])
+            # 标题与信息表保持在同一页
+            story.append(KeepTogether(block))
+
+            completed = module.get('completed')
+            if completed:
+                story += self._h4("✅ 已完成工作")
+                if isinstance(completed, dict):
+                    story += self._table(["工作项", "完成时间"], list(completed.items()), [4, 1.2])
+                else:
+                    story += self._bullets(completed)
+
+            if module.get('progress'):
+                story += self._h4("当前工作") + self._bullets(module['progress'])
+            if module.get('plans'):
+                story += self._h4("下周计划") + self._bullets(module['plans'])
+
+            issues = module.get('issues') or []
+            if issues:
+                story += self._h4("⚠️ 存在问题与解决方案")
+                story += self._records(
+                    issues,
+                    [("问题描述", "description", 2), ("影响", "impact", 2),
+                     ("解决方案", "solution", 2.6), ("负责人", "owner", 1), ("期限", "deadline", 1)],
+                    defaults={'deadline': '待定'}
+                )
+
+            if module.get('notes'):
+                story += self._h4("备注") + self._bullets(module['notes'])
+        return story
+
+    def _leadership(self, data, section):
+        leaders = data.get('leadership_instructions') or []
+        if not leaders:
+            return []
+        story = self._h2(f"{section}. 领导指示")
+        for leader in leaders:
+            heading = leader.get('title') or f"{leader.get('name', '')}指示"
+            story += self._h3(f"{leader.get('section', '')} {heading}")
+            instructions = leader.get('instructions') or {}
+            if isinstance(instructions, dict):
+                for category, items in instructions.items():
+                    story.append(self._label_line(category, ""))
+                    story += self._bullets(items)
+            else:
+                # 旧版配置直接列出指示内容，不分类
+                story += self._bullets(instructions)
+        return story
+
+    def _tasks(self, data, section):
+        tasks = data.get('tasks') or []
+        if not tasks:
+            return []
+        return self._h2(f"{section}. 关键任务跟踪") + self._records(tasks, [
+            ("任务编号", "id", 0.9), ("任务内容", "content", 3.2), ("负责人", "owner", 1),
+            ("计划完成时间", "deadline", 1.2), ("状态", "status", 1.1), ("优先级", "priority", 0.9),
+        ])
+
+    def _decisions(self, data, section):
+        decisions = data.get('decisions') or []
+        if not decisions:
+            return []
+        return self._h2(f"{section}. 决策事项") + self._records(decisions, [
+            ("决策编号", "id", 0.9), ("决策内容", "content", 2.6), ("决策状态", "status", 1),
+            ("责任人", "owner", 0.9), ("执行时间", "time", 1), ("影响范围", "scope", 1.2),
+            ("前置条件", "prerequisite", 1),
+        ], defaults={'prerequisite': '-'})
+
+    def _risks(self, data, section):
+        risks = data.get('risks') or []
+        if not risks:
+            return []
+        return self._h2(f"{section}. 风险识别与应对") + self._records(risks, [
+            ("风险编号", "id", 0.9), ("风险描述", "description", 3), ("风险等级", "level", 0.9),
+            ("应对措施", "solution", 3), ("负责人", "owner", 0.9),
+        ])
+
+    def _records(self, records, columns, defaults=None):
+        """结构化条目渲染为表格；配置中直接写成文字列表时渲染为列表
+
+        Args:
+            records: 条目列表
+            columns: (表头, 字段名, 列宽比例) 列表
+            defaults: 字段缺失时的默认值
+        """
+        if not all(isinstance(record, dict) for record in records):
+            return self._bullets(records)
+        defaults = defaults or {}
+        rows = [
+            [record.get(key, defaults.get(key, '')) for _, key, _ in columns]
+            for record in records
+        ]
+        return self._table(
+            [header for header, _, _ in columns], rows, [width for _, _, width in columns]
+        )
+
+    def _closing(self, data):
+        lines = [
+            ("会议纪要状态", "✅ 已确认"),
+            ("会议结束时间", data.get('meeting_end_time', '待定')),
+        ]
+        if data.get('approval_info'):
+            lines.append(("审核人员", data['approval_info']))
+        lines.append(("分发范围", data.get('distribution_scope', '项目组全员 / 相关管理层')))
+        return [
+            Spacer(1, 10),
+            HRFlowable(width="100%", thickness=1, color=RULE, spaceAfter=6),
+        ] + [self._label_line(label, value) for label, value in lines]
+
+    def _label_line(self, label, value):
+        """“标签：内容”形式的段落（内置CJK字体没有粗体，标签用标题色区分）"""
+        return Paragraph(
+            f'<font color="#1a365d">{_markup(label)}：</font>{_markup(value)}', self.styles["body"]
+        )
+
+
+def main(argv=None):
+    """命令行入口：支持一次渲染多个YAML文件"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="从会议YAML直接生成PDF（不经过Markdown与浏览器）",
+        epilog=(
+            "示例:\n"
+            "  python scripts/meeting_pdf_renderer.py data/meeting-input-example.yaml\n"
+            "  python scripts/meeting_pdf_renderer.py data/meeting-input-*.yaml -o output/"
+        ),
+        formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("inputs", nargs="+", help="会议YAML配置文件")
+    parser.add_argument("-o", "--output-dir", help="输出目录（默认当前目录）")
+    args = parser.parse_args(argv)
+
+    output_dir = None
+    if args.output_dir:
+        output_dir = Path(args.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+    renderer = MeetingPDFRenderer()
+    failed = 0
+    for input_file in args.inputs:
+        try:
+            output_path = renderer.render_file(input_file, output_dir=output_dir)
+            print(f"✅ {output_path} ({output_path.stat().st_size / 1024:.1f} KB)")
+        except Exception as e:
+            failed += 1
+            print(f"❌ {input_file}: {e}", file=sys.stderr)
+
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
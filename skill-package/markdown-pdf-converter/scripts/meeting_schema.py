@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+会议输入数据校验
+meeting-input-*.yaml 的结构声明，导入时编译为校验函数，
+渲染前一次性报告所有不合规字段的精确路径
+"""
+
+import datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+
+# 可直接输出为文本的标量（YAML中未加引号的数字、日期也可接受）
+TEXT = (str, int, float, datetime.date)
+
+_TYPE_NAMES = {
+    str: '字符串', int: '整数', float: '数字', bool: '布尔值',
+    datetime.date: '日期', dict: '映射', list: '列表',
+}
+
+Validator = Callable[[Any, str, List[Tuple[str, str]]], None]
+
+
+class MeetingSchemaError(ValueError):
+    """会议输入不符合结构要求"""
+
+    def __init__(self, errors: Sequence[Tuple[str, str]], source: Optional[str] = None):
+        self.errors = list(errors)
+        self.source = source
+        header = f"会议配置校验失败{f' ({source})' if source else ''}: {len(self.errors)} 处错误"
+        lines = [f"  - {path or '<根>'}: {message}" for path, message in self.errors]
+        super().__init__("\n".join([header] + lines))
+
+
+class Mapping:
+    """映射结构声明
+
+    Args:
+        required: 必填字段 -> 字段结构
+        optional: 可选字段 -> 字段结构（值为 null 视为未填写）
+        one_of: 至少需要填写其中一个的字段名
+    """
+
+    def __init__(self, required: Optional[Dict] = None, optional: Optional[Dict] = None,
+                 one_of: Sequence[str] = ()):
+        self.required = required or {}
+        self.optional = optional or {}
+        self.one_of = tuple(one_of)
+
+
+class MapOf:
+    """键值类型统一的映射（如 已完成工作项 -> 完成时间）"""
+
+    def __init__(self, value):
+        self.value = value
+
+
+class AnyOf:
+    """满足任一结构即可"""
+
+    def __init__(self, *options):
+        self.options = options
+
+
+def _describe(spec) -> str:
+    if isinstance(spec, tuple):
+        return '/'.join(dict.fromkeys(_TYPE_NAMES.get(t, t.__name__) for t in spec))
+    if isinstance(spec, type):
+        return _TYPE_NAMES.get(spec, spec.__name__)
+    if isinstance(spec, (Mapping, MapOf)):
+        return '映射'
+    if isinstance(spec, list):
+        return '列表'
+    if isinstance(spec, AnyOf):
+        return '或'.join(_describe(option) for option in spec.options)
+    return str(spec)
+
+
+def _type_name(value) -> str:
+    if value is None:
+        return 'null'
+    return _TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+def _join(path: str, key) -> str:
+    return f"{path}.{key}" if path else str(key)
+
+
+def compile_schema(spec) -> Validator:
+    """将结构声明编译为校验函数
+
+    声明形式: 类型或类型元组（标量）、``[元素结构]``（列表）、
+    ``Mapping`` / ``MapOf`` / ``AnyOf``。编译后的函数签名为
+    ``validate(value, path, errors)``，错误以 (路径, 说明) 追加到 errors。
+    """
+    if isinstance(spec, (type, tuple)):
+        types = spec if isinstance(spec, tuple) else (spec,)
+        # bool 是 int 的子类，未声明布尔值时不接受 true/false
+        allow_bool = bool in types
+        expected = _describe(spec)
+
+        def validate_scalar(value, path, errors):
+            if not isinstance(value, types) or (isinstance(value, bool) and not allow_bool):
+                errors.append((path, f"应为{expected}，实际为{_type_name(value)}"))
+        return validate_scalar
+
+    if isinstance(spec, list):
+        validate_item = compile_schema(spec[0])
+
+        def validate_list(value, path, errors):
+            if not isinstance(value, list):
+                errors.append((path, f"应为列表，实际为{_type_name(value)}"))
+                return
+            for i, item in enumerate(value):
+                validate_item(item, f"{path}[{i}]", errors)
+        return validate_list
+
+    if isinstance(spec, MapOf):
+        validate_value = compile_schema(spec.value)
+
+        def validate_map_of(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append((path, f"应为映射，实际为{_type_name(value)}"))
+                return
+            for key, item in value.items():
+                validate_value(item, _join(path, key), errors)
+        return validate_map_of
+
+    if isinstance(spec, AnyOf):
+        validators = [compile_schema(option) for option in spec.options]
+        expected = _describe(spec)
+
+        def validate_any(value, path, errors):
+            for validator in validators:
+                attempt: List[Tuple[str, str]] = []
+                validator(value, path, attempt)
+                if not attempt:
+                    return
+            errors.append((path, f"应为{expected}，实际为{_type_name(value)}"))
+        return validate_any
+
+    if isinstance(spec, Mapping):
+        required = [(key, compile_schema(field)) for key, field in spec.required.items()]
+        optional = [(key, compile_schema(field)) for key, field in spec.optional.items()]
+        one_of = spec.one_of
+
+        def validate_mapping(value, path, errors):
+            if not isinstance(value, dict):
+                errors.append((path, f"应为映射，实际为{_type_name(value)}"))
+                return
+            for key, validator in required:
+                if value.get(key) is None:
+                    errors.append((_join(path, key), "缺少必填字段"))
+                else:
+                    validator(value[key], _join(path, key), errors)
+            for key, validator in optional:
+                if value.get(key) is not None:
+                    validator(value[key], _join(path, key), errors)
+            if one_of and all(value.get(key) is None for key in one_of):
+                errors.append((path, f"至少需要填写 {' / '.join(one_of)} 之一"))
+        return validate_mapping
+
+    raise TypeError(f"无法识别的结构声明: {spec!r}")
+
+
+PERSON = Mapping(
+    required={'name': TEXT},
+    optional={
+        'id': TEXT,
+        'employee_id': TEXT,
+        'role': TEXT,
+        'module': TEXT,
+        'present': bool,
+    }
+)
+
+MODULE = Mapping(
+    required={'section': TEXT, 'name': TEXT},
+    optional={
+        'owner': TEXT,
+        'status': TEXT,
+        'priority': TEXT,
+        'completed': AnyOf([TEXT], MapOf(TEXT)),
+        'progress': [TEXT],
+        'plans': [TEXT],
+        'issues': AnyOf([AnyOf(TEXT, Mapping())], Mapping()),
+        'notes': [TEXT],
+    }
+)
+
+MEETING_SCHEMA = Mapping(
+    required={
+        # 模板从 meeting_time 截取日期生成会议编号和文件名
+        'meeting_time': str,
+        'meeting_host': TEXT,
+    },
+    optional={
+        **{key: TEXT for key in (
+            'meeting_id', 'meeting_location', 'meeting_duration', 'meeting_end_time',
+            'next_meeting_time', 'recorder', 'meeting_nature', 'meeting_type', 'priority',
+            'company_name', 'project_phase', 'distribution_scope', 'approval_info',
+        )},
+        'attendees': Mapping(optional={
+            'hosts': [PERSON],
+            'managers': [PERSON],
+            'engineers': [PERSON],
+        }),
+        'project_overview': [TEXT],
+        'key_milestones': [TEXT],
+        'critical_risks': [TEXT],
+        'modules': [MODULE],
+        'leadership_instructions': [Mapping(
+            required={
+                'section': TEXT,
+                # 分类 -> 指示列表，或直接为指示列表
+                'instructions': AnyOf(MapOf([TEXT]), [TEXT]),
+            },
+            optional={'name': TEXT, 'title': TEXT},
+            one_of=('name', 'title')
+        )],
+        'tasks': [Mapping(
+            required={'content': TEXT},
+            optional={key: TEXT for key in ('id', 'owner', 'deadline', 'status', 'priority')}
+        )],
+        'decisions': [AnyOf(TEXT, Mapping())],
+        'risks': [Mapping(
+            required={'description': TEXT},
+            optional={key: TEXT for key in ('id', 'level', 'solution', 'owner')}
+        )],
+    }
+)
+
+_validate_meeting = compile_schema(MEETING_SCHEMA)
+
+
+def meeting_errors(config_data) -> List[Tuple[str, str]]:
+    """校验会议配置，返回 (字段路径, 说明) 列表，合规时为空"""
+    errors: List[Tuple[str, str]] = []
+    _validate_meeting(config_data, '', errors)
+    return errors
+
+
+def validate_meeting(config_data, source: Optional[str] = None):
+    """校验会议配置，不合规时抛出 MeetingSchemaError（列出全部错误）
+
+    Args:
+        config_data: 会议配置字典（与YAML结构一致）
+        source: 配置来源（文件名），用于错误信息
+    """
+    errors = meeting_errors(config_data)
+    if errors:
+        raise MeetingSchemaError(errors, source)
@@ -9,29 +9,80 @@ import sys
 import json
 import yaml
 import base64
+import asyncio
 import argparse
-import subprocess
 from pathlib import Path
 from datetime import datetime
 from typing import Dict, List, Optional
 
-# 尝试导入anthropic，如果未安装则提示
+# anthropic 仅远程识别需要，离线使用本地后端时可不安装
 try:
     import anthropic
 except ImportError:
-    print("❌ 错误: 需要安装 anthropic 库")
-    print("   安装命令: pip install anthropic")
-    sys.exit(1)
+    anthropic = None
+
+from generate_meeting import MeetingMinutesGenerator
+from response_cache import ResponseCache
+from image_preprocess import MEDIA_TYPES, preprocess_image
+from batch_ocr import BatchCheckpoint, TokenBucket, find_images
+from attendee_index import AttendeeIndex, normalize_id, normalize_name
+from meeting_schema import MeetingSchemaError, meeting_errors
+from ocr_backends import AttendeeBackend, TesseractBackend, crop_rows
+
+
+MODEL_NAME = "claude-sonnet-4-20250514"
+# 提示词结构调整时递增，使旧缓存失效
+PROMPT_VERSION = "1"
+
+
+def is_retryable(error: Exception) -> bool:
+    """是否值得重试：超时、连接失败、限流(429)和服务端错误(5xx)
+
+    认证失败、请求参数错误等重试也不会成功的错误立即抛出
+    """
+    if isinstance(error, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    if anthropic is not None and isinstance(
+        error, (anthropic.APIConnectionError, anthropic.RateLimitError, anthropic.InternalServerError)
+    ):
+        return True
+    status_code = getattr(error, 'status_code', None)
+    return isinstance(status_code, int) and (status_code == 429 or status_code >= 500)
 
 
 class MeetingImageExtractor:
     """会议图片OCR提取器"""
 
-    def __init__(self, skill_dir=None):
+    def __init__(
+        self,
+        skill_dir=None,
+        client=None,
+        base_url: Optional[str] = None,
+        timeout: float = 120.0,
+        max_retries: int = 2,
+        cache: Optional[ResponseCache] = None,
+        use_cache: bool = True,
+        preprocess: bool = True,
+        crop_image: bool = True,
+        backend: str = 'auto',
+        local_backend: Optional[AttendeeBackend] = None
+    ):
         """初始化提取器
 
         Args:
             skill_dir: Skill包根目录，默认为脚本所在目录的父目录
+            client: 异步消息客户端（需提供 ``await client.messages.create(...)``），
+                默认使用 ``anthropic.AsyncAnthropic``；测试和压测时可替换为本地桩服务
+            base_url: API地址，指向本地桩服务时使用
+            timeout: 单次API调用超时（秒）
+            max_retries: 超时或调用失败后的重试次数
+            cache: 响应缓存，默认使用 ``~/.cache/vcu-meeting-ocr``
+            use_cache: 是否启用响应缓存（``--no-cache`` 时关闭）
+            preprocess: 上传前是否缩放并重新压缩图片
+            crop_image: 预处理时是否裁掉空白边距
+            backend: 参会人员识别方式: remote（仅远程模型）、local（仅本地OCR，离线可用）、
+                auto（本地可用时先本地识别，仅把无法对应参会人员索引的行交给远程模型）
+            local_backend: 本地识别后端，默认使用 Tesseract
         """
         if skill_dir is None:
             skill_dir = Path(__file__).parent.parent
@@ -41,31 +92,62 @@ class MeetingImageExtractor:
         self.skill_dir = skill_dir
         self.data_dir = skill_dir / "data"
         self.scripts_dir = skill_dir / "scripts"
+        self.lib_dir = skill_dir / "lib"
+
+        # 进程内生成会议纪要，不再启动子进程
+        self.generator = MeetingMinutesGenerator(skill_dir)
+
+        # 加载参会人员索引
+        self.attendee_index = self._load_attendee_index()
+
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.cache = (cache or ResponseCache()) if use_cache else None
+        self.preprocess = preprocess
+        self.crop_image = crop_image
+        # 批量模式下设置令牌桶限速
+        self.rate_limiter: Optional[TokenBucket] = None
+
+        # 本地识别后端
+        self.local_backend = None
+        if backend != 'remote':
+            local_backend = local_backend or TesseractBackend()
+            if local_backend.available():
+                self.local_backend = local_backend
+            elif backend == 'local':
+                raise ValueError(
+                    "❌ 错误: 本地识别不可用\n"
+                    "   安装方法: pip install pytesseract Pillow，并安装 tesseract 及中文语言包(chi_sim)"
+                )
 
-        # 加载参会人员数据库
-        self.attendees_db = self._load_attendees_db()
-
-        # 初始化Claude客户端
-        api_key = os.environ.get("ANTHROPIC_API_KEY")
-        if not api_key:
-            raise ValueError(
-                "❌ 错误: 未设置 ANTHROPIC_API_KEY 环境变量\n"
-                "   设置方法: export ANTHROPIC_API_KEY='your-api-key'"
-            )
+        # 初始化Claude客户端（异步，双输入模式下两次调用并发执行）
+        if client is None and backend != 'local':
+            api_key = os.environ.get("ANTHROPIC_API_KEY")
+            if anthropic is not None and api_key:
+                # 超时与重试由 _create_message 统一控制，避免与SDK内置重试叠加
+                client = anthropic.AsyncAnthropic(api_key=api_key, base_url=base_url, max_retries=0)
+            elif self.local_backend is None:
+                raise ValueError(
+                    "❌ 错误: 未设置 ANTHROPIC_API_KEY 环境变量（或未安装 anthropic）\n"
+                    "   设置方法: export ANTHROPIC_API_KEY='your-api-key'"
+                )
+            else:
+                print("ℹ️  未配置远程模型，仅使用本地识别")
 
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = client
 
-    def _load_attendees_db(self) -> Dict:
-        """加载参会人员数据库"""
+    def _load_attendee_index(self) -> AttendeeIndex:
+        """加载参会人员索引（attendees.yaml 未修改时复用持久化的索引）"""
         attendees_file = self.data_dir / "attendees.yaml"
         if not attendees_file.exists():
             raise FileNotFoundError(f"参会人员数据库不存在: {attendees_file}")
 
-        with open(attendees_file, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
+        return AttendeeIndex.load(attendees_file)
 
     def _encode_image(self, image_path: str) -> tuple[str, str]:
-        """将图片编码为base64
+        """将图片预处理后编码为base64
+
+        预处理（裁边、缩放、重新压缩）需要Pillow，未安装或关闭预处理时上传原图
 
         Args:
             image_path: 图片文件路径
@@ -77,23 +159,125 @@ class MeetingImageExtractor:
         if not image_path.exists():
             raise FileNotFoundError(f"图片文件不存在: {image_path}")
 
-        # 根据文件扩展名确定媒体类型
-        ext = image_path.suffix.lower()
-        media_type_map = {
-            '.jpg': 'image/jpeg',
-            '.jpeg': 'image/jpeg',
-            '.png': 'image/png',
-            '.gif': 'image/gif',
-            '.webp': 'image/webp'
-        }
-        media_type = media_type_map.get(ext, 'image/jpeg')
+        if self.preprocess:
+            data, media_type = preprocess_image(image_path, crop=self.crop_image)
+            print(f"   上传大小: {len(data) / 1024:.0f} KB（原图 {image_path.stat().st_size / 1024:.0f} KB）")
+        else:
+            data = image_path.read_bytes()
+            media_type = MEDIA_TYPES.get(image_path.suffix.lower(), 'image/jpeg')
 
-        with open(image_path, 'rb') as f:
-            image_data = base64.standard_b64encode(f.read()).decode('utf-8')
+        image_data = base64.standard_b64encode(data).decode('utf-8')
 
         return image_data, media_type
 
-    def extract_attendees_from_image(self, image_path: str) -> List[Dict]:
+    async def _encode_image_async(self, image_path: str) -> tuple[str, str]:
+        """在线程中执行 ``_encode_image``，图片解码和重新压缩不阻塞事件循环"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._encode_image, image_path)
+
+    async def _create_message(self, content, max_tokens: int) -> str:
+        """调用模型并返回文本响应，带单次超时和指数退避重试（仅重试 ``is_retryable`` 的错误）
+
+        Args:
+            content: 消息内容（字符串或内容块列表）
+            max_tokens: 最大输出token数
+
+        Returns:
+            str: 响应文本
+        """
+        if self.client is None:
+            raise RuntimeError("未配置远程模型（ANTHROPIC_API_KEY），离线模式只能识别参会人员")
+
+        for attempt in range(self.max_retries + 1):
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            try:
+                message = await asyncio.wait_for(
+                    self.client.messages.create(
+                        model=MODEL_NAME,
+                        max_tokens=max_tokens,
+                        messages=[{"role": "user", "content": content}],
+                    ),
+                    timeout=self.timeout
+                )
+                return message.content[0].text
+            except Exception as e:
+                if attempt >= self.max_retries or not is_retryable(e):
+                    raise
+                delay = 2 ** attempt
+                reason = "超时" if isinstance(e, asyncio.TimeoutError) else e
+                print(f"  ⏳ API调用失败（{reason}），{delay}秒后重试 ({attempt + 1}/{self.max_retries})")
+                await asyncio.sleep(delay)
+
+    async def _request_json(self, payload: str, prompt: str, content, max_tokens: int) -> Dict:
+        """调用模型并解析JSON响应，命中缓存时不请求API
+
+        Args:
+            payload: 图片base64数据或会议文本（参与缓存键计算）
+            prompt: 提示词
+            content: 消息内容
+            max_tokens: 最大输出token数
+
+        Returns:
+            dict: 解析后的JSON数据
+        """
+        key = None
+        if self.cache is not None:
+            key = self.cache.make_key(payload, prompt, PROMPT_VERSION, MODEL_NAME)
+            cached = self.cache.get(key)
+            if cached is not None:
+                print("  💾 使用缓存的识别结果")
+                return cached
+
+        response_text = await self._create_message(content, max_tokens)
+        try:
+            data = self._extract_json(response_text)
+        except json.JSONDecodeError:
+            print(f"原始响应:\n{response_text}")
+            raise
+
+        if key is not None:
+            self.cache.put(key, data)
+        return data
+
+    @staticmethod
+    def _extract_json(response_text: str) -> Dict:
+        """从响应中提取JSON
+
+        Claude可能会在JSON前后添加说明文字，需要提取```json```块
+        """
+        if "```json" in response_text:
+            json_start = response_text.find("```json") + 7
+            json_end = response_text.find("```", json_start)
+            json_str = response_text[json_start:json_end].strip()
+        elif "```" in response_text:
+            json_start = response_text.find("```") + 3
+            json_end = response_text.find("```", json_start)
+            json_str = response_text[json_start:json_end].strip()
+        else:
+            json_str = response_text.strip()
+
+        return json.loads(json_str)
+
+    @staticmethod
+    def _image_content(image_data: str, media_type: str, prompt: str) -> List[Dict]:
+        """构建图片+文本的消息内容"""
+        return [
+            {
+                "type": "image",
+                "source": {
+                    "type": "base64",
+                    "media_type": media_type,
+                    "data": image_data,
+                },
+            },
+            {
+                "type": "text",
+                "text": prompt
+            }
+        ]
+
+    async def extract_attendees_from_image_async(self, image_path: str) -> List[Dict]:
         """从图片中仅提取参会人员信息（用于双输入模式）
 
         Args:
@@ -104,9 +288,63 @@ class MeetingImageExtractor:
         """
         print(f"🔍 分析参会人员图片: {image_path}")
 
+        if self.local_backend is not None:
+            return await self._extract_attendees_local_first(image_path)
+
         # 编码图片
-        image_data, media_type = self._encode_image(image_path)
+        image_data, media_type = await self._encode_image_async(image_path)
+        return await self._extract_attendees_remote(image_data, media_type)
+
+    async def _extract_attendees_local_first(self, image_path: str) -> List[Dict]:
+        """本地OCR初筛，仅把无法对应参会人员索引的行交给远程模型
+
+        Args:
+            image_path: 图片文件路径
+
+        Returns:
+            list: 参会人员列表（结构与远程识别一致）
+        """
+        rows = await self.local_backend.extract_rows_async(image_path)
+        parsed = [row for row in rows if row.attendee]
+
+        resolved, pending = [], []
+        for row in parsed:
+            person, _ = self.attendee_index.lookup(row.attendee.get('name', ''), row.attendee.get('employee_id', ''))
+            (resolved if person else pending).append(row)
+
+        print(f"  🖥️  本地识别({self.local_backend.name}): {len(parsed)} 行，"
+              f"{len(resolved)} 行已对应参会人员索引")
+
+        if self.client is None:
+            attendees = [row.attendee for row in parsed]
+        elif not parsed:
+            # 本地什么都没识别出来（如缺少语言包），整张图片交给远程模型
+            image_data, media_type = await self._encode_image_async(image_path)
+            return await self._extract_attendees_remote(image_data, media_type)
+        elif pending:
+            print(f"  ☁️  {len(pending)} 行交给远程模型识别")
+            # 整图解码、截取和PNG压缩在线程中执行，不阻塞事件循环
+            loop = asyncio.get_running_loop()
+            crop = await loop.run_in_executor(None, crop_rows, image_path, [row.bbox for row in pending])
+            image_data = base64.standard_b64encode(crop).decode('utf-8')
+            remote = await self._extract_attendees_remote(image_data, 'image/png')
+            attendees = [row.attendee for row in resolved] + remote
+        else:
+            attendees = [row.attendee for row in resolved]
+
+        print(f"✅ 成功提取 {len(attendees)} 名参会人员")
+        return attendees
 
+    async def _extract_attendees_remote(self, image_data: str, media_type: str) -> List[Dict]:
+        """调用远程模型识别参会人员
+
+        Args:
+            image_data: base64编码的图片数据
+            media_type: 媒体类型
+
+        Returns:
+            list: 参会人员列表
+        """
         # 构建简化的提示词（只关注参会人员）
         prompt = """请仔细分析这张参会人员列表图片，提取所有参会人员的信息。
 
@@ -133,46 +371,12 @@ class MeetingImageExtractor:
 
         # 调用Claude Vision API
         try:
-            message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=2048,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": image_data,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ],
-                    }
-                ],
+            extracted_data = await self._request_json(
+                image_data,
+                prompt,
+                self._image_content(image_data, media_type, prompt),
+                max_tokens=2048
             )
-
-            # 解析响应
-            response_text = message.content[0].text
-
-            # 提取JSON
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            else:
-                json_str = response_text.strip()
-
-            extracted_data = json.loads(json_str)
             attendees = extracted_data.get('attendees', [])
 
             print(f"✅ 成功提取 {len(attendees)} 名参会人员")
@@ -181,13 +385,12 @@ class MeetingImageExtractor:
 
         except json.JSONDecodeError as e:
             print(f"❌ JSON解析失败: {e}")
-            print(f"原始响应:\n{response_text}")
             raise
         except Exception as e:
             print(f"❌ API调用失败: {e}")
             raise
 
-    def parse_meeting_content(self, content_text: str) -> Dict:
+    async def parse_meeting_content_async(self, content_text: str) -> Dict:
         """从文本中解析会议内容
 
         Args:
@@ -271,33 +474,7 @@ class MeetingImageExtractor:
 
         # 调用Claude API解析文本
         try:
-            message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-            )
-
-            # 解析响应
-            response_text = message.content[0].text
-
-            # 提取JSON
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            else:
-                json_str = response_text.strip()
-
-            parsed_data = json.loads(json_str)
+            parsed_data = await self._request_json(content_text, prompt, prompt, max_tokens=4096)
 
             print(f"✅ 成功解析会议内容")
             if 'modules' in parsed_data:
@@ -311,13 +488,12 @@ class MeetingImageExtractor:
 
         except json.JSONDecodeError as e:
             print(f"❌ JSON解析失败: {e}")
-            print(f"原始响应:\n{response_text}")
             raise
         except Exception as e:
             print(f"❌ API调用失败: {e}")
             raise
 
-    def extract_from_image(self, image_path: str) -> Dict:
+    async def extract_from_image_async(self, image_path: str) -> Dict:
         """使用Claude Vision API从图片中提取会议信息
 
         Args:
@@ -328,8 +504,13 @@ class MeetingImageExtractor:
         """
         print(f"🔍 分析图片: {image_path}")
 
+        if self.client is None:
+            # 离线模式只能识别参会人员，会议信息和模块进展需要远程模型
+            print("  ℹ️  离线模式仅提取参会人员")
+            return {'attendees': await self.extract_attendees_from_image_async(image_path)}
+
         # 编码图片
-        image_data, media_type = self._encode_image(image_path)
+        image_data, media_type = await self._encode_image_async(image_path)
 
         # 构建提示词
         prompt = """请仔细分析这张会议相关的图片，提取以下信息：
@@ -396,48 +577,13 @@ class MeetingImageExtractor:
 
         # 调用Claude Vision API
         try:
-            message = self.client.messages.create(
-                model="claude-sonnet-4-20250514",
-                max_tokens=4096,
-                messages=[
-                    {
-                        "role": "user",
-                        "content": [
-                            {
-                                "type": "image",
-                                "source": {
-                                    "type": "base64",
-                                    "media_type": media_type,
-                                    "data": image_data,
-                                },
-                            },
-                            {
-                                "type": "text",
-                                "text": prompt
-                            }
-                        ],
-                    }
-                ],
+            extracted_data = await self._request_json(
+                image_data,
+                prompt,
+                self._image_content(image_data, media_type, prompt),
+                max_tokens=4096
             )
 
-            # 解析响应
-            response_text = message.content[0].text
-
-            # 尝试从响应中提取JSON
-            # Claude可能会在JSON前后添加说明文字，需要提取```json```块
-            if "```json" in response_text:
-                json_start = response_text.find("```json") + 7
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            elif "```" in response_text:
-                json_start = response_text.find("```") + 3
-                json_end = response_text.find("```", json_start)
-                json_str = response_text[json_start:json_end].strip()
-            else:
-                json_str = response_text.strip()
-
-            extracted_data = json.loads(json_str)
-
             print(f"✅ 成功提取信息")
             print(f"   - 找到 {len(extracted_data.get('attendees', []))} 名参会人员")
             if 'modules' in extracted_data:
@@ -447,12 +593,36 @@ class MeetingImageExtractor:
 
         except json.JSONDecodeError as e:
             print(f"❌ JSON解析失败: {e}")
-            print(f"原始响应:\n{response_text}")
             raise
         except Exception as e:
             print(f"❌ API调用失败: {e}")
             raise
 
+    def extract_attendees_from_image(self, image_path: str) -> List[Dict]:
+        """同步版本的 ``extract_attendees_from_image_async``"""
+        return asyncio.run(self.extract_attendees_from_image_async(image_path))
+
+    def parse_meeting_content(self, content_text: str) -> Dict:
+        """同步版本的 ``parse_meeting_content_async``"""
+        return asyncio.run(self.parse_meeting_content_async(content_text))
+
+    def extract_from_image(self, image_path: str) -> Dict:
+        """同步版本的 ``extract_from_image_async``"""
+        return asyncio.run(self.extract_from_image_async(image_path))
+
+    async def extract_dual_input_async(self, image_path: str, content_text: str) -> tuple[List[Dict], Dict]:
+        """并发执行参会人员图片识别和会议内容解析
+
+        两次调用互不依赖，总耗时取决于较慢的一次
+
+        Returns:
+            tuple: (参会人员列表, 会议内容数据)
+        """
+        return await asyncio.gather(
+            self.extract_attendees_from_image_async(image_path),
+            self.parse_meeting_content_async(content_text)
+        )
+
     def match_attendees(self, extracted_attendees: List[Dict]) -> List[Dict]:
         """将提取的参会人员与数据库匹配
 
@@ -460,45 +630,38 @@ class MeetingImageExtractor:
             extracted_attendees: 从图片中提取的参会人员列表
 
         Returns:
-            list: 匹配后的完整参会人员信息
+            list: 匹配后的完整参会人员信息（同一人员被识别为多行时只保留第一行）
         """
         print("\n🔗 匹配参会人员数据库...")
 
         matched = []
         unmatched = []
-
-        # 构建数据库索引（按姓名和工号）
-        db_by_name = {}
-        db_by_id = {}
-
-        for category in ['hosts', 'managers', 'engineers']:
-            if category not in self.attendees_db:
-                continue
-            for person in self.attendees_db[category]:
-                name = person.get('name', '')
-                emp_id = person.get('employee_id', '')
-                if name:
-                    db_by_name[name] = person
-                if emp_id:
-                    db_by_id[emp_id] = person
+        seen = set()
 
         # 匹配每个提取的人员
         for extracted in extracted_attendees:
-            name = extracted.get('name', '').strip()
-            emp_id = extracted.get('employee_id', '').strip()
+            name = str(extracted.get('name') or '').strip()
+            emp_id = str(extracted.get('employee_id') or '').strip()
 
-            matched_person = None
+            person, how = self.attendee_index.lookup(name, emp_id)
+            matched_person = person.copy() if person else None
 
-            # 优先按工号匹配
-            if emp_id and emp_id in db_by_id:
-                matched_person = db_by_id[emp_id].copy()
+            # 优先按工号匹配，其次按姓名匹配，最后容忍识别错字的模糊匹配
+            if how == 'id':
                 print(f"  ✓ {name} ({emp_id}) - 按工号匹配")
-            # 其次按姓名匹配
-            elif name and name in db_by_name:
-                matched_person = db_by_name[name].copy()
+            elif how == 'name':
                 print(f"  ✓ {name} - 按姓名匹配")
+            elif how == 'fuzzy':
+                print(f"  ✓ {name} → {person.get('name')} - 模糊匹配，请核对")
 
             if matched_person:
+                # 识别错字可能使两行对应到同一人员（如 傅李育/傅李肓），按工号去重
+                key = normalize_id(person.get('employee_id')) or normalize_name(person.get('name'))
+                if key in seen:
+                    print(f"  ⚠️  {name} - 与已匹配的 {person.get('name')} 重复，已忽略")
+                    continue
+                seen.add(key)
+
                 # 更新出席状态
                 matched_person['present'] = extracted.get('present', True)
                 matched.append(matched_person)
@@ -514,35 +677,24 @@ class MeetingImageExtractor:
 
         return matched, unmatched
 
-    def generate_config(
+    def build_config(
         self,
         meeting_info: Dict,
         matched_attendees: List[Dict],
         unmatched_attendees: List[Dict],
-        modules: Optional[List[Dict]] = None,
-        output_path: Optional[str] = None
-    ) -> Path:
-        """生成会议输入配置文件
+        modules: Optional[List[Dict]] = None
+    ) -> Dict:
+        """构建会议输入配置（与YAML结构一致的字典）
 
         Args:
             meeting_info: 会议基本信息
             matched_attendees: 匹配的参会人员
             unmatched_attendees: 未匹配的参会人员
             modules: 模块进展信息
-            output_path: 输出文件路径，默认自动生成
 
         Returns:
-            Path: 生成的配置文件路径
+            dict: 会议配置数据
         """
-        print("\n📝 生成配置文件...")
-
-        # 确定输出路径
-        if output_path is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_path = self.data_dir / f"meeting-input-{timestamp}.yaml"
-        else:
-            output_path = Path(output_path)
-
         # 按角色分组参会人员
         hosts = []
         managers = []
@@ -582,15 +734,127 @@ class MeetingImageExtractor:
         if modules:
             config_data['modules'] = modules
 
-        # 写入YAML文件
+        return config_data
+
+    def write_config(self, config_data: Dict, output_path: Optional[str] = None) -> Path:
+        """将会议配置写入YAML文件
+
+        Args:
+            config_data: 会议配置数据
+            output_path: 输出文件路径，默认自动生成
+
+        Returns:
+            Path: 生成的配置文件路径
+        """
+        print("\n📝 生成配置文件...")
+
+        # 确定输出路径
+        if output_path is None:
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            output_path = self.data_dir / f"meeting-input-{timestamp}.yaml"
+        else:
+            output_path = Path(output_path)
+
         with open(output_path, 'w', encoding='utf-8') as f:
             yaml.dump(config_data, f, allow_unicode=True, sort_keys=False, default_flow_style=False)
 
         print(f"✅ 配置文件已生成: {output_path}")
         print(f"   文件大小: {output_path.stat().st_size / 1024:.1f} KB")
 
+        # 识别结果不完整时仍保存配置，便于手工修正
+        errors = meeting_errors(config_data)
+        if errors:
+            print(f"⚠️  配置有 {len(errors)} 处需要修正后才能生成会议纪要:")
+            for path, message in errors:
+                print(f"   - {path}: {message}")
+
         return output_path
 
+    def generate_config(
+        self,
+        meeting_info: Dict,
+        matched_attendees: List[Dict],
+        unmatched_attendees: List[Dict],
+        modules: Optional[List[Dict]] = None,
+        output_path: Optional[str] = None
+    ) -> Path:
+        """生成会议输入配置文件
+
+        Args:
+            meeting_info: 会议基本信息
+            matched_attendees: 匹配的参会人员
+            unmatched_attendees: 未匹配的参会人员
+            modules: 模块进展信息
+            output_path: 输出文件路径，默认自动生成
+
+        Returns:
+            Path: 生成的配置文件路径
+        """
+        config_data = self.build_config(meeting_info, matched_attendees, unmatched_attendees, modules)
+        return self.write_config(config_data, output_path)
+
+    def generate_minutes(
+        self,
+        config_data: Dict,
+        result: Dict,
+        generate_pdf: bool = False,
+        auto_open: bool = True
+    ) -> Dict:
+        """在当前进程内渲染会议纪要并（可选）转换PDF
+
+        配置字典和Markdown文本都在内存中传递，不启动子进程，
+        也不从磁盘重新读取配置或Markdown。
+
+        Args:
+            config_data: 会议配置数据
+            result: 处理结果字典，写入 markdown_path / pdf_path
+            generate_pdf: 是否自动生成PDF
+            auto_open: 是否自动打开生成的文件
+
+        Returns:
+            dict: 更新后的处理结果
+        """
+        try:
+            markdown_content = self.generator.render(config_data)
+            md_path = Path.cwd() / self.generator.default_output_path(config_data)
+            md_path.write_text(markdown_content, encoding='utf-8')
+            result['markdown_path'] = str(md_path)
+            print(f"✅ Markdown已生成: {md_path}")
+        except MeetingSchemaError as e:
+            # 错误字段已在写入配置时列出
+            result['config_errors'] = [f"{path}: {message}" for path, message in e.errors]
+            print("⚠️  配置未通过校验，跳过会议纪要生成（修正配置后可用 generate-meeting.py 重新生成）")
+            return result
+        except Exception as e:
+            print(f"⚠️  Markdown生成失败: {e}")
+            return result
+
+        if generate_pdf:
+            print("\n📄 转换为PDF...")
+
+            try:
+                # 使用内部PDF转换模块
+                if str(self.lib_dir) not in sys.path:
+                    sys.path.insert(0, str(self.lib_dir))
+                from pdf_converter import convert_markdown_content_to_pdf
+
+                pdf_path = convert_markdown_content_to_pdf(
+                    markdown_content,
+                    md_path.with_suffix('.pdf'),
+                    theme='enterprise',
+                    auto_open=auto_open
+                )
+
+                if pdf_path:
+                    result['pdf_path'] = str(pdf_path)
+
+            except Exception as e:
+                print(f"⚠️  PDF生成失败: {e}")
+                import traceback
+                traceback.print_exc()
+
+        return result
+
     def process_dual_input(
         self,
         image_path: str,
@@ -617,13 +881,9 @@ class MeetingImageExtractor:
         print("🚀 双输入模式: 图片(参会人员) + 文本(会议内容)")
         print("=" * 60)
 
-        # 1. 从图片提取参会人员
-        print("\n步骤 1/5: 从图片提取参会人员")
-        attendees = self.extract_attendees_from_image(image_path)
-
-        # 2. 从文本解析会议内容
-        print("\n步骤 2/5: 解析会议内容文本")
-        content_data = self.parse_meeting_content(content_text)
+        # 1-2. 并发执行：从图片提取参会人员 + 从文本解析会议内容
+        print("\n步骤 1-2/5: 提取参会人员并解析会议内容（并发）")
+        attendees, content_data = asyncio.run(self.extract_dual_input_async(image_path, content_text))
 
         # 3. 匹配参会人员
         print("\n步骤 3/5: 匹配参会人员数据库")
@@ -634,7 +894,7 @@ class MeetingImageExtractor:
         meeting_info = content_data.get('meeting_info', {})
         modules = content_data.get('modules', [])
 
-        config_path = self.generate_config(
+        config_data = self.build_config(
             meeting_info=meeting_info,
             matched_attendees=matched,
             unmatched_attendees=unmatched,
@@ -642,76 +902,21 @@ class MeetingImageExtractor:
         )
 
         # 将其他提取的信息也添加到配置中（如果有）
-        if 'leadership_instructions' in content_data:
-            config_path_obj = Path(config_path)
-            with open(config_path_obj, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
-            config['leadership_instructions'] = content_data['leadership_instructions']
-            if 'tasks' in content_data:
-                config['tasks'] = content_data['tasks']
-            if 'decisions' in content_data:
-                config['decisions'] = content_data['decisions']
-            if 'risks' in content_data:
-                config['risks'] = content_data['risks']
-            with open(config_path_obj, 'w', encoding='utf-8') as f:
-                yaml.dump(config, f, allow_unicode=True, sort_keys=False, default_flow_style=False)
+        for key in ('leadership_instructions', 'tasks', 'decisions', 'risks'):
+            if content_data.get(key):
+                config_data[key] = content_data[key]
 
+        config_path = self.write_config(config_data, output_path)
         result['config_path'] = str(config_path)
 
-        # 5. 生成Markdown
+        # 5. 生成Markdown（以及PDF）
         print("\n步骤 5/5: 生成会议纪要")
-        generate_script = self.scripts_dir / "generate-meeting.py"
-
-        try:
-            subprocess.run(
-                [sys.executable, str(generate_script), str(config_path)],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-
-            # 获取生成的Markdown文件路径
-            meeting_time = meeting_info.get('meeting_time', datetime.now().strftime("%Y-%m-%d"))
-            date_str = meeting_time.split()[0].replace('-', '')
-            md_filename = f"RB99125046安全运算与控制平台（VCU）项目例会会议纪要_{date_str}.md"
-            md_path = Path.cwd() / md_filename
-
-            if md_path.exists():
-                result['markdown_path'] = str(md_path)
-                print(f"✅ Markdown已生成: {md_path}")
-
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️  Markdown生成失败: {e}")
-            print(f"   错误输出: {e.stderr}")
-
-        # 6. 生成PDF（如果需要）
-        if generate_pdf and 'markdown_path' in result:
-            print("\n📄 转换为PDF...")
-
-            try:
-                # 使用内部PDF转换模块
-                sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
-                from pdf_converter import convert_markdown_to_pdf
-
-                pdf_path = convert_markdown_to_pdf(
-                    result['markdown_path'],
-                    theme='enterprise',
-                    auto_open=auto_open
-                )
-
-                if pdf_path:
-                    result['pdf_path'] = str(pdf_path)
-
-            except Exception as e:
-                print(f"⚠️  PDF生成失败: {e}")
-                import traceback
-                traceback.print_exc()
-
-        return result
+        return self.generate_minutes(config_data, result, generate_pdf, auto_open)
 
     def process_image(
         self,
         image_path: str,
+        output_path: Optional[str] = None,
         generate_pdf: bool = False,
         auto_open: bool = True
     ) -> Dict:
@@ -719,6 +924,7 @@ class MeetingImageExtractor:
 
         Args:
             image_path: 图片路径
+            output_path: 输出配置文件路径
             generate_pdf: 是否自动生成PDF
             auto_open: 是否自动打开生成的文件
 
@@ -738,65 +944,113 @@ class MeetingImageExtractor:
         meeting_info = extracted_data.get('meeting_info', {})
         modules = extracted_data.get('modules', [])
 
-        config_path = self.generate_config(
+        config_data = self.build_config(
             meeting_info=meeting_info,
             matched_attendees=matched,
             unmatched_attendees=unmatched,
             modules=modules if modules else None
         )
+        config_path = self.write_config(config_data, output_path)
         result['config_path'] = str(config_path)
 
-        # 4. 生成Markdown
+        # 4. 生成Markdown（以及PDF）
         print("\n📄 生成会议纪要Markdown...")
-        generate_script = self.scripts_dir / "generate-meeting.py"
-
-        try:
-            subprocess.run(
-                [sys.executable, str(generate_script), str(config_path)],
-                check=True,
-                capture_output=True,
-                text=True
-            )
-
-            # 获取生成的Markdown文件路径
-            meeting_time = meeting_info.get('meeting_time', datetime.now().strftime("%Y-%m-%d"))
-            date_str = meeting_time.split()[0].replace('-', '')
-            md_filename = f"RB99125046安全运算与控制平台（VCU）项目例会会议纪要_{date_str}.md"
-            md_path = Path.cwd() / md_filename
+        return self.generate_minutes(config_data, result, generate_pdf, auto_open)
 
-            if md_path.exists():
-                result['markdown_path'] = str(md_path)
-                print(f"✅ Markdown已生成: {md_path}")
-
-        except subprocess.CalledProcessError as e:
-            print(f"⚠️  Markdown生成失败: {e}")
-            print(f"   错误输出: {e.stderr}")
-
-        # 5. 生成PDF（如果需要）
-        if generate_pdf and 'markdown_path' in result:
-            print("\n📄 转换为PDF...")
+    async def process_batch_async(
+        self,
+        directory: str,
+        output_dir: Optional[str] = None,
+        concurrency: int = 4,
+        requests_per_minute: float = 30
+    ) -> Dict:
+        """批量识别目录下的会议图片，每场会议生成一个YAML配置
 
-            try:
-                # 使用内部PDF转换模块
-                sys.path.insert(0, str(Path(__file__).parent.parent / "lib"))
-                from pdf_converter import convert_markdown_to_pdf
+        内容相同的图片只识别一次；API调用经令牌桶限速；
+        进度记录在输出目录中，中断后重新运行会跳过已完成的图片。
 
-                pdf_path = convert_markdown_to_pdf(
-                    result['markdown_path'],
-                    theme='enterprise',
-                    auto_open=auto_open
-                )
+        Args:
+            directory: 图片目录（递归查找）
+            output_dir: 配置文件输出目录，默认 ``data/ocr-batch``
+            concurrency: 同时处理的图片数
+            requests_per_minute: 每分钟最多API调用次数
 
-                if pdf_path:
-                    result['pdf_path'] = str(pdf_path)
+        Returns:
+            dict: 批量处理汇总
+        """
+        output_dir = Path(output_dir) if output_dir else self.data_dir / "ocr-batch"
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        groups = find_images(directory)
+        duplicates = sum(len(paths) - 1 for paths in groups.values())
+        checkpoint = BatchCheckpoint(output_dir)
+        pending = {digest: paths for digest, paths in groups.items() if not checkpoint.is_done(digest)}
+
+        print(f"📂 找到 {len(groups)} 张不同图片（{duplicates} 张重复），"
+              f"{len(groups) - len(pending)} 张已完成，待处理 {len(pending)} 张")
+
+        self.rate_limiter = TokenBucket.per_minute(requests_per_minute, burst=concurrency)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process(digest: str, paths: List[Path]):
+            source = paths[0]
+            entry = {'source': str(source), 'duplicates': [str(path) for path in paths[1:]]}
+            async with semaphore:
+                try:
+                    extracted = await self.extract_from_image_async(str(source))
+                    matched, unmatched = self.match_attendees(extracted.get('attendees', []))
+                    modules = extracted.get('modules', [])
+                    config_data = self.build_config(
+                        meeting_info=extracted.get('meeting_info', {}),
+                        matched_attendees=matched,
+                        unmatched_attendees=unmatched,
+                        modules=modules if modules else None
+                    )
+                    config_path = self.write_config(
+                        config_data, output_dir / f"meeting-input-{source.stem}-{digest[:8]}.yaml"
+                    )
+                    entry.update(
+                        status='done',
+                        config=str(config_path),
+                        meeting_time=config_data['meeting_time'],
+                        matched=len(matched),
+                        unmatched=len(unmatched)
+                    )
+                    errors = meeting_errors(config_data)
+                    if errors:
+                        entry['config_errors'] = [f"{path}: {message}" for path, message in errors]
+                except Exception as e:
+                    print(f"❌ 处理失败: {source}: {e}")
+                    entry.update(status='failed', error=str(e))
+            checkpoint.record(digest, entry)
 
-            except Exception as e:
-                print(f"⚠️  PDF生成失败: {e}")
-                import traceback
-                traceback.print_exc()
+        try:
+            await asyncio.gather(*(process(digest, paths) for digest, paths in pending.items()))
+        finally:
+            self.rate_limiter = None
+
+        # 汇总包含之前运行已完成的图片
+        meetings = [checkpoint.entries[digest] for digest in groups if digest in checkpoint.entries]
+        summary = {
+            'directory': str(directory),
+            'generated_at': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'images': sum(len(paths) for paths in groups.values()),
+            'unique_images': len(groups),
+            'done': sum(1 for meeting in meetings if meeting.get('status') == 'done'),
+            'failed': sum(1 for meeting in meetings if meeting.get('status') == 'failed'),
+            'invalid': sum(1 for meeting in meetings if meeting.get('config_errors')),
+            'meetings': sorted(meetings, key=lambda meeting: meeting.get('meeting_time', '')),
+        }
+        summary_path = output_dir / "summary.yaml"
+        with open(summary_path, 'w', encoding='utf-8') as f:
+            yaml.dump(summary, f, allow_unicode=True, sort_keys=False, default_flow_style=False)
 
+        summary['summary_path'] = str(summary_path)
+        return summary
 
-        return result
+    def process_batch(self, directory: str, **kwargs) -> Dict:
+        """同步版本的 ``process_batch_async``"""
+        return asyncio.run(self.process_batch_async(directory, **kwargs))
 
 
 def main():
@@ -823,12 +1077,15 @@ def main():
 
   # 指定输出配置文件路径
   %(prog)s meeting-photo.png -o custom-config.yaml
+
+  # 批量模式：识别目录下全部会议图片（可中断后续跑）
+  %(prog)s archive/ --batch -o data/ocr-batch --concurrency 4 --rpm 30
 """
     )
 
     parser.add_argument(
         'image',
-        help='参会人员图片路径（双输入模式）或完整会议信息图片路径（单图片模式）'
+        help='参会人员图片路径（双输入模式）、完整会议信息图片路径（单图片模式）或图片目录（批量模式）'
     )
 
     parser.add_argument(
@@ -843,7 +1100,7 @@ def main():
 
     parser.add_argument(
         '-o', '--output',
-        help='输出配置文件路径（默认自动生成）'
+        help='输出配置文件路径（默认自动生成）；批量模式下为输出目录'
     )
 
     parser.add_argument(
@@ -858,6 +1115,70 @@ def main():
         help='不自动打开生成的文件'
     )
 
+    parser.add_argument(
+        '--timeout',
+        type=float,
+        default=120.0,
+        help='单次API调用超时秒数（默认: 120）'
+    )
+
+    parser.add_argument(
+        '--retries',
+        type=int,
+        default=2,
+        help='API调用失败后的重试次数（默认: 2）'
+    )
+
+    parser.add_argument(
+        '--base-url',
+        help='API地址（如本地桩服务），默认使用官方地址'
+    )
+
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='不使用响应缓存，强制重新调用API'
+    )
+
+    parser.add_argument(
+        '--no-preprocess',
+        action='store_true',
+        help='上传原图，不做缩放和重新压缩'
+    )
+
+    parser.add_argument(
+        '--no-crop',
+        action='store_true',
+        help='预处理时不裁剪空白边距'
+    )
+
+    parser.add_argument(
+        '--backend',
+        choices=['auto', 'remote', 'local'],
+        default='auto',
+        help='参会人员识别方式: auto 本地OCR初筛+远程补充（默认）、remote 仅远程模型、local 仅本地OCR（离线）'
+    )
+
+    parser.add_argument(
+        '--batch',
+        action='store_true',
+        help='批量模式：识别目录下的全部图片，每场会议生成一个YAML配置'
+    )
+
+    parser.add_argument(
+        '--concurrency',
+        type=int,
+        default=4,
+        help='批量模式同时处理的图片数（默认: 4）'
+    )
+
+    parser.add_argument(
+        '--rpm',
+        type=float,
+        default=30,
+        help='批量模式每分钟最多API调用次数（默认: 30）'
+    )
+
     args = parser.parse_args()
 
     try:
@@ -867,9 +1188,40 @@ def main():
             sys.exit(1)
 
         # 创建提取器
-        extractor = MeetingImageExtractor()
+        extractor = MeetingImageExtractor(
+            base_url=args.base_url,
+            timeout=args.timeout,
+            max_retries=args.retries,
+            use_cache=not args.no_cache,
+            preprocess=not args.no_preprocess,
+            crop_image=not args.no_crop,
+            backend=args.backend
+        )
 
         # 判断处理模式
+        if args.batch:
+            if not Path(args.image).is_dir():
+                print(f"❌ 错误: 批量模式需要图片目录: {args.image}", file=sys.stderr)
+                sys.exit(1)
+
+            print("\n🗂️  批量模式: 识别目录下全部会议图片")
+            summary = extractor.process_batch(
+                args.image,
+                output_dir=args.output,
+                concurrency=args.concurrency,
+                requests_per_minute=args.rpm
+            )
+
+            print("\n" + "=" * 60)
+            print(f"✅ 批量处理完成: {summary['done']} 成功，{summary['failed']} 失败")
+            print("=" * 60)
+            print(f"📋 汇总: {summary['summary_path']}")
+            if summary['failed']:
+                print("💡 重新运行相同命令将只重试失败的图片")
+            if summary['invalid']:
+                print(f"⚠️  {summary['invalid']} 份配置需要手工修正（见汇总中的 config_errors）")
+            return
+
         if args.content or args.text:
             # 双输入模式
             if args.content:
@@ -902,6 +1254,7 @@ def main():
             print("\n📸 单图片模式: 从图片提取完整会议信息")
             result = extractor.process_image(
                 image_path=args.image,
+                output_path=args.output,
                 generate_pdf=args.generate_pdf,
                 auto_open=not args.no_open
             )
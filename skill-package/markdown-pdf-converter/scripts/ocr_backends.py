@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+参会人员本地识别后端
+离线或作为快速初筛使用：Tesseract识别表格图片并逐行解析出与远程模型相同结构的参会人员数据，
+本地无法与参会人员索引对应的行再交给远程模型识别
+"""
+
+import asyncio
+import io
+import re
+import shutil
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence, Tuple
+
+# Tesseract 与 Pillow 均为可选依赖
+try:
+    import pytesseract
+except ImportError:
+    pytesseract = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+BBox = Tuple[int, int, int, int]
+
+_CJK = r'\u4e00-\u9fff'
+_CJK_SPACES = re.compile(rf'(?<=[{_CJK}]) +(?=[{_CJK}])')
+_CJK_TOKEN = re.compile(rf'[{_CJK}]+')
+_EMPLOYEE_ID = re.compile(r'(?<!\d)\d{5,6}(?!\d)')
+
+# 表头行关键字（同一行出现两个以上视为表头）
+HEADER_WORDS = ('姓名', '工号', '职责', '出席', '模块')
+ABSENT_MARKS = ('缺席', '未出席', '未参会', '❌')
+
+
+@dataclass
+class AttendeeRow:
+    """本地识别出的一行"""
+    text: str
+    bbox: BBox
+    attendee: Optional[Dict] = field(default=None)
+
+
+def parse_attendee_row(text: str) -> Optional[Dict]:
+    """将一行识别文本解析为参会人员信息（与远程模型返回的结构一致）
+
+    ``group_rows`` 输出的列之间以制表符分隔。姓名与职责都可能是2~4个汉字，
+    按与工号的相对位置选择姓名：同列或相邻列优先，距离相同时取工号前面的一列；
+    没有工号时取第一个。
+
+    Returns:
+        dict: name/employee_id/role/module/present，表头或无法识别时返回None
+    """
+    text = _CJK_SPACES.sub('', text.strip())
+    if not text or sum(word in text for word in HEADER_WORDS) >= 2:
+        return None
+
+    match = _EMPLOYEE_ID.search(text)
+    employee_id = match.group(0) if match else ''
+
+    tokens = [
+        token for token in _CJK_TOKEN.finditer(text)
+        if token.group(0) not in ABSENT_MARKS and token.group(0) != '出席'
+    ]
+    names = [token for token in tokens if 2 <= len(token.group(0)) <= 4]
+    if not names and not employee_id:
+        return None
+
+    if names and match:
+        id_column = text.count('\t', 0, match.start())
+
+        def distance(token):
+            after = token.start() > match.start()
+            gap = token.start() - match.end() if after else match.start() - token.end()
+            return abs(text.count('\t', 0, token.start()) - id_column), after, gap
+
+        name = min(names, key=distance)
+    else:
+        name = names[0] if names else None
+    rest = [token.group(0) for token in tokens if token is not name]
+
+    attendee = {
+        'name': name.group(0) if name else '',
+        'employee_id': employee_id,
+        'present': not any(mark in text for mark in ABSENT_MARKS),
+    }
+    if rest:
+        attendee['role'] = rest[0]
+    if len(rest) > 1:
+        attendee['module'] = ' '.join(rest[1:])
+    return attendee
+
+
+def group_rows(words: Sequence[Tuple[str, BBox]]) -> List[Tuple[str, BBox]]:
+    """按垂直位置把单词归并为表格行
+
+    Tesseract常把表格的各列识别成不同文本块，按行号分组会把同一行拆开，
+    这里按单词中线是否落在当前行的上下边界内归并。
+    """
+    rows: List[Tuple[List[Tuple[str, BBox]], List[int]]] = []
+    for text, bbox in sorted(words, key=lambda word: word[1][1]):
+        left, top, right, bottom = bbox
+        center = (top + bottom) / 2
+        if rows and rows[-1][1][1] <= center <= rows[-1][1][3]:
+            row_words, row_box = rows[-1]
+            row_words.append((text, bbox))
+            row_box[:] = [min(row_box[0], left), min(row_box[1], top),
+                          max(row_box[2], right), max(row_box[3], bottom)]
+        else:
+            rows.append(([(text, bbox)], [left, top, right, bottom]))
+
+    return [(_join_row(row_words), tuple(row_box)) for row_words, row_box in rows]
+
+
+def _join_row(row_words: List[Tuple[str, BBox]]) -> str:
+    """拼接一行中的单词，间距超过一个字宽的视为列分隔（制表符）
+
+    Tesseract会把中文姓名拆成逐字的单词，字间空格在解析时去掉，列之间保留制表符
+    """
+    parts = []
+    previous_right = None
+    for text, (left, top, right, bottom) in sorted(row_words, key=lambda word: word[1][0]):
+        if previous_right is not None:
+            parts.append('\t' if left - previous_right > bottom - top else ' ')
+        parts.append(text)
+        previous_right = right
+    return ''.join(parts)
+
+
+class AttendeeBackend:
+    """参会人员识别后端接口
+
+    实现 ``available`` 和 ``extract_rows`` 即可替换本地识别引擎。
+    """
+
+    name = 'backend'
+
+    def available(self) -> bool:
+        """依赖是否齐全"""
+        raise NotImplementedError
+
+    def extract_rows(self, image_path) -> List[AttendeeRow]:
+        """识别图片中的表格行"""
+        raise NotImplementedError
+
+    async def extract_rows_async(self, image_path) -> List[AttendeeRow]:
+        """在线程中执行识别，不阻塞事件循环"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.extract_rows, image_path)
+
+    async def extract_attendees(self, image_path) -> List[Dict]:
+        """识别参会人员列表"""
+        rows = await self.extract_rows_async(image_path)
+        return [row.attendee for row in rows if row.attendee]
+
+
+class TesseractBackend(AttendeeBackend):
+    """基于Tesseract的本地识别后端（需要 tesseract 程序和中文语言包）"""
+
+    name = 'tesseract'
+
+    def __init__(self, lang: str = 'chi_sim+eng'):
+        self.lang = lang
+
+    def available(self) -> bool:
+        return pytesseract is not None and Image is not None and shutil.which('tesseract') is not None
+
+    def extract_rows(self, image_path) -> List[AttendeeRow]:
+        with Image.open(image_path) as image:
+            data = pytesseract.image_to_data(
+                image.convert('RGB'), lang=self.lang, output_type=pytesseract.Output.DICT
+            )
+
+        words = [
+            (text.strip(), (left, top, left + width, top + height))
+            for text, left, top, width, height in zip(
+                data['text'], data['left'], data['top'], data['width'], data['height']
+            )
+            if text.strip()
+        ]
+        return [AttendeeRow(text, bbox, parse_attendee_row(text)) for text, bbox in group_rows(words)]
+
+
+def crop_rows(image_path, boxes: Sequence[BBox], padding: int = 8) -> bytes:
+    """截取指定行（整行宽度）并纵向拼接为一张PNG，用于把未识别的行交给远程模型"""
+    with Image.open(image_path) as image:
+        image = image.convert('RGB')
+        width, height = image.size
+        strips = [
+            image.crop((0, max(0, top - padding), width, min(height, bottom + padding)))
+            for _, top, _, bottom in boxes
+        ]
+
+    canvas = Image.new('RGB', (width, sum(strip.height for strip in strips)), 'white')
+    offset = 0
+    for strip in strips:
+        canvas.paste(strip, (0, offset))
+        offset += strip.height
+
+    buffer = io.BytesIO()
+    canvas.save(buffer, format='PNG', optimize=True)
+    return buffer.getvalue()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+模型响应磁盘缓存
+缓存OCR和文本解析调用解析后的JSON，相同图片/文本重复运行时不再请求API
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "vcu-meeting-ocr"
+
+
+class ResponseCache:
+    """按内容哈希、提示词版本和模型名缓存模型响应
+
+    每条缓存是一个JSON文件，命中时刷新修改时间，
+    超过总大小上限时按最近使用时间淘汰最旧的条目。
+    """
+
+    def __init__(
+        self,
+        cache_dir=None,
+        ttl_seconds: float = 30 * 24 * 3600,
+        max_bytes: int = 50 * 1024 * 1024
+    ):
+        """初始化缓存
+
+        Args:
+            cache_dir: 缓存目录，默认 ``~/.cache/vcu-meeting-ocr``
+            ttl_seconds: 条目有效期（秒）
+            max_bytes: 缓存目录总大小上限（字节）
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(payload: str, prompt: str, prompt_version: str, model: str) -> str:
+        """计算缓存键
+
+        Args:
+            payload: 图片base64数据或会议文本
+            prompt: 提示词全文（提示词改动后缓存自动失效）
+            prompt_version: 提示词版本号
+            model: 模型名称
+        """
+        digest = hashlib.sha256()
+        for part in (model, prompt_version, prompt, payload):
+            digest.update(part.encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[Dict]:
+        """读取缓存，未命中或已过期时返回None"""
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if time.time() - entry.get('created', 0) > self.ttl_seconds:
+            path.unlink(missing_ok=True)
+            return None
+
+        path.touch()  # 记录最近使用时间，供淘汰使用
+        return entry.get('data')
+
+    def put(self, key: str, data: Dict):
+        """写入缓存并按大小上限淘汰旧条目"""
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        path = self._entry_path(key)
+        tmp_path = path.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'created': time.time(), 'data': data}, f, ensure_ascii=False)
+        tmp_path.replace(path)
+        self.evict()
+
+    def evict(self):
+        """超出大小上限时按最近使用时间淘汰（过期条目在读取时删除）"""
+        entries = []
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        """清空缓存"""
+        for path in self.cache_dir.glob('*.json'):
+            path.unlink(missing_ok=True)
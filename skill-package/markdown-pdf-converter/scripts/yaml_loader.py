@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+YAML数据加载
+优先使用libyaml C解析器；解析结果在进程内按路径和修改时间缓存，
+可选持久化为JSON快照，新进程读取快照即可跳过YAML解析
+"""
+
+import datetime
+import hashlib
+import json
+import threading
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import yaml
+
+# libyaml 为可选依赖（PyYAML 编译时未带 libyaml 则使用纯Python解析器）
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+
+# 快照格式调整时递增，使旧快照失效
+SNAPSHOT_VERSION = 2
+
+# 进程内缓存: 绝对路径 -> (文件签名, 解析结果)
+_MEMO: Dict[str, Tuple[tuple, Any]] = {}
+_LOCK = threading.Lock()
+
+
+def parse_yaml(stream) -> Any:
+    """解析YAML文本或文件对象（safe_load语义）"""
+    return yaml.load(stream, Loader=SafeLoader)
+
+
+def _snapshot_path(snapshot_dir: Path, path: str) -> Path:
+    return snapshot_dir / f"{hashlib.sha256(path.encode('utf-8')).hexdigest()[:16]}.json"
+
+
+# 快照中日期/时间的标记（YAML中未加引号的日期解析为 date/datetime）
+_DATE_TAGS = {'$date': datetime.date, '$datetime': datetime.datetime}
+
+
+def _encode(value):
+    """转换为可JSON序列化的结构，无法无损表示的值（非字符串键、集合、二进制等）抛出TypeError"""
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    if isinstance(value, datetime.datetime):
+        return {'$datetime': value.isoformat()}
+    if isinstance(value, datetime.date):
+        return {'$date': value.isoformat()}
+    if isinstance(value, list):
+        return [_encode(item) for item in value]
+    if isinstance(value, dict):
+        if not all(isinstance(key, str) for key in value):
+            raise TypeError("映射的键必须为字符串")
+        if len(value) == 1 and next(iter(value)) in _DATE_TAGS:
+            raise TypeError("映射与日期标记冲突")
+        return {key: _encode(item) for key, item in value.items()}
+    raise TypeError(f"无法写入快照: {type(value).__name__}")
+
+
+def _decode(obj: Dict) -> Any:
+    if len(obj) == 1:
+        tag, text = next(iter(obj.items()))
+        if tag in _DATE_TAGS:
+            return _DATE_TAGS[tag].fromisoformat(text)
+    return obj
+
+
+def _read_snapshot(snapshot_file: Path, signature: tuple) -> Tuple[bool, Any]:
+    try:
+        with open(snapshot_file, 'r', encoding='utf-8') as f:
+            snapshot = json.load(f, object_hook=_decode)
+        if snapshot['signature'] == list(signature):
+            return True, snapshot['data']
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # 快照不存在或已损坏，重新解析
+    return False, None
+
+
+def _write_snapshot(snapshot_file: Path, signature: tuple, data: Any):
+    try:
+        snapshot = json.dumps({'signature': list(signature), 'data': _encode(data)}, ensure_ascii=False)
+    except (TypeError, ValueError):
+        return  # 含JSON无法无损表示的值，仅使用进程内缓存
+    try:
+        snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = snapshot_file.with_suffix('.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(snapshot)
+        tmp_path.replace(snapshot_file)
+    except OSError:
+        pass  # 快照目录不可写时仅使用进程内缓存
+
+
+def load_yaml(yaml_file, snapshot_dir: Optional[Path] = None) -> Any:
+    """加载YAML文件
+
+    文件未修改（修改时间和大小不变）时直接返回缓存的解析结果。
+    返回值在调用方之间共享，应视为只读：需要修改时由调用方自行复制。
+
+    快照只包含JSON数据，读取时不会执行任何代码；快照目录可被他人写入时，
+    其内容等同于YAML文件本身，可以伪造配置数据。
+
+    Args:
+        yaml_file: YAML文件路径
+        snapshot_dir: JSON快照目录，为None时不持久化
+
+    Returns:
+        解析结果（空文件为None）
+    """
+    path = Path(yaml_file).resolve()
+    stat = path.stat()
+    key = str(path)
+    signature = (SNAPSHOT_VERSION, key, stat.st_mtime_ns, stat.st_size)
+
+    with _LOCK:
+        cached = _MEMO.get(key)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+
+    found, data = False, None
+    snapshot_file = _snapshot_path(Path(snapshot_dir), key) if snapshot_dir else None
+    if snapshot_file is not None:
+        found, data = _read_snapshot(snapshot_file, signature)
+
+    if not found:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = parse_yaml(f)
+        if snapshot_file is not None:
+            _write_snapshot(snapshot_file, signature, data)
+
+    with _LOCK:
+        _MEMO[key] = (signature, data)
+    return data
+
+
+def clear_cache():
+    """清空进程内缓存（快照文件保留）"""
+    with _LOCK:
+        _MEMO.clear()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+测试公共夹具
+============
+
+scripts/ 加入导入路径，提供带连字符文件名的提取器脚本和隔离的Skill目录
+"""
+
+import importlib.util
+import shutil
+import pytest
+from pathlib import Path
+import sys
+
+SKILL_DIR = Path(__file__).parent.parent
+SCRIPTS_DIR = SKILL_DIR / "scripts"
+
+# 添加scripts到路径
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+
+@pytest.fixture(autouse=True)
+def isolated_home(tmp_path, monkeypatch):
+    """用户目录指向临时目录，~/.cache 下的缓存不影响真实环境"""
+    home = tmp_path / "home"
+    home.mkdir()
+    monkeypatch.setenv("HOME", str(home))
+
+    # 缓存目录在模块导入时确定，需要单独替换
+    cache_dir = home / ".cache" / "vcu-meeting-ocr"
+    for module, path in (
+        ("attendee_index", cache_dir),
+        ("response_cache", cache_dir),
+        ("image_preprocess", cache_dir / "images"),
+    ):
+        monkeypatch.setattr(importlib.import_module(module), "DEFAULT_CACHE_DIR", path)
+    return home
+
+
+@pytest.fixture(scope="session")
+def ocr_module():
+    """加载 scripts/ocr-meeting-extractor.py"""
+    spec = importlib.util.spec_from_file_location(
+        "ocr_meeting_extractor", SCRIPTS_DIR / "ocr-meeting-extractor.py"
+    )
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def skill_dir(tmp_path):
+    """只含模板和参会人员数据库的Skill目录副本"""
+    skill = tmp_path / "skill"
+    shutil.copytree(SKILL_DIR / "templates", skill / "templates")
+    (skill / "data").mkdir()
+    shutil.copy(SKILL_DIR / "data" / "attendees.yaml", skill / "data" / "attendees.yaml")
+    return skill
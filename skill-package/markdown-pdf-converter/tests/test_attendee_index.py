@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+参会人员索引测试
+================
+
+测试精确/模糊/歧义查找、索引缓存失效，以及匹配结果去重
+"""
+
+import json
+import os
+import pytest
+
+import attendee_index
+from attendee_index import AttendeeIndex
+
+
+ROSTER = """\
+hosts:
+  - name: "傅李育"
+    employee_id: "61349"
+managers:
+  - name: "周庭梁"
+    employee_id: "60136"
+engineers:
+  - name: "欧阳明华"
+    employee_id: "70001"
+  - name: "欧阳明辉"
+    employee_id: "70002"
+  - name: "李四"
+    employee_id: "70003"
+"""
+
+
+@pytest.fixture
+def roster(tmp_path):
+    path = tmp_path / "attendees.yaml"
+    path.write_text(ROSTER, encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def index(roster, tmp_path):
+    return AttendeeIndex.load(roster, cache_dir=tmp_path / "cache")
+
+
+class TestLookup:
+    """人员查找测试类"""
+
+    def test_exact(self, index):
+        """测试工号优先、姓名精确匹配（忽略空格和工号中的非数字字符）"""
+        assert index.lookup("张三", "No.61349") == (index.by_id["61349"], 'id')
+        assert index.lookup("周 庭梁")[0]['employee_id'] == "60136"
+        assert index.lookup("周庭梁")[1] == 'name'
+
+    def test_fuzzy(self, index):
+        """测试三个字以上的姓名容忍一个错字"""
+        person, how = index.lookup("傅李肓")
+        assert (person['name'], how) == ("傅李育", 'fuzzy')
+
+    def test_ambiguous(self, index):
+        """测试最近的候选人不唯一时不做模糊匹配"""
+        # 与 欧阳明华、欧阳明辉 的编辑距离都是1
+        assert index.lookup("欧阳明X") == (None, '')
+        # 两个字的姓名不做模糊匹配
+        assert index.lookup("李梅") == (None, '')
+
+
+class TestIndexCache:
+    """索引缓存测试类"""
+
+    def test_cached_as_json_per_roster(self, roster, tmp_path):
+        """测试每个名册一个JSON缓存文件，从缓存恢复的索引可用"""
+        cache_dir = tmp_path / "cache"
+        AttendeeIndex.load(roster, cache_dir=cache_dir)
+        other = tmp_path / "other" / "attendees.yaml"
+        other.parent.mkdir()
+        other.write_text(ROSTER, encoding='utf-8')
+        AttendeeIndex.load(other, cache_dir=cache_dir)
+
+        cache_files = sorted(cache_dir.glob("attendee-index-*.json"))
+        assert len(cache_files) == 2
+        assert "61349" in json.loads(cache_files[0].read_text(encoding='utf-8'))['by_id']
+
+    def test_cache_hit(self, roster, tmp_path, monkeypatch):
+        """测试名册未修改时不重新读取YAML，BK树照常支持模糊匹配"""
+        AttendeeIndex.load(roster, cache_dir=tmp_path / "cache")
+
+        def fail_load(path):
+            raise AssertionError("命中缓存时不应读取名册")
+
+        monkeypatch.setattr(attendee_index, "load_yaml", fail_load)
+        index = AttendeeIndex.load(roster, cache_dir=tmp_path / "cache")
+        assert index.lookup("傅李肓")[1] == 'fuzzy'
+
+    def test_mtime_invalidation(self, roster, tmp_path):
+        """测试名册修改后重建索引"""
+        AttendeeIndex.load(roster, cache_dir=tmp_path / "cache")
+
+        roster.write_text(ROSTER.replace("周庭梁", "周廷梁"), encoding='utf-8')
+        stat = roster.stat()
+        os.utime(roster, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        index = AttendeeIndex.load(roster, cache_dir=tmp_path / "cache")
+        assert index.lookup("周廷梁")[1] == 'name'
+        assert index.lookup("周庭梁")[1] == 'fuzzy'
+
+    def test_corrupt_cache(self, roster, tmp_path):
+        """测试缓存损坏时重新构建"""
+        cache_dir = tmp_path / "cache"
+        AttendeeIndex.load(roster, cache_dir=cache_dir)
+        for path in cache_dir.glob("*.json"):
+            path.write_text("[1, 2", encoding='utf-8')
+
+        assert AttendeeIndex.load(roster, cache_dir=cache_dir).lookup("李四")[1] == 'name'
+
+
+class TestMatchAttendees:
+    """参会人员匹配测试类"""
+
+    def test_dedupe_by_employee_id(self, ocr_module, skill_dir):
+        """测试识别错字使两行对应同一人员时只保留第一行"""
+        extractor = ocr_module.MeetingImageExtractor(skill_dir, client=object(), backend='remote')
+        matched, unmatched = extractor.match_attendees([
+            {'name': "傅李 育", 'present': True},
+            {'name': "傅李肓", 'present': False},
+            {'name': "新同事", 'employee_id': "99999"},
+        ])
+
+        assert [person['name'] for person in matched] == ["傅李育"]
+        assert matched[0]['present'] is True
+        assert unmatched == [{'name': "新同事", 'employee_id': "99999"}]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
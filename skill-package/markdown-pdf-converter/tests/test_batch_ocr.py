@@ -0,0 +1,127 @@
+#!/usr/bin/env python3
+"""
+批量识别测试
+============
+
+测试图片按内容去重、断点续跑和令牌桶限速
+"""
+
+import asyncio
+import time
+import pytest
+from pathlib import Path
+
+from batch_ocr import CHECKPOINT_FILE, BatchCheckpoint, TokenBucket, find_images
+
+
+def write_images(directory):
+    """两张内容相同的图片、一张不同的图片和一个非图片文件"""
+    (directory / "sub").mkdir(parents=True)
+    (directory / "a.png").write_bytes(b"image-1")
+    (directory / "sub" / "a-copy.JPG").write_bytes(b"image-1")
+    (directory / "b.jpeg").write_bytes(b"image-2")
+    (directory / "notes.txt").write_bytes(b"image-1")
+    return directory
+
+
+class TestFindImages:
+    """图片查找测试类"""
+
+    def test_dedupe_by_content(self, tmp_path):
+        """测试内容相同的图片归为一组，非图片文件被忽略"""
+        groups = find_images(write_images(tmp_path / "images"))
+
+        assert sorted(sorted(path.name for path in paths) for paths in groups.values()) == [
+            ["a-copy.JPG", "a.png"], ["b.jpeg"]
+        ]
+        # 组内第一个为处理对象，按路径排序
+        first = [paths[0].name for paths in groups.values()]
+        assert sorted(first) == ["a.png", "b.jpeg"]
+
+
+class TestBatchCheckpoint:
+    """断点记录测试类"""
+
+    def test_persisted(self, tmp_path):
+        """测试记录立即写盘，重新加载后保留完成状态"""
+        checkpoint = BatchCheckpoint(tmp_path / "out")
+        checkpoint.record("d1", {'status': 'done'})
+        checkpoint.record("d2", {'status': 'failed', 'error': "超时"})
+
+        reloaded = BatchCheckpoint(tmp_path / "out")
+        assert reloaded.is_done("d1")
+        assert not reloaded.is_done("d2")
+        assert not reloaded.is_done("d3")
+        assert [path.name for path in (tmp_path / "out").iterdir()] == [CHECKPOINT_FILE]
+
+
+class TestProcessBatch:
+    """批量识别断点续跑测试类"""
+
+    @pytest.fixture
+    def extractor(self, ocr_module, skill_dir):
+        extractor = ocr_module.MeetingImageExtractor(
+            skill_dir, client=object(), backend='remote', use_cache=False
+        )
+        extractor.calls = []
+        extractor.failing = {"b.jpeg"}
+
+        async def extract_from_image_async(image_path):
+            name = Path(image_path).name
+            extractor.calls.append(name)
+            if name in extractor.failing:
+                raise RuntimeError("识别失败")
+            return {'meeting_info': {'meeting_time': "2025-11-15 14:00-16:00"}, 'attendees': []}
+
+        extractor.extract_from_image_async = extract_from_image_async
+        return extractor
+
+    def test_resume_skips_done_and_retries_failed(self, extractor, tmp_path):
+        """测试重复图片只识别一次，重新运行跳过已完成的图片并重试失败的图片"""
+        images = write_images(tmp_path / "images")
+        output_dir = tmp_path / "out"
+
+        summary = extractor.process_batch(str(images), output_dir=str(output_dir), requests_per_minute=6000)
+        assert sorted(extractor.calls) == ["a.png", "b.jpeg"]
+        assert (summary['images'], summary['unique_images']) == (3, 2)
+        assert (summary['done'], summary['failed']) == (1, 1)
+
+        extractor.calls.clear()
+        extractor.failing.clear()
+        summary = extractor.process_batch(str(images), output_dir=str(output_dir), requests_per_minute=6000)
+
+        assert extractor.calls == ["b.jpeg"]
+        assert (summary['done'], summary['failed']) == (2, 0)
+        assert len(list(output_dir.glob("meeting-input-*.yaml"))) == 2
+        assert (output_dir / "summary.yaml").exists()
+
+
+class TestTokenBucket:
+    """令牌桶限速测试类"""
+
+    @pytest.mark.asyncio
+    async def test_paces_calls(self):
+        """测试令牌用完后按补充速度放行"""
+        bucket = TokenBucket(rate=20, capacity=1)
+
+        start = time.perf_counter()
+        for _ in range(5):
+            await bucket.acquire()
+        elapsed = time.perf_counter() - start
+
+        # 第一个令牌立即可用，其余4个每0.05秒补充一个
+        assert 0.18 <= elapsed < 0.5
+
+    @pytest.mark.asyncio
+    async def test_burst(self):
+        """测试积累的令牌允许突发调用"""
+        bucket = TokenBucket.per_minute(60, burst=3)
+        assert bucket.rate == 1
+
+        start = time.perf_counter()
+        await asyncio.gather(*(bucket.acquire() for _ in range(3)))
+        assert time.perf_counter() - start < 0.1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
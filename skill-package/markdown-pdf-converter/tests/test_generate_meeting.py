@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+会议纪要生成器测试
+==================
+
+测试共享Jinja2环境与字节码缓存、渲染失败时的输出清理，以及批量生成
+"""
+
+import pytest
+import yaml
+
+import generate_meeting
+from generate_meeting import MeetingMinutesGenerator, get_jinja_env
+
+
+CONFIG = {
+    'meeting_time': "2025-11-15 14:00-16:00",
+    'meeting_host': "傅李育",
+    'modules': [{'section': "3.1", 'name': "VCU-S软件", 'progress': ["完成接口联调"]}],
+}
+
+
+def write_config(path, **overrides):
+    path.write_text(yaml.safe_dump({**CONFIG, **overrides}, allow_unicode=True), encoding='utf-8')
+    return path
+
+
+class TestJinjaEnvironment:
+    """共享Jinja2环境测试类"""
+
+    def test_shared_per_skill_dir(self, skill_dir, tmp_path):
+        """测试同一Skill目录的生成器共用一个环境，已编译的模板只编译一次"""
+        first = MeetingMinutesGenerator(skill_dir)
+        second = MeetingMinutesGenerator(skill_dir / "templates" / "..")
+
+        assert first.jinja_env is second.jinja_env is get_jinja_env(skill_dir)
+        assert first.get_template("vcu-meeting-template.j2") is second.get_template("vcu-meeting-template.j2")
+
+    def test_bytecode_reused_by_new_environment(self, skill_dir, monkeypatch):
+        """测试新进程（新环境）直接加载字节码，模板修改后重新编译"""
+        MeetingMinutesGenerator(skill_dir).render(dict(CONFIG))
+        assert list((skill_dir / ".cache" / "jinja2").iterdir())
+        assert (skill_dir / ".cache" / ".gitignore").read_text(encoding='utf-8') == "*\n"
+
+        # 模拟新进程：清空进程内的环境缓存
+        monkeypatch.setattr(generate_meeting, "_ENVIRONMENTS", {})
+        env = get_jinja_env(skill_dir)
+
+        def fail_compile(*args, **kwargs):
+            raise AssertionError("应直接加载字节码")
+
+        monkeypatch.setattr(env, "compile", fail_compile)
+        assert "VCU-S软件" in MeetingMinutesGenerator(skill_dir).render(dict(CONFIG))
+
+        template = skill_dir / "templates" / "vcu-meeting-template.j2"
+        template.write_text(template.read_text(encoding='utf-8') + "\n<!-- 修改 -->\n", encoding='utf-8')
+        monkeypatch.setattr(generate_meeting, "_ENVIRONMENTS", {})
+        monkeypatch.setattr(get_jinja_env(skill_dir), "compile", fail_compile)
+        with pytest.raises(AssertionError, match="字节码"):
+            MeetingMinutesGenerator(skill_dir).render(dict(CONFIG))
+
+
+class TestGenerate:
+    """单个会议纪要生成测试类"""
+
+    def test_generate(self, skill_dir, tmp_path):
+        """测试生成Markdown文件"""
+        output = MeetingMinutesGenerator(skill_dir).generate(
+            write_config(tmp_path / "meeting.yaml"), tmp_path / "minutes.md"
+        )
+        assert "VCU-S软件" in output.read_text(encoding='utf-8')
+
+    def test_failed_render_leaves_no_output(self, skill_dir, tmp_path):
+        """测试流式渲染中途出错时删除已写出的部分内容"""
+        (skill_dir / "templates" / "broken.j2").write_text(
+            "{{ meeting_host }}\n" + "正文\n" * 10000 + "{{ meeting_host.missing() }}\n", encoding='utf-8'
+        )
+        output = tmp_path / "minutes.md"
+
+        with pytest.raises(Exception):
+            MeetingMinutesGenerator(skill_dir).generate(
+                write_config(tmp_path / "meeting.yaml"), output, template="broken.j2"
+            )
+        assert not output.exists()
+
+
+class TestGenerateBatch:
+    """批量生成测试类"""
+
+    @pytest.fixture
+    def inputs(self, tmp_path):
+        inputs = tmp_path / "inputs"
+        inputs.mkdir()
+        write_config(inputs / "a-weekly.yaml")
+        # 与 a-weekly 同一天的会议
+        write_config(inputs / "b-review.yaml", meeting_host="周庭梁")
+        write_config(inputs / "c-other-day.yaml", meeting_time="2025-11-22 14:00-16:00")
+        # 结构不合规：布尔值主持人，缺少会议时间
+        (inputs / "d-invalid.yaml").write_text("meeting_host: true\n", encoding='utf-8')
+        (inputs / "attendees.yaml").write_text("hosts: []\n", encoding='utf-8')
+        return inputs
+
+    def test_dedupes_output_names(self, skill_dir, inputs, tmp_path):
+        """测试同一天的会议以输入文件名区分，不互相覆盖"""
+        results = MeetingMinutesGenerator(skill_dir).generate_batch(inputs, tmp_path / "out", workers=2)
+
+        names = [path.name if path else None for path in results]
+        assert names[0].endswith("_20251115.md")
+        assert names[1] == names[0].replace(".md", "_b-review.md")
+        assert names[2].endswith("_20251122.md")
+        assert "周庭梁" in results[1].read_text(encoding='utf-8')
+        assert len(list((tmp_path / "out").iterdir())) == 3
+
+    def test_reports_failures(self, skill_dir, inputs, tmp_path, capsys):
+        """测试不合规的输入报告错误字段并返回None，其余输入照常生成"""
+        results = MeetingMinutesGenerator(skill_dir).generate_batch(inputs, tmp_path / "out")
+
+        assert len(results) == 4  # attendees.yaml 不作为输入
+        assert results[3] is None
+        assert all(results[:3])
+
+        captured = capsys.readouterr()
+        assert "d-invalid.yaml" in captured.err
+        assert "meeting_time: 缺少必填字段" in captured.err
+        assert "meeting_host: 应为" in captured.err
+        assert "1 个配置未通过加载/校验" in captured.err
+        assert "3/4 生成完成" in captured.out
+
+    def test_render_failure_reported(self, skill_dir, tmp_path, capsys):
+        """测试渲染失败的输入返回None"""
+        (skill_dir / "templates" / "broken.j2").write_text(
+            "{% if meeting_host == '周庭梁' %}{{ meeting_host.missing() }}{% endif %}{{ meeting_host }}\n",
+            encoding='utf-8'
+        )
+        inputs = [write_config(tmp_path / "a.yaml"), write_config(tmp_path / "b.yaml", meeting_host="周庭梁")]
+
+        results = MeetingMinutesGenerator(skill_dir).generate_batch(inputs, tmp_path / "out", template="broken.j2")
+
+        assert results[0] is not None and results[1] is None
+        assert "b.yaml" in capsys.readouterr().err
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+HTML会议模板测试
+================
+
+同一份会议YAML分别经 Markdown 模板 + Markdown 转换和 HTML 模板生成，
+比较标题的id、class与headerlink
+"""
+
+import re
+import pytest
+from pathlib import Path
+import sys
+
+# 添加scripts和lib到路径
+SKILL_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+sys.path.insert(0, str(SKILL_DIR / "lib"))
+
+pytest.importorskip("markdown")
+
+from generate_meeting import HeadingIds, MeetingMinutesGenerator
+from pdf_converter.converter import _convert_markdown_to_html
+
+
+MEETING_INPUTS = sorted((SKILL_DIR / "data").glob("meeting-input-*.yaml"))
+
+HEADING = re.compile(r'<h([1-6])([^>]*)>(.*?)</h\1>', re.DOTALL)
+
+
+def headings(html):
+    """提取 (级别, 属性, 内容) 列表"""
+    return HEADING.findall(html)
+
+
+@pytest.fixture
+def generator():
+    return MeetingMinutesGenerator(yaml_snapshots=False)
+
+
+class TestHeadingIds:
+    """标题id生成测试类"""
+
+    def test_same_slug_as_toc(self):
+        """测试与toc扩展相同的slug与去重"""
+        heading_id = HeadingIds()
+        assert heading_id("3.2 VCU-S硬件测试") == "32-vcu-s"
+        assert heading_id("1. 会议基本信息") == "1"
+        assert heading_id("✅ 已完成工作") == "_1"
+        assert heading_id("🎯 下周计划") == "_2"
+        assert heading_id("3.2 VCU-S硬件测试") == "32-vcu-s_1"
+
+    def test_instances_independent(self):
+        """测试每次渲染的id互不影响"""
+        assert HeadingIds()("1. 会议基本信息") == HeadingIds()("1. 会议基本信息") == "1"
+
+
+class TestHTMLTemplateParity:
+    """HTML模板与Markdown转换结果一致性测试类"""
+
+    @pytest.mark.parametrize("input_file", MEETING_INPUTS, ids=lambda path: path.name)
+    def test_headings_match_markdown_pipeline(self, generator, input_file):
+        """测试标题id、class、headerlink与Markdown转换结果完全一致"""
+        data = generator.load_yaml(input_file)
+        markdown_html = _convert_markdown_to_html(generator.render(dict(data)))
+        template_html = generator.render(dict(data), "vcu-meeting-template.html.j2")
+
+        expected = headings(markdown_html)
+        assert len(expected) > 10
+        assert headings(template_html) == expected
+
+    def test_page_classes_and_links(self, generator):
+        """测试分页类与锚点链接"""
+        data = generator.load_yaml(SKILL_DIR / "data" / "meeting-input-20251115.yaml")
+        html = generator.render(dict(data), "vcu-meeting-template.html.j2")
+
+        assert '<h2 id="1" class="first-page-section">' in html
+        assert '<h2 id="2" class="second-page-section">' in html
+        assert '<h2 id="3" class="module-reports-section">' in html
+        assert '<h3 id="32-vcu-s">3.2 VCU-S硬件测试<a class="headerlink" href="#32-vcu-s"' in html
+        ids = re.findall(r'<h[1-6] id="([^"]+)"', html)
+        assert len(ids) == len(set(ids))
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
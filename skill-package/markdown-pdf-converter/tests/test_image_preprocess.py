@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+图片预处理测试
+==============
+
+测试上传前的裁边、缩放和结果缓存
+"""
+
+import io
+import os
+import pytest
+
+Image = pytest.importorskip("PIL.Image")
+
+import image_preprocess
+from image_preprocess import MAX_LONG_EDGE, preprocess_image
+
+
+def write_scan(path, size=(4000, 3000), content=(1000, 1000, 3000, 2000)):
+    """白色背景、中间为噪点内容区域的模拟扫描件"""
+    image = Image.new('RGB', size, 'white')
+    left, top, right, bottom = content
+    noise = Image.frombytes('RGB', (right - left, bottom - top), os.urandom((right - left) * (bottom - top) * 3))
+    image.paste(noise, (left, top))
+    image.save(path, format='PNG')
+    return path
+
+
+def decoded_size(data):
+    with Image.open(io.BytesIO(data)) as image:
+        return image.size
+
+
+class TestPreprocessImage:
+    """图片预处理测试类"""
+
+    def test_long_edge_limited(self, tmp_path):
+        """测试缩放后长边不超过1568像素，体积小于原图"""
+        source = write_scan(tmp_path / "scan.png")
+        data, media_type = preprocess_image(source, crop=False, cache_dir=tmp_path / "cache")
+
+        assert media_type in ('image/png', 'image/jpeg')
+        assert decoded_size(data) == (MAX_LONG_EDGE, 1176)
+        assert len(data) < source.stat().st_size
+
+    def test_margins_cropped(self, tmp_path):
+        """测试裁掉空白边距后再缩放（保留16像素边距）"""
+        source = write_scan(tmp_path / "scan.png")
+        data, _ = preprocess_image(source, cache_dir=tmp_path / "cache")
+
+        width, height = decoded_size(data)
+        assert width == MAX_LONG_EDGE
+        # 裁剪区域为 2032x1032
+        assert height == pytest.approx(MAX_LONG_EDGE * 1032 / 2032, abs=1)
+
+    def test_small_image_not_upscaled(self, tmp_path):
+        """测试小图不放大"""
+        source = write_scan(tmp_path / "small.png", size=(800, 600), content=(0, 0, 800, 600))
+        data, _ = preprocess_image(source, cache_dir=tmp_path / "cache")
+        assert max(decoded_size(data)) <= 800
+
+    def test_cache_hit(self, tmp_path, monkeypatch):
+        """测试相同图片和参数第二次直接读取缓存，不再解码"""
+        source = write_scan(tmp_path / "scan.png")
+        cache_dir = tmp_path / "cache"
+        first = preprocess_image(source, cache_dir=cache_dir)
+        assert len(list(cache_dir.iterdir())) == 1
+
+        def fail_open(*args, **kwargs):
+            raise AssertionError("命中缓存时不应解码图片")
+
+        monkeypatch.setattr(image_preprocess.Image, "open", fail_open)
+        assert preprocess_image(source, cache_dir=cache_dir) == first
+
+        # 参数不同时不复用
+        with pytest.raises(AssertionError):
+            preprocess_image(source, crop=False, cache_dir=cache_dir)
+
+    def test_without_pillow(self, tmp_path, monkeypatch):
+        """测试未安装Pillow时上传原图"""
+        source = write_scan(tmp_path / "scan.png", size=(100, 100), content=(0, 0, 10, 10))
+        monkeypatch.setattr(image_preprocess, "Image", None)
+        assert preprocess_image(source, cache_dir=tmp_path / "cache") == (source.read_bytes(), 'image/png')
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
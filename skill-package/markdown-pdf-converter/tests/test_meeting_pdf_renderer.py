@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+会议纪要PDF直出测试
+==================
+
+渲染 data/ 中的会议YAML，检查输出为有效PDF且包含各章节标题
+"""
+
+import pytest
+import yaml
+from pathlib import Path
+import sys
+
+# 添加scripts到路径
+SKILL_DIR = Path(__file__).parent.parent
+sys.path.insert(0, str(SKILL_DIR / "scripts"))
+
+pytest.importorskip("reportlab")
+pypdf = pytest.importorskip("pypdf")
+
+from meeting_pdf_renderer import main
+
+
+MEETING_INPUTS = sorted((SKILL_DIR / "data").glob("meeting-input-*.yaml"))
+
+HEADINGS = ["1. 会议基本信息", "2. 参会人员", "3. 项目整体状态", "4. 各模块进展汇报"]
+
+
+def run_cli(*args) -> int:
+    """运行命令行入口，返回退出码"""
+    with pytest.raises(SystemExit) as exc_info:
+        main([str(arg) for arg in args])
+    return exc_info.value.code
+
+
+class TestMeetingPDFRenderer:
+    """PDF直出渲染测试类"""
+
+    @pytest.mark.parametrize("input_file", MEETING_INPUTS, ids=lambda path: path.name)
+    def test_render_meeting_input(self, input_file, tmp_path):
+        """测试渲染示例YAML生成有效PDF，包含章节与模块标题"""
+        assert run_cli(input_file, "-o", tmp_path) == 0
+
+        outputs = list(tmp_path.glob("*.pdf"))
+        assert len(outputs) == 1
+        assert outputs[0].read_bytes().startswith(b"%PDF-")
+
+        reader = pypdf.PdfReader(str(outputs[0]))
+        text = "".join(page.extract_text() for page in reader.pages)
+        for heading in HEADINGS:
+            assert heading in text
+
+        with open(input_file, 'r', encoding='utf-8') as f:
+            data = yaml.safe_load(f)
+        compact = "".join(text.split())
+        for module in data.get('modules') or []:
+            assert "".join(str(module['name']).split()) in compact
+
+    def test_output_dir_requires_value(self, tmp_path, capsys):
+        """测试 -o 缺少参数时报用法错误而不是异常"""
+        assert run_cli(MEETING_INPUTS[0], "-o") == 2
+        assert "-o/--output-dir" in capsys.readouterr().err
+
+    def test_failed_input_reported(self, tmp_path, capsys):
+        """测试单个文件失败时继续处理并返回非零退出码"""
+        assert run_cli(tmp_path / "missing.yaml", MEETING_INPUTS[0], "-o", tmp_path) == 1
+        assert "missing.yaml" in capsys.readouterr().err
+        assert len(list(tmp_path.glob("*.pdf"))) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+会议输入校验测试
+================
+
+测试校验错误的字段路径与说明
+"""
+
+import datetime
+import pytest
+from pathlib import Path
+
+from meeting_schema import MeetingSchemaError, meeting_errors, validate_meeting
+from yaml_loader import parse_yaml
+
+DATA_DIR = Path(__file__).parent.parent / "data"
+
+VALID = {'meeting_time': "2025-11-15 14:00-16:00", 'meeting_host': "傅李育"}
+
+
+class TestMeetingErrors:
+    """校验错误路径测试类"""
+
+    @pytest.mark.parametrize("input_file", sorted(DATA_DIR.glob("meeting-input-*.yaml")), ids=lambda p: p.name)
+    def test_sample_inputs_valid(self, input_file):
+        """测试示例输入均合规"""
+        with open(input_file, encoding='utf-8') as f:
+            assert meeting_errors(parse_yaml(f)) == []
+
+    def test_missing_meeting_time(self):
+        """测试缺少必填字段"""
+        assert meeting_errors({'meeting_host': "傅李育"}) == [("meeting_time", "缺少必填字段")]
+        # null 视为未填写
+        assert meeting_errors({**VALID, 'meeting_time': None}) == [("meeting_time", "缺少必填字段")]
+
+    def test_meeting_time_must_be_string(self):
+        """测试未加引号解析为日期的会议时间"""
+        errors = meeting_errors({**VALID, 'meeting_time': datetime.date(2025, 11, 15)})
+        assert errors == [("meeting_time", "应为字符串，实际为日期")]
+
+    def test_managers_wrong_type(self):
+        """测试参会人员分组不是列表"""
+        errors = meeting_errors({**VALID, 'attendees': {'managers': {'name': "周庭梁"}}})
+        assert errors == [("attendees.managers", "应为列表，实际为映射")]
+
+    def test_nested_person_path(self):
+        """测试列表元素的路径带下标"""
+        errors = meeting_errors({**VALID, 'attendees': {'managers': [{'name': "周庭梁"}, {'role': "项目管理"}]}})
+        assert errors == [("attendees.managers[1].name", "缺少必填字段")]
+
+    def test_bool_int_mismatch(self):
+        """测试布尔值与整数不互相接受（bool 是 int 的子类）"""
+        errors = meeting_errors({**VALID, 'attendees': {'hosts': [
+            {'name': "傅李育", 'employee_id': True, 'present': 1},
+        ]}})
+        assert errors == [
+            ("attendees.hosts[0].employee_id", "应为字符串/整数/数字/日期，实际为布尔值"),
+            ("attendees.hosts[0].present", "应为布尔值，实际为整数"),
+        ]
+
+    def test_all_errors_reported(self):
+        """测试一次报告全部错误"""
+        with pytest.raises(MeetingSchemaError) as info:
+            validate_meeting({'meeting_host': True, 'modules': [{'name': "VCU-S软件"}]}, "bad.yaml")
+
+        assert info.value.source == "bad.yaml"
+        assert [path for path, _ in info.value.errors] == ["meeting_time", "meeting_host", "modules[0].section"]
+        assert str(info.value).startswith("会议配置校验失败 (bad.yaml): 3 处错误")
+        assert "  - modules[0].section: 缺少必填字段" in str(info.value)
+
+    def test_root_not_mapping(self):
+        """测试根节点不是映射"""
+        with pytest.raises(MeetingSchemaError, match="<根>: 应为映射，实际为列表"):
+            validate_meeting([])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+本地识别后端测试
+================
+
+测试识别行解析、表格行归并，以及本地优先、远程补充的参会人员识别
+"""
+
+import json
+import threading
+from types import SimpleNamespace
+import pytest
+
+from ocr_backends import AttendeeBackend, AttendeeRow, group_rows, parse_attendee_row
+
+
+class TestParseAttendeeRow:
+    """识别行解析测试类"""
+
+    def test_name_first(self):
+        """测试 姓名/工号/职责/模块 顺序的行，姓名字间空格被去掉"""
+        assert parse_attendee_row("傅 李 育\t61349\t项目经理\t整体协调") == {
+            'name': "傅李育", 'employee_id': "61349", 'present': True,
+            'role': "项目经理", 'module': "整体协调",
+        }
+
+    def test_role_first(self):
+        """测试职责列在姓名前面时按与工号的位置选择姓名"""
+        assert parse_attendee_row("项目经理\t张三\t61349") == {
+            'name': "张三", 'employee_id': "61349", 'present': True, 'role': "项目经理",
+        }
+
+    def test_name_after_id(self):
+        """测试工号在前时取相邻的后一列"""
+        assert parse_attendee_row("61349\t张三\t项目经理")['name'] == "张三"
+
+    def test_header_row(self):
+        """测试表头行被跳过"""
+        assert parse_attendee_row("姓名\t工号\t职责\t出席") is None
+
+    def test_absent_row(self):
+        """测试缺席标记"""
+        attendee = parse_attendee_row("周庭梁\t60136\t项目管理\t缺席")
+        assert attendee == {
+            'name': "周庭梁", 'employee_id': "60136", 'present': False, 'role': "项目管理",
+        }
+
+    def test_without_employee_id(self):
+        """测试没有工号时取第一个姓名"""
+        assert parse_attendee_row("王五\t测试")['name'] == "王五"
+
+    def test_unrecognized(self):
+        """测试没有姓名也没有工号的行"""
+        assert parse_attendee_row("第 1 页") is None
+        assert parse_attendee_row("   ") is None
+
+
+class TestGroupRows:
+    """表格行归并测试类"""
+
+    WORDS = [
+        # 表头
+        ("姓名", (10, 10, 50, 30)), ("工号", (120, 12, 160, 30)), ("出席", (240, 10, 280, 30)),
+        # 第一行：姓名被拆成逐字的单词，列的上下位置略有偏差
+        ("傅", (10, 50, 28, 70)), ("李", (30, 50, 48, 70)), ("育", (50, 51, 68, 71)),
+        ("61349", (120, 53, 170, 69)), ("出席", (240, 50, 280, 70)),
+        # 第二行：缺席
+        ("周庭梁", (10, 90, 64, 110)), ("60136", (120, 92, 170, 108)), ("缺席", (240, 90, 280, 110)),
+    ]
+
+    def test_rows(self):
+        """测试按垂直位置归并为行，列之间以制表符分隔"""
+        rows = group_rows(list(reversed(self.WORDS)))
+
+        assert [text for text, _ in rows] == [
+            "姓名\t工号\t出席",
+            "傅 李 育\t61349\t出席",
+            "周庭梁\t60136\t缺席",
+        ]
+        assert rows[1][1] == (10, 50, 280, 71)
+
+    def test_parsed(self):
+        """测试归并后的行解析结果"""
+        attendees = [parse_attendee_row(text) for text, _ in group_rows(self.WORDS)]
+        assert attendees == [
+            None,
+            {'name': "傅李育", 'employee_id': "61349", 'present': True},
+            {'name': "周庭梁", 'employee_id': "60136", 'present': False},
+        ]
+
+
+class StubBackend(AttendeeBackend):
+    """返回固定识别行的本地后端"""
+
+    name = 'stub'
+
+    def __init__(self, rows):
+        self.rows = rows
+
+    def available(self):
+        return True
+
+    def extract_rows(self, image_path):
+        return self.rows
+
+
+class RecordingClient:
+    """记录请求内容的远程模型替身"""
+
+    def __init__(self, attendees):
+        self.messages = self
+        self.attendees = attendees
+        self.requests = []
+
+    async def create(self, model, max_tokens, messages):
+        self.requests.append(messages[0]['content'])
+        text = json.dumps({'attendees': self.attendees}, ensure_ascii=False)
+        return SimpleNamespace(content=[SimpleNamespace(text=text)])
+
+
+def row(text, top):
+    return AttendeeRow(text, (0, top, 300, top + 20), parse_attendee_row(text))
+
+
+REMOTE = [{'name': "欧阳新", 'employee_id': "70001", 'present': True}]
+
+
+class TestLocalFirst:
+    """本地优先识别测试类"""
+
+    @pytest.fixture
+    def image(self, tmp_path):
+        Image = pytest.importorskip("PIL.Image")
+        path = tmp_path / "attendees.png"
+        Image.new('RGB', (300, 200), 'white').save(path)
+        return path
+
+    @pytest.fixture
+    def make_extractor(self, ocr_module, skill_dir):
+        def make(rows, client, backend='auto'):
+            return ocr_module.MeetingImageExtractor(
+                skill_dir, client=client, backend=backend, local_backend=StubBackend(rows),
+                use_cache=False, preprocess=False
+            )
+        return make
+
+    @pytest.mark.asyncio
+    async def test_all_resolved_locally(self, make_extractor, image):
+        """测试所有行都能对应参会人员索引时不调用远程模型"""
+        client = RecordingClient(REMOTE)
+        extractor = make_extractor([row("姓名\t工号", 0), row("傅李育\t61349", 30)], client)
+
+        attendees = await extractor.extract_attendees_from_image_async(str(image))
+
+        assert attendees == [{'name': "傅李育", 'employee_id': "61349", 'present': True}]
+        assert client.requests == []
+
+    @pytest.mark.asyncio
+    async def test_pending_rows_sent_to_remote(self, make_extractor, image):
+        """测试无法对应的行截取后交给远程模型，结果与本地结果合并"""
+        client = RecordingClient(REMOTE)
+        extractor = make_extractor([row("傅李育\t61349", 30), row("欧阳 亲\t7000l", 60)], client)
+
+        attendees = await extractor.extract_attendees_from_image_async(str(image))
+
+        assert attendees == [{'name': "傅李育", 'employee_id': "61349", 'present': True}] + REMOTE
+        assert len(client.requests) == 1
+        source = client.requests[0][0]['source']
+        assert source['media_type'] == 'image/png'
+
+    @pytest.mark.asyncio
+    async def test_crop_off_loop(self, make_extractor, image, ocr_module, monkeypatch):
+        """测试截取待识别行在线程中执行，不阻塞事件循环"""
+        threads = []
+        crop_rows = ocr_module.crop_rows
+
+        def recording_crop(image_path, boxes):
+            threads.append(threading.current_thread())
+            return crop_rows(image_path, boxes)
+
+        monkeypatch.setattr(ocr_module, "crop_rows", recording_crop)
+        extractor = make_extractor([row("欧阳 亲\t7000l", 60)], RecordingClient(REMOTE))
+
+        assert await extractor.extract_attendees_from_image_async(str(image)) == REMOTE
+        assert threads and threads[0] is not threading.main_thread()
+
+    @pytest.mark.asyncio
+    async def test_nothing_parsed_falls_back(self, make_extractor, image):
+        """测试本地什么都没识别出来时整张图片交给远程模型"""
+        client = RecordingClient(REMOTE)
+        extractor = make_extractor([row("第 1 页", 0)], client)
+
+        assert await extractor.extract_attendees_from_image_async(str(image)) == REMOTE
+        assert len(client.requests) == 1
+
+    @pytest.mark.asyncio
+    async def test_local_only(self, make_extractor, image):
+        """测试离线模式只返回本地识别结果"""
+        extractor = make_extractor([row("傅李育\t61349", 30), row("欧阳亲\t70009", 60)], None, backend='local')
+
+        attendees = await extractor.extract_attendees_from_image_async(str(image))
+        assert [attendee['name'] for attendee in attendees] == ["傅李育", "欧阳亲"]
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+OCR会议提取器测试
+================
+
+测试进程内生成会议纪要，以及可替换客户端下的并发调用、超时与重试
+"""
+
+import asyncio
+import json
+import subprocess
+import time
+import types
+from types import SimpleNamespace
+import pytest
+from pathlib import Path
+import sys
+
+from meeting_schema import MeetingSchemaError
+
+
+class StubGenerator:
+    """记录渲染调用的会议纪要生成器替身"""
+
+    def __init__(self, content="# 会议纪要\n", error=None):
+        self.content = content
+        self.error = error
+        self.rendered = []
+
+    def render(self, config_data):
+        self.rendered.append(config_data)
+        if self.error is not None:
+            raise self.error
+        return self.content
+
+    def default_output_path(self, config_data):
+        return Path(f"minutes-{config_data['meeting_time'][:10]}.md")
+
+
+@pytest.fixture
+def extractor(ocr_module, skill_dir, tmp_path, monkeypatch):
+    """不连接远程模型、使用生成器替身的提取器"""
+    monkeypatch.chdir(tmp_path)
+
+    def no_subprocess(*args, **kwargs):
+        raise AssertionError("不应启动子进程")
+
+    monkeypatch.setattr(subprocess, "run", no_subprocess)
+    monkeypatch.setattr(subprocess, "Popen", no_subprocess)
+
+    extractor = ocr_module.MeetingImageExtractor(
+        skill_dir, client=object(), backend='remote', use_cache=False
+    )
+    extractor.generator = StubGenerator()
+    return extractor
+
+
+CONFIG = {'meeting_time': "2025-11-15 14:00-16:00", 'meeting_host': "傅李育"}
+
+
+class TestGenerateMinutes:
+    """进程内生成会议纪要测试类"""
+
+    def test_markdown_written(self, extractor, tmp_path):
+        """测试配置字典直接渲染并写出Markdown"""
+        result = extractor.generate_minutes(dict(CONFIG), {}, generate_pdf=False)
+
+        assert extractor.generator.rendered == [CONFIG]
+        assert result == {'markdown_path': str(tmp_path / "minutes-2025-11-15.md")}
+        assert Path(result['markdown_path']).read_text(encoding='utf-8') == "# 会议纪要\n"
+
+    def test_pdf_from_memory(self, extractor, tmp_path, monkeypatch):
+        """测试Markdown文本直接交给PDF转换，不从磁盘重新读取"""
+        calls = []
+
+        def convert_markdown_content_to_pdf(markdown_content, pdf_path, theme, auto_open):
+            calls.append((markdown_content, pdf_path, theme, auto_open))
+            return pdf_path
+
+        fake = types.ModuleType("pdf_converter")
+        fake.convert_markdown_content_to_pdf = convert_markdown_content_to_pdf
+        monkeypatch.setitem(sys.modules, "pdf_converter", fake)
+
+        result = extractor.generate_minutes(dict(CONFIG), {}, generate_pdf=True, auto_open=False)
+
+        pdf_path = tmp_path / "minutes-2025-11-15.pdf"
+        assert calls == [("# 会议纪要\n", pdf_path, 'enterprise', False)]
+        assert result['pdf_path'] == str(pdf_path)
+
+    def test_schema_errors_reported(self, extractor, tmp_path):
+        """测试配置未通过校验时记录错误字段且不写文件"""
+        extractor.generator = StubGenerator(
+            error=MeetingSchemaError([("meeting_time", "缺少必填字段")])
+        )
+        result = extractor.generate_minutes({}, {'config_path': "x.yaml"}, generate_pdf=True)
+
+        assert result == {'config_path': "x.yaml", 'config_errors': ["meeting_time: 缺少必填字段"]}
+        assert list(tmp_path.glob("*.md")) == []
+
+    def test_render_failure(self, extractor, tmp_path):
+        """测试渲染失败时返回已有结果，不生成PDF"""
+        extractor.generator = StubGenerator(error=RuntimeError("模板错误"))
+        result = extractor.generate_minutes(dict(CONFIG), {}, generate_pdf=True)
+
+        assert result == {}
+        assert list(tmp_path.glob("*.md")) == []
+
+
+
+# 替换 asyncio.sleep 之前保留原函数，桩服务用它模拟响应延迟
+real_sleep = asyncio.sleep
+
+ATTENDEES = {'attendees': [{'name': "傅李育", 'employee_id': "61349", 'present': True}]}
+CONTENT = {'meeting_info': {'meeting_time': "2025-11-15 14:00-16:00"}, 'modules': []}
+
+
+class StubAPIError(Exception):
+    """带HTTP状态码的接口错误（与 ``anthropic.APIStatusError`` 一样提供 status_code）"""
+
+    def __init__(self, status_code):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+
+
+class StubClient:
+    """本地桩服务：与 ``anthropic.AsyncAnthropic`` 相同的 ``messages.create`` 接口
+
+    Args:
+        delay: 每次调用的响应延迟（秒）
+        failures: 前几次调用抛出异常
+        error: 失败时抛出的异常，默认为服务暂不可用(503)
+    """
+
+    def __init__(self, delay=0.0, failures=0, error=None):
+        self.messages = self
+        self.delay = delay
+        self.failures = failures
+        self.error = error or StubAPIError(503)
+        self.calls = 0
+
+    async def create(self, model, max_tokens, messages):
+        self.calls += 1
+        await real_sleep(self.delay)
+        if self.calls <= self.failures:
+            raise self.error
+        # 图片请求的内容是内容块列表，文本解析请求是字符串
+        data = ATTENDEES if isinstance(messages[0]['content'], list) else CONTENT
+        return SimpleNamespace(content=[SimpleNamespace(text=f"```json\n{json.dumps(data)}\n```")])
+
+
+@pytest.fixture
+def backoff(monkeypatch):
+    """记录重试退避时长而不真正等待"""
+    delays = []
+
+    async def fake_sleep(delay, result=None):
+        delays.append(delay)
+        await real_sleep(0)
+        return result
+
+    monkeypatch.setattr(asyncio, "sleep", fake_sleep)
+    return delays
+
+
+@pytest.fixture
+def make_extractor(ocr_module, skill_dir):
+    """创建使用桩客户端的提取器"""
+    def make(client, **kwargs):
+        return ocr_module.MeetingImageExtractor(
+            skill_dir, client=client, backend='remote', use_cache=False, preprocess=False, **kwargs
+        )
+    return make
+
+
+class TestPluggableClient:
+    """可替换客户端测试类"""
+
+    @pytest.mark.asyncio
+    async def test_dual_input_concurrent(self, make_extractor, tmp_path):
+        """测试图片识别与文本解析两次调用并发执行"""
+        image = tmp_path / "attendees.png"
+        image.write_bytes(b"\x89PNG\r\n\x1a\n")
+        client = StubClient(delay=0.5)
+        extractor = make_extractor(client)
+
+        start = time.perf_counter()
+        attendees, content = await extractor.extract_dual_input_async(str(image), "会议内容")
+        elapsed = time.perf_counter() - start
+
+        assert client.calls == 2
+        assert elapsed < 0.9
+        assert attendees == ATTENDEES['attendees']
+        assert content == CONTENT
+
+    @pytest.mark.asyncio
+    async def test_image_encoding_off_loop(self, make_extractor, tmp_path):
+        """测试图片预处理在线程中执行，文本解析请求不必等待图片解码"""
+        image = tmp_path / "attendees.png"
+        image.write_bytes(b"\x89PNG\r\n\x1a\n")
+        client = StubClient()
+        extractor = make_extractor(client)
+        encode_image = extractor._encode_image
+        requested = []
+
+        def slow_encode(image_path):
+            time.sleep(0.3)
+            return encode_image(image_path)
+
+        async def create(model, max_tokens, messages):
+            requested.append(time.perf_counter())
+            return await StubClient.create(client, model, max_tokens, messages)
+
+        extractor._encode_image = slow_encode
+        client.create = create
+
+        start = time.perf_counter()
+        await extractor.extract_dual_input_async(str(image), "会议内容")
+
+        # 文本请求立即发出，图片请求在预处理完成后发出
+        assert requested[0] - start < 0.2
+        assert requested[1] - start >= 0.3
+
+    @pytest.mark.asyncio
+    async def test_timeout_retried(self, make_extractor, backoff):
+        """测试每次调用按配置超时，重试max_retries次后抛出超时"""
+        client = StubClient(delay=1.0)
+        extractor = make_extractor(client, timeout=0.05, max_retries=2)
+
+        start = time.perf_counter()
+        with pytest.raises(asyncio.TimeoutError):
+            await extractor._create_message("会议内容", max_tokens=16)
+
+        assert client.calls == 3
+        assert backoff == [1, 2]
+        assert time.perf_counter() - start < 0.5
+
+    @pytest.mark.asyncio
+    async def test_failure_retried(self, make_extractor, backoff):
+        """测试服务端错误后指数退避重试并返回成功结果"""
+        client = StubClient(failures=2)
+        extractor = make_extractor(client, max_retries=2)
+
+        text = await extractor._create_message("会议内容", max_tokens=16)
+
+        assert extractor._extract_json(text) == CONTENT
+        assert client.calls == 3
+        assert backoff == [1, 2]
+
+    @pytest.mark.asyncio
+    async def test_no_retries(self, make_extractor, backoff):
+        """测试max_retries=0时失败立即抛出"""
+        client = StubClient(failures=1)
+        extractor = make_extractor(client, max_retries=0)
+
+        with pytest.raises(StubAPIError, match="503"):
+            await extractor._create_message("会议内容", max_tokens=16)
+        assert client.calls == 1
+        assert backoff == []
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("error", [
+        StubAPIError(401), StubAPIError(400), TypeError("客户端配置错误"),
+    ], ids=["auth", "bad-request", "client-error"])
+    async def test_non_retryable_raised_immediately(self, make_extractor, backoff, error):
+        """测试重试也不会成功的错误立即抛出，不等待也不重复调用"""
+        client = StubClient(failures=1, error=error)
+        extractor = make_extractor(client, max_retries=2)
+
+        with pytest.raises(type(error)):
+            await extractor._create_message("会议内容", max_tokens=16)
+        assert client.calls == 1
+        assert backoff == []
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_retried(self, make_extractor, backoff):
+        """测试限流(429)和连接错误会重试"""
+        client = StubClient(failures=1, error=StubAPIError(429))
+        assert await make_extractor(client, max_retries=1)._create_message("会议内容", max_tokens=16)
+        client = StubClient(failures=1, error=ConnectionResetError())
+        assert await make_extractor(client, max_retries=1)._create_message("会议内容", max_tokens=16)
+        assert backoff == [1, 1]
+
+
+LIB_DIR = Path(__file__).parent.parent / "lib"
+
+
+class TestPdfAfterExtraction:
+    """识别后生成PDF测试类（只替换浏览器打印步骤）"""
+
+    @pytest.fixture
+    def printed(self, monkeypatch):
+        """用写出PDF文件头的替身代替Chromium打印"""
+        monkeypatch.syspath_prepend(str(LIB_DIR))
+        monkeypatch.delitem(sys.modules, "pdf_converter", raising=False)
+        monkeypatch.delitem(sys.modules, "pdf_converter.converter", raising=False)
+        from pdf_converter import converter
+
+        printed = []
+
+        async def convert_html_to_pdf(html_content, output_path):
+            printed.append(html_content)
+            Path(output_path).write_bytes(b"%PDF-1.4\n")
+
+        monkeypatch.setattr(converter, "_convert_html_to_pdf", convert_html_to_pdf)
+        return printed
+
+    @pytest.fixture
+    def pdf_extractor(self, make_extractor, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        extractor = make_extractor(StubClient())
+        extractor.lib_dir = LIB_DIR
+        image = tmp_path / "meeting.png"
+        image.write_bytes(b"\x89PNG\r\n\x1a\n")
+        return extractor, image
+
+    def test_dual_input_pdf(self, pdf_extractor, printed, tmp_path):
+        """测试双输入模式在 asyncio.run 之后仍能生成PDF"""
+        extractor, image = pdf_extractor
+        result = extractor.process_dual_input(
+            str(image), "会议内容", output_path=str(tmp_path / "config.yaml"),
+            generate_pdf=True, auto_open=False
+        )
+
+        assert result['pdf_path'] == str(Path(result['markdown_path']).with_suffix('.pdf'))
+        assert Path(result['pdf_path']).read_bytes().startswith(b"%PDF-")
+        assert len(printed) == 1 and "傅李育" in printed[0]
+
+    def test_image_pdf(self, pdf_extractor, printed, tmp_path):
+        """测试单图片模式生成PDF"""
+        extractor, image = pdf_extractor
+        result = extractor.process_image(
+            str(image), output_path=str(tmp_path / "config.yaml"), generate_pdf=True, auto_open=False
+        )
+
+        assert Path(result['pdf_path']).exists()
+        assert len(printed) == 1
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
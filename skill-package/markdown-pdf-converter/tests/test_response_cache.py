@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+模型响应缓存测试
+================
+
+测试缓存键、有效期和按最近使用时间的大小淘汰
+"""
+
+import os
+import time
+import pytest
+
+from response_cache import ResponseCache
+
+
+def make_key(payload="图片数据", prompt="提取参会人员", version="1", model="model-a"):
+    return ResponseCache.make_key(payload, prompt, version, model)
+
+
+class TestCacheKey:
+    """缓存键测试类"""
+
+    def test_stable(self):
+        """测试相同输入得到相同的键"""
+        assert make_key() == make_key()
+
+    @pytest.mark.parametrize("changed", [
+        {'payload': "另一张图片"},
+        {'prompt': "提取参会人员和工号"},
+        {'version': "2"},
+        {'model': "model-b"},
+    ])
+    def test_changes_with_inputs(self, changed):
+        """测试内容、提示词、提示词版本或模型变化时键随之变化"""
+        assert make_key(**changed) != make_key()
+
+    def test_parts_not_concatenated(self):
+        """测试各部分有分隔，拼接相同的不同输入不会冲突"""
+        assert make_key(payload="ab", prompt="c") != make_key(payload="b", prompt="ca")
+
+
+class TestResponseCache:
+    """缓存读写测试类"""
+
+    def test_roundtrip(self, tmp_path):
+        """测试写入后命中"""
+        cache = ResponseCache(tmp_path)
+        key = make_key()
+        assert cache.get(key) is None
+
+        cache.put(key, {'attendees': [{'name': "傅李育"}]})
+        assert cache.get(key) == {'attendees': [{'name': "傅李育"}]}
+
+    def test_ttl_expiry(self, tmp_path, monkeypatch):
+        """测试超过有效期的条目不再命中并被删除"""
+        cache = ResponseCache(tmp_path, ttl_seconds=60)
+        key = make_key()
+        cache.put(key, {'ok': True})
+
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 59)
+        assert cache.get(key) == {'ok': True}
+
+        monkeypatch.setattr(time, "time", lambda: now + 61)
+        assert cache.get(key) is None
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_lru_eviction(self, tmp_path):
+        """测试超出大小上限时淘汰最久未使用的条目"""
+        cache = ResponseCache(tmp_path)
+        keys = [make_key(payload=str(i)) for i in range(3)]
+        for key in keys:
+            cache.put(key, {'text': "x" * 100})
+        entry_size = cache._entry_path(keys[0]).stat().st_size
+
+        # 条目按 0、1、2 的顺序写入，之后读取0号，1号成为最久未使用
+        now = time.time()
+        for age, key in zip((300, 200, 100), keys):
+            os.utime(cache._entry_path(key), (now - age, now - age))
+        assert cache.get(keys[0]) is not None
+
+        # 时间戳长度不同，条目大小可能相差几个字节，留出半个条目的余量
+        cache.max_bytes = entry_size * 3 + entry_size // 2
+        cache.put(make_key(payload="3"), {'text': "x" * 100})
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+        assert len(list(tmp_path.glob("*.json"))) == 3
+
+    def test_corrupt_entry_ignored(self, tmp_path):
+        """测试损坏的缓存文件视为未命中"""
+        cache = ResponseCache(tmp_path)
+        key = make_key()
+        cache._entry_path(key).write_text("{", encoding='utf-8')
+        assert cache.get(key) is None
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+YAML加载测试
+============
+
+测试进程内缓存命中、修改时间失效和JSON快照读写
+"""
+
+import datetime
+import json
+import os
+import pytest
+
+import yaml_loader
+from yaml_loader import clear_cache, load_yaml
+
+
+DOCUMENT = """\
+meeting_time: "2025-11-15 14:00-16:00"
+meeting_date: 2025-11-15
+created: 2025-11-15 14:00:00
+attendees:
+  hosts:
+    - name: "傅李育"
+      present: true
+"""
+
+
+@pytest.fixture(autouse=True)
+def empty_memo():
+    clear_cache()
+    yield
+    clear_cache()
+
+
+@pytest.fixture
+def document(tmp_path):
+    path = tmp_path / "meeting.yaml"
+    path.write_text(DOCUMENT, encoding='utf-8')
+    return path
+
+
+@pytest.fixture
+def parse_calls(monkeypatch):
+    """记录实际解析YAML的次数"""
+    calls = []
+    parse_yaml = yaml_loader.parse_yaml
+
+    def counting_parse(stream):
+        calls.append(stream)
+        return parse_yaml(stream)
+
+    monkeypatch.setattr(yaml_loader, "parse_yaml", counting_parse)
+    return calls
+
+
+def touch(path, text):
+    """写入新内容并确保修改时间变化"""
+    stat = path.stat()
+    path.write_text(text, encoding='utf-8')
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+
+class TestMemo:
+    """进程内缓存测试类"""
+
+    def test_memo_hit(self, document, parse_calls):
+        """测试文件未修改时返回同一个（只读）解析结果，不重新解析"""
+        first = load_yaml(document)
+        assert load_yaml(document) is first
+        assert len(parse_calls) == 1
+        assert first['meeting_date'] == datetime.date(2025, 11, 15)
+
+    def test_mtime_invalidation(self, document, parse_calls):
+        """测试文件修改后重新解析"""
+        load_yaml(document)
+        touch(document, DOCUMENT.replace("傅李育", "周庭梁"))
+
+        assert load_yaml(document)['attendees']['hosts'][0]['name'] == "周庭梁"
+        assert len(parse_calls) == 2
+
+
+class TestSnapshot:
+    """JSON快照测试类"""
+
+    def test_roundtrip(self, document, tmp_path, parse_calls):
+        """测试新进程读取快照即可得到相同结果（含日期类型）"""
+        snapshot_dir = tmp_path / "snapshots"
+        data = load_yaml(document, snapshot_dir)
+
+        snapshots = list(snapshot_dir.iterdir())
+        assert [path.suffix for path in snapshots] == [".json"]
+        json.loads(snapshots[0].read_text(encoding='utf-8'))
+
+        clear_cache()  # 模拟新进程
+        assert load_yaml(document, snapshot_dir) == data
+        assert isinstance(load_yaml(document, snapshot_dir)['created'], datetime.datetime)
+        assert len(parse_calls) == 1
+
+    def test_stale_snapshot_ignored(self, document, tmp_path, parse_calls):
+        """测试文件修改后不使用旧快照"""
+        snapshot_dir = tmp_path / "snapshots"
+        load_yaml(document, snapshot_dir)
+        touch(document, DOCUMENT.replace("true", "false"))
+        clear_cache()
+
+        assert load_yaml(document, snapshot_dir)['attendees']['hosts'][0]['present'] is False
+        assert len(parse_calls) == 2
+
+    def test_corrupt_snapshot(self, document, tmp_path):
+        """测试快照损坏时重新解析"""
+        snapshot_dir = tmp_path / "snapshots"
+        load_yaml(document, snapshot_dir)
+        for path in snapshot_dir.iterdir():
+            path.write_text("{", encoding='utf-8')
+        clear_cache()
+
+        assert load_yaml(document, snapshot_dir)['meeting_time'] == "2025-11-15 14:00-16:00"
+
+    def test_unsupported_values_not_snapshotted(self, tmp_path):
+        """测试JSON无法无损表示的数据（如数字键）不写快照"""
+        path = tmp_path / "numbers.yaml"
+        path.write_text("1: one\n2: two\n", encoding='utf-8')
+        snapshot_dir = tmp_path / "snapshots"
+
+        assert load_yaml(path, snapshot_dir) == {1: "one", 2: "two"}
+        assert not snapshot_dir.exists()
+
+
+class TestGeneratorCallers:
+    """生成器调用方测试类"""
+
+    def test_snapshots_off_by_default(self, skill_dir):
+        """测试生成器默认不写快照"""
+        from generate_meeting import MeetingMinutesGenerator
+
+        generator = MeetingMinutesGenerator(skill_dir)
+        generator.load_default_attendees()
+        assert generator.snapshot_dir is None
+        assert not (skill_dir / ".cache" / "yaml").exists()
+
+    def test_cached_data_not_mutated(self, skill_dir):
+        """测试合并默认参会人员不修改缓存的解析结果"""
+        from generate_meeting import MeetingMinutesGenerator
+
+        generator = MeetingMinutesGenerator(skill_dir)
+        config = {'meeting_time': "2025-11-15 14:00-16:00", 'meeting_host': "傅李育"}
+        merged = generator.merge_attendees(config)
+
+        assert 'attendees' not in config
+        assert all(person['present'] for person in merged['attendees']['managers'])
+        roster = load_yaml(skill_dir / "data" / "attendees.yaml")
+        assert all('present' not in person for person in roster['managers'])
+
+
+if __name__ == "__main__":
+    pytest.main([__file__, "-v"])